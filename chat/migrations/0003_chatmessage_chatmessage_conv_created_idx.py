@@ -0,0 +1,19 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:38
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('chat', '0002_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='chatmessage',
+            index=models.Index(condition=models.Q(('is_removed', False)), fields=['conversation', '-created'], name='chatmessage_conv_created_idx'),
+        ),
+    ]
@@ -156,6 +156,12 @@ class ChatMessage(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         verbose_name_plural = "Chat Messages"
         db_table = "ChatMessage"
         ordering = ['-created']
+        indexes = [
+            models.Index(
+                fields=['conversation', '-created'], name='chatmessage_conv_created_idx',
+                condition=models.Q(is_removed=False)
+            ),
+        ]
 
 
 @receiver(post_save, sender=ChatMessage)
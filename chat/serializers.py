@@ -237,7 +237,9 @@ class ChatUserSerializer(serializers.ModelSerializer):
             context = {
                 'id': str(image.id),
                 'title': image.title,
-                'path': str(image.file_path) if image.title == "profile image" else image.file_path.url,
+                'path': str(image.file_path) if image.title == "profile image" else image.get_variant_url(
+                    'thumbnail_webp'
+                ),
                 'type': image.media_type
             }
             return context
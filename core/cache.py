@@ -0,0 +1,92 @@
+import hashlib
+from datetime import date
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.db import transaction
+
+from rest_framework import response, status
+
+
+def version_key(namespace, key=""):
+    """
+    Return the cache key that stores the current version of a `namespace` (and optional `key` inside it).
+    Example:- version:job-detail:3f0c6e3a-...
+    """
+    return 'version:{0}:{1}'.format(namespace, key)
+
+
+def get_cache_version(namespace, key=""):
+    """
+    Return the current version number for a namespace/key pair.
+
+    The version is created lazily, so the first read of an unknown key starts it at 1. Cached payloads embed this
+    number in their own key, which means bumping the version makes every older payload unreachable without having
+    to know or delete them.
+    """
+    cache_key = version_key(namespace, key)
+    version = cache.get(cache_key)
+    if version is None:
+        cache.add(cache_key, 1, None)
+        version = cache.get(cache_key, 1)
+    return version
+
+
+def bump_cache_version(namespace, key=""):
+    """
+    Increase the version number for a namespace/key pair.
+
+    The bump is deferred until the surrounding transaction commits (`ATOMIC_REQUESTS` wraps every view), so a
+    concurrent request can not re-cache the old rows under the new version.
+    """
+    def bump():
+        cache_key = version_key(namespace, key)
+        try:
+            cache.incr(cache_key)
+        except ValueError:
+            cache.set(cache_key, 2, None)
+
+    transaction.on_commit(bump)
+
+
+class AnonymousListCacheMixin:
+    """
+    Mixin for public list views that caches the whole response of anonymous requests.
+
+    The cache key is built from the canonical form of the query parameters (keys and values sorted, pagination
+    defaults applied) together with the generation of `cache_namespace`, so bumping that generation with
+    `bump_cache_version(cache_namespace)` drops every cached page at once. Authenticated requests always hit the
+    database because their responses contain per-user fields.
+
+    Attributes:
+        - `cache_namespace (str)`: Namespace of the generation counter used for the cached responses.
+        - `cache_timeout (int)`: Number of seconds a response is cached.
+    """
+    cache_namespace = None
+    cache_timeout = 60
+
+    def get(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().get(request, *args, **kwargs)
+        cache_key = self.get_list_cache_key(request)
+        data = cache.get(cache_key)
+        if data is not None:
+            return response.Response(data)
+        list_response = super().get(request, *args, **kwargs)
+        if list_response.status_code == status.HTTP_200_OK:
+            cache.set(cache_key, list_response.data, self.cache_timeout)
+        return list_response
+
+    def get_list_cache_key(self, request):
+        params = {key: sorted(values) for key, values in request.GET.lists()}
+        if self.pagination_class:
+            paginator = self.paginator
+            params.setdefault(paginator.page_query_param, ['1'])
+            if paginator.page_size_query_param:
+                params[paginator.page_size_query_param] = [str(paginator.get_page_size(request))]
+        canonical = urlencode(sorted(params.items()), doseq=True)
+        # Filters like `filter_by=active` compare with today's date, so a day change must not reuse old pages.
+        digest = hashlib.sha1(
+            '{0}|{1}|{2}'.format(request.get_host(), date.today(), canonical).encode()
+        ).hexdigest()
+        return '{0}:{1}:{2}'.format(self.cache_namespace, get_cache_version(self.cache_namespace), digest)
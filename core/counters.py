@@ -0,0 +1,71 @@
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.db import connections
+
+from koor.config.common import Common
+
+logger = logging.getLogger(__name__)
+
+
+class CounterBuffer:
+    """
+    Aggregates counter increments in the memory of the current process and writes them in the background.
+
+    `add()` only touches a dictionary, so a tracked hit costs no database write in the request. A daemon thread,
+    started by the first increment, hands the aggregated increments to `flush_callback` every `interval` seconds;
+    the callback is expected to write them as relative `F()` updates, so concurrent processes flushing the same key
+    can not overwrite each other. The remaining increments are also flushed when the process exits, and a failed
+    flush puts its increments back into the buffer for the next run.
+
+    Attributes:
+        - `flush_callback (callable)`: Called with a `Counter` of `{key: increment}` to persist.
+        - `interval (int)`: Number of seconds between two flushes.
+    """
+
+    def __init__(self, flush_callback, interval=None):
+        self.flush_callback = flush_callback
+        self.interval = interval or Common.COUNTER_FLUSH_INTERVAL
+        self.pending = Counter()
+        self.lock = threading.Lock()
+        self.thread = None
+        # Registered once per buffer, forked workers inherit the registration together with the buffer.
+        atexit.register(self.flush)
+
+    def add(self, key, amount=1):
+        """
+        Buffer an increment of `amount` for `key`.
+        """
+        with self.lock:
+            self.pending[key] += amount
+            if self.thread is None or not self.thread.is_alive():
+                # A forked worker inherits the buffer but not the thread, so the check is repeated on every add.
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+
+    def run(self):
+        while True:
+            time.sleep(self.interval)
+            self.flush()
+
+    def flush(self):
+        """
+        Write the buffered increments now.
+        """
+        with self.lock:
+            pending, self.pending = self.pending, Counter()
+        if not pending:
+            return
+        try:
+            self.flush_callback(pending)
+        except Exception:
+            logger.exception('Flushing %s counters failed, retrying with the next flush', len(pending))
+            with self.lock:
+                self.pending.update(pending)
+        finally:
+            # The connections opened by the flush belong to the calling thread only.
+            if threading.current_thread() is self.thread:
+                connections.close_all()
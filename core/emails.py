@@ -1,6 +1,8 @@
 import logging
+import threading
 
 from django.core import mail
+from django.db import connections, transaction
 from django.core.mail.backends.smtp import EmailBackend
 from django.template.loader import get_template
 
@@ -9,6 +11,25 @@ from koor.config.common import Common
 from superadmin.models import SMTPSetting, InvoiceIcon
 
 
+def get_email_defaults():
+    """
+    Return the latest `SMTPSetting` and the footer variables shared by every email template.
+    """
+    smtp_setting = SMTPSetting.objects.last()
+    icons = {'x': "", 'youtube': "", 'instagram': "", 'linkedin': "", 'facebook': ""}
+    for invoice_data in InvoiceIcon.objects.all():
+        if invoice_data.type in icons:
+            icons[invoice_data.type] = Common.BASE_URL + invoice_data.icon.url
+    defaults = {
+        'FOOTER': 'Koor Admin, Thanks',
+        'FOOTER_TEXT': 'Unsubscribe from the newsletter',
+        'BASE_URL': Common.BASE_URL,
+        'LOGO': Common.BASE_URL + smtp_setting.logo.url,
+    }
+    defaults.update({'invoice_' + icon_type: url for icon_type, url in icons.items()})
+    return smtp_setting, defaults
+
+
 def get_email_object(subject, email_template_name, context, to_email, content_subtype="html", **kwargs):
     """
     Sends an email message using `SMTP settings` from the latest `SMTPSetting object` in the database.
@@ -34,43 +55,13 @@ def get_email_object(subject, email_template_name, context, to_email, content_su
     logger = logging.getLogger(__name__)
 
     try:
-        smtp_setting = SMTPSetting.objects.last()
-        invoice_icons = InvoiceIcon.objects.all()
+        smtp_setting, defaults = get_email_defaults()
         host = smtp_setting.smtp_host
         host_user = smtp_setting.smtp_user
         host_password = smtp_setting.smtp_password
         host_port = smtp_setting.smtp_port
         from_email = f"Koortech <{host_user}>"
-        
-        invoice_x = ""
-        invoice_youtube = ""
-        invoice_instagram = ""
-        invoice_linkedin = ""
-        invoice_facebook = ""
-        for invoice_data in invoice_icons:
-            if invoice_data.type == 'x':
-                invoice_x = Common.BASE_URL + invoice_data.icon.url
-            if invoice_data.type == 'youtube':
-                invoice_youtube = Common.BASE_URL + invoice_data.icon.url
-            if invoice_data.type == 'instagram':
-                invoice_instagram = Common.BASE_URL + invoice_data.icon.url
-            if invoice_data.type == 'linkedin':
-                invoice_linkedin = Common.BASE_URL + invoice_data.icon.url
-            if invoice_data.type == 'facebook':
-                invoice_facebook = Common.BASE_URL + invoice_data.icon.url
-        context.update({
-            'FOOTER': 'Koor Admin, Thanks',
-            'FOOTER_TEXT': 'Unsubscribe from the newsletter',
-            'BASE_URL': Common.BASE_URL,
-            'LOGO': Common.BASE_URL + smtp_setting.logo.url,
-            'invoice_x': invoice_x,
-            'invoice_youtube': invoice_youtube,
-            'invoice_instagram': invoice_instagram,
-            'invoice_linkedin': invoice_linkedin,
-            'invoice_facebook': invoice_facebook,
-            
-            
-        })
+        context.update(defaults)
         mail_obj = EmailBackend(host=host, port=host_port, password=host_password, username=host_user, use_tls=True,
                                 timeout=10)
 
@@ -99,3 +90,63 @@ def get_email_object(subject, email_template_name, context, to_email, content_su
     except Exception as e:
         logger.exception("Exception occurred", exc_info=True)
         return None
+
+
+def send_email_batch(messages, content_subtype="html"):
+    """
+    Sends several email messages over a single SMTP connection.
+
+    Args:
+        - `messages (list)`: One dict per email with the `subject`, `email_template_name`, `context` and `to_email`
+            arguments of `get_email_object`.
+        - `content_subtype (str, optional)`: The content subtype of the email messages. `Defaults to` `"html"`.
+
+    Returns:
+        - `int`: The number of messages sent, None if the batch failed.
+    """
+    logger = logging.getLogger(__name__)
+
+    if not messages:
+        return 0
+    try:
+        smtp_setting, defaults = get_email_defaults()
+        from_email = f"Koortech <{smtp_setting.smtp_user}>"
+        email_messages = []
+        for message in messages:
+            email_msg = mail.EmailMessage(
+                subject=message['subject'],
+                body=get_template(message['email_template_name']).render({**message['context'], **defaults}),
+                from_email=from_email,
+                to=message['to_email'],
+            )
+            email_msg.content_subtype = content_subtype
+            email_messages.append(email_msg)
+        mail_obj = EmailBackend(host=smtp_setting.smtp_host, port=smtp_setting.smtp_port,
+                                password=smtp_setting.smtp_password, username=smtp_setting.smtp_user, use_tls=True,
+                                timeout=10)
+        sent = mail_obj.send_messages(email_messages)
+        mail_obj.close()
+        return sent
+
+    except Exception:
+        logger.exception("Exception occurred", exc_info=True)
+        return None
+
+
+def send_email_batch_in_background(messages):
+    try:
+        send_email_batch(messages)
+    finally:
+        # The connections opened by the thread are never reused.
+        connections.close_all()
+
+
+def queue_email_batch(messages):
+    """
+    Send `messages` with `send_email_batch` in a background thread once the current transaction commits, so the
+    request neither waits for SMTP nor sends emails about changes that were rolled back.
+    """
+    if messages:
+        transaction.on_commit(
+            lambda: threading.Thread(target=send_email_batch_in_background, args=(messages,)).start()
+        )
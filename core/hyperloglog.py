@@ -0,0 +1,59 @@
+import hashlib
+import math
+import zlib
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch estimating the number of distinct values added to it.
+
+    The sketch keeps `2 ** precision` one-byte registers whatever the number of values, and the union of two
+    sketches is the register-wise maximum, so sketches of separate days can be merged into the sketch of any date
+    range. With the default precision of 12 a sketch takes 4 KiB (less once compressed) and the standard error of
+    the estimate is about 1.6%.
+
+    Attributes:
+        - `precision (int)`: Number of hash bits used to pick a register.
+        - `registers (bytearray)`: The highest rank seen per register.
+    """
+
+    def __init__(self, precision=12, registers=None):
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(registers) if registers else bytearray(self.size)
+
+    @classmethod
+    def from_bytes(cls, data, precision=12):
+        """
+        Return the sketch serialized by `to_bytes`, or an empty sketch for empty data.
+        """
+        return cls(precision, zlib.decompress(data) if data else None)
+
+    def to_bytes(self):
+        """
+        Return the compressed registers. Sketches of quiet days are mostly zeros and compress to a few bytes.
+        """
+        return zlib.compress(bytes(self.registers))
+
+    def add(self, value):
+        hashed = int.from_bytes(hashlib.blake2b(str(value).encode(), digest_size=8).digest(), 'big')
+        index = hashed >> (64 - self.precision)
+        remaining = hashed & ((1 << (64 - self.precision)) - 1)
+        rank = 64 - self.precision - remaining.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, other):
+        """
+        Merge `other` into this sketch, which then estimates the union of both.
+        """
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def count(self):
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        estimate = alpha * self.size ** 2 / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.size and zeros:
+            # Small range correction, linear counting is more accurate while many registers are still empty.
+            estimate = self.size * math.log(self.size / zeros)
+        return int(round(estimate))
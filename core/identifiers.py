@@ -0,0 +1,43 @@
+from django.db import DEFAULT_DB_ALIAS, connections, migrations
+
+# Number of identifiers one sequence can hand out: `XXXX-XXXX` with the first half in 1000-9999 and the second
+# half in 0000-0999. Identifiers drawn at random before the sequences existed always have a second half of
+# 1000-9999, so the two ranges never collide.
+IDENTIFIER_SPACE = 9000000
+# Multiplier coprime with `IDENTIFIER_SPACE`. Multiplying the sequence value with it is a permutation of the
+# space, so consecutive identifiers look unrelated and don't reveal how many rows exist.
+IDENTIFIER_MULTIPLIER = 2750159
+
+
+def format_identifier(value):
+    """
+    Return the human-readable identifier for the sequence value `value`.
+    Example:- 0 -> 1000-0000, 1 -> 3750-0159
+    """
+    scrambled = value * IDENTIFIER_MULTIPLIER % IDENTIFIER_SPACE
+    return '{0}-{1:04d}'.format(1000 + scrambled // 1000, scrambled % 1000)
+
+
+def next_identifier(sequence, using=DEFAULT_DB_ALIAS):
+    """
+    Allocate the next identifier of the Postgres `sequence`.
+
+    `nextval` never returns the same value twice, even to concurrent transactions, so the allocation is a single
+    query with no existence check. The sequence is created with `NO CYCLE` and raises once the identifier space is
+    used up instead of handing out duplicates.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute('SELECT nextval(%s)', [sequence])
+        return format_identifier(cursor.fetchone()[0])
+
+
+def create_identifier_sequence(sequence):
+    """
+    Return the migration operation that creates the Postgres `sequence` used by `next_identifier`.
+    """
+    return migrations.RunSQL(
+        sql='CREATE SEQUENCE IF NOT EXISTS "{0}" MINVALUE 0 MAXVALUE {1} START 0 NO CYCLE'.format(
+            sequence, IDENTIFIER_SPACE - 1
+        ),
+        reverse_sql='DROP SEQUENCE IF EXISTS "{0}"'.format(sequence),
+    )
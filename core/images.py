@@ -0,0 +1,31 @@
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+
+def render_variant(source, size, crop=False, image_format='JPEG'):
+    """
+    Return `(content, extension)` of `source` resized to `size` and encoded as `image_format`.
+
+    With `crop` the image is scaled and centre-cropped to exactly `size`, which suits square avatars and thumbnails;
+    otherwise it is scaled down to fit inside `size` and keeps its aspect ratio. Images are never scaled up. JPEG
+    can't store transparency, so a JPEG variant of an image with an alpha channel is written as PNG instead.
+    """
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+        if crop:
+            image = ImageOps.fit(image, size, Image.LANCZOS)
+        else:
+            image = image.copy()
+            image.thumbnail(size, Image.LANCZOS)
+        if image_format == 'JPEG' and has_alpha:
+            image_format = 'PNG'
+        if image_format == 'JPEG':
+            image = image.convert('RGB')
+        elif image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+        content = BytesIO()
+        options = {'optimize': True} if image_format == 'PNG' else {'quality': 80}
+        image.save(content, image_format, **options)
+    return content.getvalue(), {'JPEG': 'jpg', 'PNG': 'png', 'WEBP': 'webp'}[image_format]
@@ -0,0 +1,144 @@
+from collections import defaultdict
+
+from django.db import models
+from django.db.models import Count
+
+from rest_framework import serializers
+
+
+class Relation:
+    """
+    Related data a serializer reads per instance, loaded for many instances at once by a `BatchLoader`.
+
+    Attributes:
+        - `name (str)`: Identifies the relation in the cache of the loader; two relations must not share a name.
+        - `load (callable)`: Called with a list of keys and the serializer context, returns `{key: value}`.
+        - `many (bool)`: Whether a key has a list of rows. Keys missing from the result get `[]`, or `default`
+            otherwise.
+        - `default`: The value of missing keys of a relation that is not `many`.
+    """
+
+    def __init__(self, name, load, many=False, default=None):
+        self.name = name
+        self.load = load
+        self.many = many
+        self.default = default
+
+    def get_default(self):
+        return [] if self.many else self.default
+
+    @classmethod
+    def rows(cls, name, queryset, field='user', many=True):
+        """
+        Return a relation loading the rows of `queryset` whose `field` is one of the keys, in the order of the
+        queryset. With `many=False` the value of a key is its first row.
+        """
+        attname = queryset.model._meta.get_field(field).attname
+
+        def load(keys, context):
+            grouped = defaultdict(list)
+            for row in queryset.filter(**{'{0}__in'.format(field): keys}):
+                grouped[getattr(row, attname)].append(row)
+            if many:
+                return grouped
+            return {key: rows[0] for key, rows in grouped.items()}
+
+        return cls(name, load, many=many)
+
+    @classmethod
+    def count(cls, name, queryset, field='user'):
+        """
+        Return a relation counting the rows of `queryset` per key, with one grouped query.
+        """
+
+        def load(keys, context):
+            return dict(
+                queryset.filter(**{'{0}__in'.format(field): keys}).order_by().values_list(field).annotate(
+                    total=Count('pk')
+                )
+            )
+
+        return cls(name, load, default=0)
+
+
+class BatchLoader:
+    """
+    Per-request cache of relations loaded in batches, in the spirit of a DataLoader.
+
+    Keys announced with `prime()` are not loaded right away: the first `load()` of a relation runs a single query
+    for every announced key and caches the result by relation and key set, so the instances of a whole page share
+    one query per relation. A key that was never announced, e.g. of a serializer used for a single object, is loaded
+    on its own the first time it is asked for.
+
+    The loader is kept in the serializer context (see `get_loader`), which lives as long as the request; the cached
+    rows are never refreshed, so it must not outlive it.
+    """
+
+    def __init__(self, context=None):
+        self.context = context if context is not None else {}
+        self.pending = defaultdict(set)
+        self.batches = {}
+        self.loaded = defaultdict(dict)
+
+    def prime(self, relation, keys):
+        """
+        Announce `keys` of `relation`, to be loaded with the next batch of the relation.
+        """
+        loaded = self.loaded[relation.name]
+        self.pending[relation.name].update(key for key in keys if key not in loaded)
+
+    def load(self, relation, key):
+        """
+        Return the value of `relation` for `key`, loading the pending batch of the relation if needed.
+        """
+        loaded = self.loaded[relation.name]
+        if key not in loaded:
+            pending = self.pending.pop(relation.name, set())
+            pending.add(key)
+            batch = frozenset(pending.difference(loaded))
+            self.batches[(relation.name, batch)] = relation.load(list(batch), self.context)
+            for batch_key in batch:
+                loaded[batch_key] = batch
+        values = self.batches[(relation.name, loaded[key])]
+        if key in values:
+            return values[key]
+        return relation.get_default()
+
+
+def get_loader(context):
+    """
+    Return the `BatchLoader` of a serializer context, creating it on first use. Nested serializers given the same
+    context share the loader, and with it the batches of the page.
+    """
+    if 'batch_loader' not in context:
+        context['batch_loader'] = BatchLoader(context)
+    return context['batch_loader']
+
+
+class BatchLoadingListSerializer(serializers.ListSerializer):
+    """
+    List serializer announcing the keys of all its instances to the `BatchLoader` before the first one is rendered.
+    Set as the `list_serializer_class` of serializers using `BatchLoadingMixin`.
+    """
+
+    def to_representation(self, data):
+        instances = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        loader = get_loader(self.context)
+        for relation in self.child.batch_relations:
+            loader.prime(relation, [getattr(instance, self.child.batch_key) for instance in instances])
+        return super().to_representation(instances)
+
+
+class BatchLoadingMixin:
+    """
+    Serializer mixin declaring the relations the serializer reads per instance.
+
+    Every `Relation` of `batch_relations` is keyed by the `batch_key` attribute of the instance and read with
+    `load(relation, obj)`. Serialized with `many=True` (and `BatchLoadingListSerializer` as `list_serializer_class`)
+    each relation costs one query for the whole page instead of one per instance.
+    """
+    batch_relations = ()
+    batch_key = 'pk'
+
+    def load(self, relation, obj):
+        return get_loader(self.context).load(relation, getattr(obj, self.batch_key))
@@ -0,0 +1,144 @@
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.http import http_date, parse_http_date_safe
+from django.views import View
+
+from koor.config.common import Common
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 1024
+
+
+def get_media_path(path):
+    """
+    Return the absolute path of the media file at `path`, relative to `MEDIA_ROOT`. Raises Http404 when the file
+    does not exist or the path points outside of `MEDIA_ROOT`.
+    """
+    try:
+        full_path = safe_join(Common.MEDIA_ROOT, path)
+    except (SuspiciousFileOperation, ValueError):
+        raise Http404('File does not exist.')
+    if not os.path.isfile(full_path):
+        raise Http404('File does not exist.')
+    return full_path
+
+
+def parse_range(header, size):
+    """
+    Return the `(start, end)` byte positions, both included, requested by a single range `Range` header.
+
+    Returns None when the whole file should be sent (no header, or a form that is not supported such as several
+    ranges) and raises ValueError when the range can not be satisfied.
+    """
+    match = RANGE_RE.match(header or '')
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        # `bytes=-500` asks for the last 500 bytes.
+        start = max(size - int(last), 0)
+        end = size - 1
+    if start > end or start >= size:
+        raise ValueError
+    return start, end
+
+
+def is_not_modified(request, etag, modified):
+    """
+    Return True if the client copy is current. `If-None-Match` takes precedence over `If-Modified-Since`.
+    """
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match:
+        return if_none_match.strip() == '*' or etag in [tag.strip() for tag in if_none_match.split(',')]
+    if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+    return bool(if_modified_since) and int(modified) <= if_modified_since
+
+
+def iter_file(full_path, start, length):
+    with open(full_path, 'rb') as media_file:
+        media_file.seek(start)
+        while length > 0:
+            chunk = media_file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def serve_media(request, path, as_attachment=False):
+    """
+    Return a response delivering the media file `path`.
+
+    The file is never read into memory as a whole: it is either handed to the front proxy with
+    `MEDIA_SENDFILE_HEADER` or streamed in chunks of `CHUNK_SIZE` bytes. Conditional requests (`If-None-Match`,
+    `If-Modified-Since`) are answered with `304 Not Modified`, and a single `Range` gets a `206 Partial Content`.
+    """
+    full_path = get_media_path(path)
+    stat = os.stat(full_path)
+    etag = '"{0:x}-{1:x}"'.format(stat.st_mtime_ns, stat.st_size)
+    last_modified = http_date(stat.st_mtime)
+
+    if is_not_modified(request, etag, stat.st_mtime):
+        not_modified = HttpResponseNotModified()
+        not_modified['ETag'] = etag
+        return not_modified
+
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or 'application/octet-stream'
+    if Common.MEDIA_SENDFILE_HEADER:
+        # The proxy sends the body, including ranges, so the worker is released right away.
+        media_response = HttpResponse(content_type=content_type)
+        if Common.MEDIA_SENDFILE_HEADER.lower() == 'x-accel-redirect':
+            media_response['X-Accel-Redirect'] = Common.MEDIA_ACCEL_REDIRECT_PREFIX + quote(path.lstrip('/'))
+        else:
+            media_response[Common.MEDIA_SENDFILE_HEADER] = full_path
+    else:
+        byte_range = None
+        if_range = request.headers.get('If-Range')
+        if not if_range or if_range == etag:
+            try:
+                byte_range = parse_range(request.headers.get('Range'), stat.st_size)
+            except ValueError:
+                unsatisfiable = HttpResponse(status=416)
+                unsatisfiable['Content-Range'] = 'bytes */{0}'.format(stat.st_size)
+                return unsatisfiable
+        start, end = byte_range or (0, stat.st_size - 1)
+        length = end - start + 1 if stat.st_size else 0
+        media_response = StreamingHttpResponse(
+            iter_file(full_path, start, length) if request.method != 'HEAD' else [],
+            status=206 if byte_range else 200,
+            content_type=content_type
+        )
+        media_response['Content-Length'] = str(length)
+        if byte_range:
+            media_response['Content-Range'] = 'bytes {0}-{1}/{2}'.format(start, end, stat.st_size)
+    if encoding:
+        media_response['Content-Encoding'] = encoding
+    media_response['Accept-Ranges'] = 'bytes'
+    media_response['ETag'] = etag
+    media_response['Last-Modified'] = last_modified
+    media_response['Cache-Control'] = 'public, max-age={0}'.format(Common.MEDIA_CACHE_MAX_AGE)
+    if as_attachment:
+        media_response['Content-Disposition'] = "attachment; filename*=UTF-8''{0}".format(
+            quote(os.path.basename(full_path))
+        )
+    return media_response
+
+
+class MediaView(View):
+    """
+    Serves the uploaded files below `MEDIA_URL`, see `serve_media`.
+    """
+    http_method_names = ['get', 'head']
+
+    def get(self, request, path):
+        return serve_media(request, path)
@@ -1,15 +1,106 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+
+from koor.config.common import Common
+
+
+def estimate_count(queryset):
+    """
+    Return the number of rows the Postgres planner expects `queryset` to return.
+
+    The estimate comes from the table statistics (`EXPLAIN` reads `pg_class.reltuples` and the column statistics
+    kept by `ANALYZE`), so it costs no table scan. Returns None on other database backends.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class ApproximateCountPaginator(Paginator):
+    """
+    Paginator that reports the planner estimate as its count once the estimate reaches `threshold`.
+
+    Below the threshold an exact `COUNT(*)` is cheap and is used instead.
+    """
+    threshold = Common.PAGINATION_EXACT_COUNT_THRESHOLD
+    is_approximate = False
+
+    @cached_property
+    def count(self):
+        estimate = estimate_count(self.object_list)
+        if estimate is None or estimate < self.threshold:
+            return super().count
+        self.is_approximate = True
+        return estimate
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination used by `CustomPagination` when a view opts into the keyset mode.
+    """
+    page_size = 10
+    page_size_query_param = 'limit'
+    max_page_size = 1000
 
 
 class CustomPagination(PageNumberPagination):
     """
     Custom pagination class for handling pagination of query results.
 
+    Views can opt into two additional modes:
+        - `cursor_ordering (str)`: Enables keyset pagination. When the request contains the `cursor` query parameter
+          (empty for the first page), the page is fetched with `WHERE <ordering field> < <last value>` instead of
+          an `OFFSET`, and no count is computed. The response contains `next`, `previous` and `results`.
+        - `approximate_count (bool)`: For unfiltered requests the count comes from the planner statistics
+          instead of `COUNT(*)`, as long as the estimate is at least `PAGINATION_EXACT_COUNT_THRESHOLD` rows.
+          The response then contains `count_is_approximate`.
+
     Attributes:
         page_size (int): The number of items to be displayed per page. Default is 10.
         page_size_query_param (str): The name of the query parameter used to specify the number of items to be displayed per page. Default is "limit".
         max_page_size (int): The maximum number of items that can be displayed per page. Default is 1000.
+        cursor_query_param (str): The name of the query parameter that holds the keyset cursor. Default is "cursor".
     """
     page_size = 10
     page_size_query_param = 'limit'
     max_page_size = 1000
+    cursor_query_param = 'cursor'
+    keyset_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        cursor_ordering = getattr(view, 'cursor_ordering', None)
+        if cursor_ordering and self.cursor_query_param in request.query_params:
+            self.keyset_paginator = KeysetPagination()
+            self.keyset_paginator.ordering = cursor_ordering
+            self.keyset_paginator.cursor_query_param = self.cursor_query_param
+            return self.keyset_paginator.paginate_queryset(queryset, request, view)
+        if getattr(view, 'approximate_count', False) and self.is_unfiltered(request):
+            self.django_paginator_class = ApproximateCountPaginator
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset_paginator:
+            return self.keyset_paginator.get_paginated_response(data)
+        paginated_response = super().get_paginated_response(data)
+        if getattr(self.page.paginator, 'is_approximate', False):
+            paginated_response.data['count_is_approximate'] = True
+        return paginated_response
+
+    def is_unfiltered(self, request):
+        """
+        Return True if the request only carries pagination parameters, i.e. the planner estimate of the base
+        queryset is a good estimate of the result.
+        """
+        pagination_params = {self.page_query_param, self.page_size_query_param}
+        return set(request.query_params.keys()) <= pagination_params
@@ -0,0 +1,82 @@
+import re
+
+
+class SlugAllocator:
+    """
+    Hands out unique slugs of the form `<base>`, `<base>-1`, `<base>-2`, ...
+
+    The first request for a base fetches every slug of `queryset` that starts with the base in one query and
+    remembers the highest suffix in use, every following slug for the same base is picked in memory. This keeps a
+    batch of rows sharing a title at one query per distinct title instead of one `exists()` query per candidate.
+    Every slug handed out is remembered as well, so a suffixed slug of one base is never handed out again as the
+    plain slug of another, e.g. `foo-1` for a second "Foo" and for "Foo 1".
+
+    Attributes:
+        - `queryset (QuerySet)`: The rows whose slugs are taken. When None only the slugs handed out by the
+          allocator itself count as taken, which is what a backfill that rewrites every slug needs.
+        - `field (str)`: The name of the slug field.
+    """
+
+    def __init__(self, queryset=None, field='slug'):
+        self.queryset = queryset
+        self.field = field
+        self.highest_suffix = {}
+        self.allocated = set()
+
+    def allocate(self, base, exclude=None):
+        """
+        Return the next free slug for `base`. `exclude` is the primary key of a row whose own slug may be reused.
+        """
+        if base not in self.highest_suffix:
+            self.highest_suffix[base] = self.get_highest_suffix(base, exclude)
+        suffix = self.highest_suffix[base]
+        slug = None
+        while slug is None or slug in self.allocated:
+            suffix += 1
+            slug = base if suffix == 0 else '{0}-{1}'.format(base, suffix)
+        self.highest_suffix[base] = suffix
+        self.allocated.add(slug)
+        return slug
+
+    def get_highest_suffix(self, base, exclude=None):
+        """
+        Return the highest suffix of `base` in use, 0 if only `base` itself is taken and -1 if it is free.
+        """
+        if self.queryset is None:
+            return -1
+        queryset = self.queryset.filter(**{'{0}__startswith'.format(self.field): base})
+        if exclude is not None:
+            queryset = queryset.exclude(pk=exclude)
+        pattern = re.compile(r'^{0}(?:-(\d+))?$'.format(re.escape(base)))
+        highest = -1
+        for slug in queryset.values_list(self.field, flat=True).iterator():
+            match = pattern.match(slug or '')
+            if match:
+                highest = max(highest, int(match.group(1) or 0))
+        return highest
+
+
+def backfill_slugs(queryset, get_base, batch_size=1000):
+    """
+    Rewrite the slug of every row of `queryset` in a single streaming pass and return the number of changed rows.
+
+    Rows are read in creation order, so the oldest row of a title keeps the plain slug. `get_base(instance)`
+    returns the slug base of a row. Changed rows are written with one `bulk_update` per `batch_size` rows.
+    """
+    allocator = SlugAllocator()
+    model = queryset.model
+    changed = []
+    updated = 0
+    for instance in queryset.order_by('created').iterator(chunk_size=batch_size):
+        slug = allocator.allocate(get_base(instance))
+        if instance.slug != slug:
+            instance.slug = slug
+            changed.append(instance)
+        if len(changed) >= batch_size:
+            model.objects.bulk_update(changed, ['slug'])
+            updated += len(changed)
+            changed = []
+    if changed:
+        model.objects.bulk_update(changed, ['slug'])
+        updated += len(changed)
+    return updated
@@ -0,0 +1,49 @@
+import hashlib
+
+from django.core.files.uploadhandler import MemoryFileUploadHandler, TemporaryFileUploadHandler
+
+CHUNK_SIZE = 64 * 1024
+
+
+class HashingUploadMixin:
+    """
+    Computes the SHA-256 digest of an uploaded file while its chunks stream in and stores it as the `sha256`
+    attribute of the resulting file, so storing the upload by its content doesn't read it a second time.
+    """
+
+    def new_file(self, *args, **kwargs):
+        # Set before calling the parent, the memory handler raises StopFutureHandlers once it takes the file.
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        self.sha256.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        uploaded_file = super().file_complete(file_size)
+        if uploaded_file is not None:
+            uploaded_file.sha256 = self.sha256.hexdigest()
+        return uploaded_file
+
+
+class HashingMemoryFileUploadHandler(HashingUploadMixin, MemoryFileUploadHandler):
+    pass
+
+
+class HashingTemporaryFileUploadHandler(HashingUploadMixin, TemporaryFileUploadHandler):
+    pass
+
+
+def file_sha256(content):
+    """
+    Return the SHA-256 hex digest of the Django `File` `content`, the one computed during the upload when there is
+    one.
+    """
+    digest = getattr(content, 'sha256', None)
+    if not digest:
+        sha256 = hashlib.sha256()
+        for chunk in content.chunks(CHUNK_SIZE):
+            sha256.update(chunk)
+        digest = sha256.hexdigest()
+    return digest
@@ -0,0 +1,19 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:38
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('employers', '0002_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='blacklist',
+            index=models.Index(condition=models.Q(('is_removed', False)), fields=['user', 'blacklisted_user'], name='blacklist_user_blacklisted_idx'),
+        ),
+    ]
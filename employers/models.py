@@ -43,3 +43,9 @@ class BlackList(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         verbose_name_plural = "Black Lists"
         db_table = "BlackList"
         ordering = ['-created']
+        indexes = [
+            models.Index(
+                fields=['user', 'blacklisted_user'], name='blacklist_user_blacklisted_idx',
+                condition=models.Q(is_removed=False)
+            ),
+        ]
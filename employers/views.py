@@ -1380,10 +1380,16 @@ class JobApplicationView(generics.ListAPIView):
         context = dict()
         if self.request.user.role == 'employer':
             user_instance = User.objects.get(id=jobSeekerId)
-            queryset = self.filter_queryset(self.get_queryset().filter(user=user_instance).filter(job__user=self.request.user))
+            queryset = self.filter_queryset(
+                self.get_queryset().filter(user=user_instance).filter(job__user=self.request.user).select_related(
+                    'user__image', 'job'
+                )
+            )
             page = self.paginate_queryset(queryset)
             if page is not None:
-                serializer = self.get_serializer(page, many=True, context={"user": self.request.user})
+                serializer = self.get_serializer(
+                    page, many=True, context={"user": self.request.user, **self.serializer_class.get_page_context(page)}
+                )
                 return self.get_paginated_response(serializer.data)
             serializer = self.get_serializer(queryset, many=True, context={"user": self.request.user})
             return response.Response(serializer.data)
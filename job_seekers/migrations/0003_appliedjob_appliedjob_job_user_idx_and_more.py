@@ -0,0 +1,23 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:38
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('job_seekers', '0002_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='appliedjob',
+            index=models.Index(condition=models.Q(('is_removed', False)), fields=['job', 'user'], name='appliedjob_job_user_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='savedjob',
+            index=models.Index(condition=models.Q(('is_removed', False)), fields=['job', 'user'], name='savedjob_job_user_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.1.5 on 2026-10-19 01:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('job_seekers', '0003_appliedjob_appliedjob_job_user_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appliedjob',
+            name='relevance_score',
+            field=models.FloatField(blank=True, db_column='relevance_score', null=True, verbose_name='Relevance Score'),
+        ),
+        AddIndexConcurrently(
+            model_name='appliedjob',
+            index=models.Index(condition=models.Q(('is_removed', False)), fields=['job', '-relevance_score', '-created'], name='appliedjob_job_relevance_idx'),
+        ),
+    ]
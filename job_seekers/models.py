@@ -1,13 +1,21 @@
-from django.db import models
+from collections import defaultdict
+
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
 from django.utils.translation import gettext as _
 from model_utils.fields import AutoCreatedField
+from core.counters import CounterBuffer
 from core.models import (
     BaseModel, SoftDeleteModel
 )
 
 from users.models import User, TimeStampedModel
 
-from jobs.models import JobDetails, JobSubCategory
+from jobs.models import JobDetails, JobSubCategory, JobsLanguageProficiency
+from user_profile.models import JobSeekerProfile
+
+from .scoring import RelevanceScorer
 
 from project_meta.models import (
     Media, Language, Skill,
@@ -287,6 +295,12 @@ class SavedJob(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         verbose_name_plural = "Saved Jobs"
         db_table = "SavedJob"
         ordering = ['-created']
+        indexes = [
+            models.Index(
+                fields=['job', 'user'], name='savedjob_job_user_idx',
+                condition=models.Q(is_removed=False)
+            ),
+        ]
 
 
 class AppliedJob(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
@@ -299,6 +313,8 @@ class AppliedJob(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
     - `rejected_at`: the date and time when the job was rejected
     - `resume`: the resume submitted for the job
     - `cover_letter`: the cover letter submitted for the job
+    - `relevance_score`: how well the applicant matches the job, from 0 to 100, see `score_relevance`. Empty
+      until the application is scored, see `score_unscored`
     """
     user = models.ForeignKey(
         User,
@@ -347,15 +363,122 @@ class AppliedJob(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         blank=True,
         db_column="short_letter",
     )
+    relevance_score = models.FloatField(
+        verbose_name=_('Relevance Score'),
+        null=True,
+        blank=True,
+        db_column="relevance_score",
+    )
 
     def __str__(self):
         return str(self.job) + "(" + str(self.user) + ")"
 
+    @classmethod
+    def score_relevance(cls, job, application_ids=None, batch_size=1000):
+        """
+        Compute and store the `relevance_score` of the applications of `job`, or only of `application_ids`.
+
+        The requirements of the job are loaded once, then every batch of `batch_size` applications costs one query
+        per applicant relation, one vectorized `RelevanceScorer.score` call and one `bulk_update`.
+        """
+        scorer = RelevanceScorer(
+            skill_ids=list(job.skill.values_list('id', flat=True)),
+            languages=list(
+                JobsLanguageProficiency.objects.filter(job=job).values_list('language', 'written', 'spoken')
+            ),
+            education_id=job.highest_education_id,
+            experience=job.experience,
+            city_id=job.city_id,
+            country_id=job.country_id
+        )
+        applications = cls.objects.filter(job=job)
+        if application_ids is not None:
+            applications = applications.filter(id__in=application_ids)
+        batch = []
+        for application in applications.order_by().values_list('id', 'user').iterator(chunk_size=batch_size):
+            batch.append(application)
+            if len(batch) == batch_size:
+                cls.score_batch(scorer, batch)
+                batch = []
+        if batch:
+            cls.score_batch(scorer, batch)
+
+    @classmethod
+    def score_batch(cls, scorer, batch):
+        """
+        Score and store a batch of `(application id, user id)` pairs with `scorer`.
+        """
+        user_ids = list({user_id for application_id, user_id in batch})
+        profiles = JobSeekerProfile.objects.filter(user__in=user_ids).values_list(
+            'user', 'highest_education', 'experience', 'city', 'country'
+        )
+        skills = JobSeekerSkill.objects.filter(
+            user__in=user_ids, skill__in=list(scorer.skill_columns)
+        ).values_list('user', 'skill') if scorer.skill_columns else []
+        languages = JobSeekerLanguageProficiency.objects.filter(
+            user__in=user_ids, language__in=list(scorer.language_columns)
+        ).values_list('user', 'language', 'written', 'spoken') if scorer.language_columns else []
+        educations = EducationRecord.objects.filter(
+            user__in=user_ids, education_level=scorer.education_id
+        ).values_list('user', 'education_level') if scorer.education_id else []
+        scores = dict(zip(user_ids, scorer.score(
+            user_ids, list(profiles), list(skills), list(languages), list(educations)
+        ).tolist()))
+        cls.objects.bulk_update(
+            [cls(id=application_id, relevance_score=scores[user_id]) for application_id, user_id in batch],
+            ['relevance_score']
+        )
+
+    @staticmethod
+    def rescore(pending):
+        """
+        Rescore the applications buffered by `relevance_queue`, keyed by `('job', job id)`, `('user', user id)` or
+        `('application', application id)`. Every job is scored once, however many keys touched it.
+        """
+        whole_jobs = {key for kind, key in pending if kind == 'job'}
+        applications = defaultdict(set)
+        for job_id, application_id in AppliedJob.objects.filter(
+                models.Q(user__in=[key for kind, key in pending if kind == 'user']) |
+                models.Q(id__in=[key for kind, key in pending if kind == 'application'])
+        ).exclude(job__in=whole_jobs).values_list('job', 'id'):
+            applications[job_id].add(application_id)
+        for job in JobDetails.objects.filter(id__in=whole_jobs | set(applications)):
+            AppliedJob.score_relevance(job, application_ids=applications.get(job.id))
+
+    @classmethod
+    def score_unscored(cls, applications):
+        """
+        Score the applications of the `applications` queryset that have no `relevance_score` yet, before they are
+        sorted by relevance. These are the applications that existed before the score was introduced and the new
+        ones `relevance_queue` did not flush yet.
+        """
+        unscored = applications.filter(relevance_score__isnull=True).order_by().values_list('id', flat=True)
+        cls.rescore([('application', application_id) for application_id in unscored])
+
     class Meta:
         verbose_name = "Applied Job"
         verbose_name_plural = "Applied Jobs"
         db_table = "AppliedJob"
         ordering = ['-created']
+        indexes = [
+            models.Index(
+                fields=['job', 'user'], name='appliedjob_job_user_idx',
+                condition=models.Q(is_removed=False)
+            ),
+            models.Index(
+                fields=['job', '-relevance_score', '-created'], name='appliedjob_job_relevance_idx',
+                condition=models.Q(is_removed=False)
+            ),
+        ]
+
+
+# Buffers the applications to rescore, see `AppliedJob.rescore`. Keys are only added once the transaction that
+# changed the job or the applicant commits, so a rescore never reads the old rows.
+relevance_queue = CounterBuffer(AppliedJob.rescore)
+
+
+def schedule_rescore(kind, key):
+    transaction.on_commit(lambda: relevance_queue.add((kind, key)))
 
 
 class AppliedJobAttachmentsItem(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
@@ -585,3 +708,42 @@ class CoverLetter(models.Model):
         verbose_name = "Cover Letter"
         verbose_name_plural = "Cover Letters"
         db_table = "CoverLetter"
+
+
+@receiver(post_save, sender=AppliedJob)
+def score_new_application(sender, instance, created, **kwargs):
+    if created:
+        schedule_rescore('application', instance.id)
+
+
+@receiver(post_save, sender=JobDetails)
+@receiver(post_save, sender=JobsLanguageProficiency)
+@receiver(post_delete, sender=JobsLanguageProficiency)
+def rescore_job_applications(sender, instance, created=False, **kwargs):
+    if sender is JobDetails:
+        if not created:
+            schedule_rescore('job', instance.id)
+    else:
+        schedule_rescore('job', instance.job_id)
+
+
+@receiver(m2m_changed, sender=JobDetails.skill.through)
+def rescore_job_applications_skills(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        schedule_rescore('job', instance.id)
+    else:
+        for job_id in pk_set or ():
+            schedule_rescore('job', job_id)
+
+
+@receiver(post_save, sender=JobSeekerProfile)
+@receiver(post_save, sender=JobSeekerSkill)
+@receiver(post_delete, sender=JobSeekerSkill)
+@receiver(post_save, sender=JobSeekerLanguageProficiency)
+@receiver(post_delete, sender=JobSeekerLanguageProficiency)
+@receiver(post_save, sender=EducationRecord)
+@receiver(post_delete, sender=EducationRecord)
+def rescore_applicant_applications(sender, instance, **kwargs):
+    schedule_rescore('user', instance.user_id)
@@ -0,0 +1,116 @@
+import numpy as np
+
+# Rank of the language fluency choices of `JobsLanguageProficiency` and `JobSeekerLanguageProficiency`.
+FLUENCY_LEVELS = {'basic': 1, 'conversational': 2, 'fluent': 3}
+
+# Weight of every criterion in the relevance score. Criteria the job doesn't specify are left out and the weights of
+# the others are scaled up accordingly.
+RELEVANCE_WEIGHTS = {
+    'skill': 0.35,
+    'language': 0.15,
+    'education': 0.2,
+    'experience': 0.2,
+    'location': 0.1,
+}
+
+
+class RelevanceScorer:
+    """
+    Scores applicants against the requirements of one job, a whole batch of applicants at a time.
+
+    Every criterion is a vector (or an applicant x requirement matrix) filled from the related rows of the batch with
+    NumPy index assignment, so the cost of a batch is a few array operations instead of a Python loop per applicant
+    and requirement. Scores range from 0 (nothing matches) to 100 (every specified requirement is met).
+
+    Attributes:
+        - `skill_ids (list)`: The skills of the job.
+        - `languages (list)`: `(language id, written, spoken)` of every language requirement of the job.
+        - `education_id (UUID)`: The education level the job asks for, or None.
+        - `experience (int)`: The years of experience the job asks for, or None.
+        - `city_id (UUID)` / `country_id (UUID)`: The location of the job.
+    """
+
+    def __init__(self, skill_ids, languages, education_id=None, experience=None, city_id=None, country_id=None):
+        self.skill_columns = {skill_id: column for column, skill_id in enumerate(skill_ids)}
+        self.language_columns = {language[0]: column for column, language in enumerate(languages)}
+        self.required_written = np.array(
+            [FLUENCY_LEVELS.get(written, 1) for language_id, written, spoken in languages], dtype=float
+        )
+        self.required_spoken = np.array(
+            [FLUENCY_LEVELS.get(spoken, 1) for language_id, written, spoken in languages], dtype=float
+        )
+        self.education_id = education_id
+        self.experience = experience
+        self.city_id = city_id
+        self.country_id = country_id
+
+    def score(self, user_ids, profiles, skills, languages, educations):
+        """
+        Return the scores of the applicants `user_ids` as a float array in the same order.
+
+        Args:
+            - `user_ids (list)`: The applicants of the batch.
+            - `profiles (list)`: `(user id, highest education id, experience, city id, country id)` per profile.
+            - `skills (list)`: `(user id, skill id)` per skill of the applicants.
+            - `languages (list)`: `(user id, language id, written, spoken)` per language of the applicants.
+            - `educations (list)`: `(user id, education level id)` per education record of the applicants.
+        """
+        rows = {user_id: row for row, user_id in enumerate(user_ids)}
+        size = len(user_ids)
+        criteria = {}
+
+        if self.skill_columns:
+            matches = np.zeros((size, len(self.skill_columns)), dtype=bool)
+            pairs = [(rows[user_id], self.skill_columns[skill_id]) for user_id, skill_id in skills
+                     if skill_id in self.skill_columns]
+            if pairs:
+                matches[tuple(np.array(pairs).T)] = True
+            criteria['skill'] = matches.mean(axis=1)
+
+        if self.language_columns:
+            written = np.zeros((size, len(self.language_columns)))
+            spoken = np.zeros((size, len(self.language_columns)))
+            known = [(rows[user_id], self.language_columns[language_id], written_level, spoken_level)
+                     for user_id, language_id, written_level, spoken_level in languages
+                     if language_id in self.language_columns]
+            if known:
+                row_index = np.array([row for row, column, written_level, spoken_level in known])
+                column_index = np.array([column for row, column, written_level, spoken_level in known])
+                written[row_index, column_index] = [FLUENCY_LEVELS.get(level, 0) for row, column, level, spoken_level
+                                                    in known]
+                spoken[row_index, column_index] = [FLUENCY_LEVELS.get(level, 0) for row, column, written_level, level
+                                                   in known]
+            fluency = (
+                np.minimum(written / self.required_written, 1) + np.minimum(spoken / self.required_spoken, 1)
+            ) / 2
+            criteria['language'] = fluency.mean(axis=1)
+
+        profile_rows = np.array([rows[profile[0]] for profile in profiles], dtype=int)
+        if self.education_id:
+            education = np.zeros(size, dtype=bool)
+            education[profile_rows] = [profile[1] == self.education_id for profile in profiles]
+            recorded = [rows[user_id] for user_id, level_id in educations if level_id == self.education_id]
+            education[np.array(recorded, dtype=int)] = True
+            criteria['education'] = education.astype(float)
+
+        if self.experience:
+            experience = np.zeros(size)
+            experience[profile_rows] = [profile[2] or 0 for profile in profiles]
+            criteria['experience'] = np.minimum(experience / self.experience, 1)
+
+        if self.city_id or self.country_id:
+            # The same city counts fully, the same country only half when the job is in a given city.
+            same_country = 0.5 if self.city_id else 1.0
+            location = np.zeros(size)
+            location[profile_rows] = [
+                1.0 if self.city_id and profile[3] == self.city_id else
+                same_country if self.country_id and profile[4] == self.country_id else 0.0
+                for profile in profiles
+            ]
+            criteria['location'] = location
+
+        if not criteria:
+            return np.zeros(size)
+        weights = np.array([RELEVANCE_WEIGHTS[name] for name in criteria])
+        matrix = np.vstack(list(criteria.values()))
+        return np.round(100 * weights @ matrix / weights.sum(), 2)
@@ -3,13 +3,14 @@ from rest_framework import serializers
 from core.emails import get_email_object
 from koor.config.common import Common
 
-from jobs.models import JobDetails, JobSubCategory, JobCategory
+from jobs.models import JobDetails, JobSubCategory, JobCategory, refresh_job_category_stats
 from project_meta.models import (
-    Media, Language
+    Media, Language, UploadSession
 
 )
 from user_profile.models import JobSeekerProfile, Reference
 
+from users.models import schedule_search_document
 from users.serializers import ApplicantDetailSerializers
 
 from jobs.serializers import GetJobsDetailSerializers, GetJobsSerializers, AppliedJobAttachmentsSerializer
@@ -89,16 +90,33 @@ class UploadResumeSerializers(serializers.ModelSerializer):
     resume = serializers.FileField(
         style={"input_type": "file"},
         write_only=True,
-        allow_null=False
+        allow_null=False,
+        required=False
+    )
+    # Id of a completed chunked upload (`/api/v1/uploads`) of the user, instead of `resume`.
+    resume_upload = serializers.UUIDField(
+        write_only=True,
+        required=False
     )
 
     class Meta:
         model = Resume
-        fields = ['id', 'resume']
+        fields = ['id', 'resume', 'resume_upload']
+
+    def validate_resume_upload(self, resume_upload):
+        media = UploadSession.get_completed_media(self.context['user'], [resume_upload])
+        if not media:
+            raise serializers.ValidationError('Complete the upload before using it.')
+        return media[0]
+
+    def validate(self, data):
+        if 'resume' not in data and 'resume_upload' not in data:
+            raise serializers.ValidationError({'resume': 'This field is required.'})
+        return data
 
-    
     def save(self, user):
         resume = None
+        resume_media = self.validated_data.pop('resume_upload', None)
         if 'resume' in self.validated_data:
             resume = self.validated_data.pop('resume')
         if Resume.objects.filter(user=user).exists():
@@ -120,6 +138,9 @@ class UploadResumeSerializers(serializers.ModelSerializer):
             # save media instance into license id file into employer profile table.
             instance.file_path = media_instance
             instance.save()
+        elif resume_media:
+            instance.file_path = resume_media
+            instance.save()
         return self
 
 
@@ -184,6 +205,8 @@ class CoverLetterSerializers(serializers.ModelSerializer):
         instance = super().save(user=user, job=job_instance)
         if profile_title:
             JobSeekerProfile.objects.filter(user=user).update(profile_title=profile_title)
+            # `update()` sends no signals, see `users.models.refresh_search_document_related`.
+            schedule_search_document(user.id)
         if signature_file:
             # Get media type from upload license file
             content_type = str(signature_file.content_type).split("/")
@@ -496,10 +519,22 @@ class AppliedJobSerializers(serializers.ModelSerializer):
         allow_null=False,
         required=False
     )
+    # Ids of completed chunked uploads (`/api/v1/uploads`) of the user, attached next to `attachments`.
+    attachment_uploads = serializers.ListField(
+        child=serializers.UUIDField(),
+        write_only=True,
+        required=False
+    )
 
     class Meta:
         model = AppliedJob
-        fields = ['id', 'attachments', 'short_letter']
+        fields = ['id', 'attachments', 'attachment_uploads', 'short_letter']
+
+    def validate_attachment_uploads(self, attachment_uploads):
+        media = UploadSession.get_completed_media(self.context['user'], attachment_uploads)
+        if len(media) != len(set(attachment_uploads)):
+            raise serializers.ValidationError('Complete the uploads before using them.')
+        return media
 
     def save(self, user, job_instance):
         """Saves a new instance of the AppliedJob model with the given user and job instance, and saves any attachments
@@ -529,6 +564,7 @@ class AppliedJobSerializers(serializers.ModelSerializer):
         """
 
         attachments = None
+        uploaded_attachments = self.validated_data.pop('attachment_uploads', [])
         if 'attachments' in self.validated_data:
             attachments = self.validated_data.pop('attachments')
         applied_job_instance = super().save(user=user, job=job_instance)
@@ -613,6 +649,8 @@ class AppliedJobSerializers(serializers.ModelSerializer):
                 attachments_instance = AppliedJobAttachmentsItem.objects.create(applied_job=applied_job_instance,
                                                                                 attachment=media_instance)
                 attachments_instance.save()
+        for media_instance in uploaded_attachments:
+            AppliedJobAttachmentsItem.objects.create(applied_job=applied_job_instance, attachment=media_instance)
         return self
 
 
@@ -1041,9 +1079,16 @@ class ModifyCategoriesSerializers(serializers.ModelSerializer):
             existing_jobseeker_categories = Categories.objects.filter(user=user).values('category')
             existing_categories = JobSubCategory.objects.filter(id__in=existing_jobseeker_categories)
             updated_qs = updated_categories.difference(existing_categories)
-            Categories.objects.bulk_create([
+            added_categories = Categories.objects.bulk_create([
                 Categories(user=user, category=category) for category in updated_qs
             ])
+            # `bulk_create()` sends no signals, see `jobs.models.update_talent_category_stats` and
+            # `users.models.refresh_search_document_related`.
+            refresh_job_category_stats(
+                [category.category.category_id for category in added_categories], ('talent_count',)
+            )
+            if added_categories:
+                schedule_search_document(user.id)
             existing_jobseeker_categories = Categories.objects.filter(user=user).values('category')
             existing_categories = JobSubCategory.objects.filter(id__in=existing_jobseeker_categories)
             remove_jobseeker_categories = existing_categories.difference(updated_categories)
@@ -1091,14 +1136,27 @@ class UpdateAppliedJobSerializers(serializers.ModelSerializer):
         allow_null=False,
         required=False
     )
+    # Ids of completed chunked uploads (`/api/v1/uploads`) of the user, attached next to `attachments`.
+    attachment_uploads = serializers.ListField(
+        child=serializers.UUIDField(),
+        write_only=True,
+        required=False
+    )
 
     class Meta:
         model = AppliedJob
-        fields = ['id', 'attachments', 'attachments_remove', 'short_letter']
+        fields = ['id', 'attachments', 'attachments_remove', 'attachment_uploads', 'short_letter']
+
+    def validate_attachment_uploads(self, attachment_uploads):
+        media = UploadSession.get_completed_media(self.context['user'], attachment_uploads)
+        if len(media) != len(set(attachment_uploads)):
+            raise serializers.ValidationError('Complete the uploads before using them.')
+        return media
 
     def update(self, instance, validated_data):
         attachments = None
         attachments_remove = None
+        uploaded_attachments = self.validated_data.pop('attachment_uploads', [])
 
         if 'attachments' in self.validated_data:
             attachments = self.validated_data.pop('attachments')
@@ -1124,6 +1182,8 @@ class UpdateAppliedJobSerializers(serializers.ModelSerializer):
                 attachments_instance = AppliedJobAttachmentsItem.objects.create(applied_job=applied_job_instance,
                                                                                 attachment=media_instance)
                 attachments_instance.save()
+        for media_instance in uploaded_attachments:
+            AppliedJobAttachmentsItem.objects.create(applied_job=applied_job_instance, attachment=media_instance)
 
         return instance
 
@@ -1164,6 +1224,8 @@ class UpdateCoverLetterSerializers(serializers.ModelSerializer):
         instance = super().update(instance, validated_data)
         if profile_title:
             JobSeekerProfile.objects.filter(user=instance.user).update(profile_title=profile_title)
+            # `update()` sends no signals, see `users.models.refresh_search_document_related`.
+            schedule_search_document(instance.user.id)
         if signature_file:
             # Get media type from upload license file
             content_type = str(signature_file.content_type).split("/")
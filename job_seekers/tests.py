@@ -1,3 +1,170 @@
-from django.test import TestCase
+import tempfile
+from datetime import date, timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from jobs.models import JobCategory, JobCategoryStats, JobDetails, JobSubCategory
+from project_meta.models import City, Country, EducationLevel, Skill
+from user_profile.models import JobSeekerProfile
+from users.models import CandidateSearchDocument, User, search_document_queue
+
+from .models import AppliedJob, Categories, JobPreferences, JobSeekerSkill, relevance_queue
+from .serializers import CoverLetterSerializers
+
+
+class CategoryViewTests(TestCase):
+    """
+    Tests of the job seeker category endpoint, whose `bulk_create()` sends no signals.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(email='seeker@example.com', name='Seeker', role='job_seeker', is_active=True)
+        JobPreferences.objects.create(user=self.user, display_in_search=True)
+        self.category = JobCategory.objects.create(title='IT')
+        self.sub_category = JobSubCategory.objects.create(title='Development', category=self.category)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def tearDown(self):
+        # Write what the test queued while its transaction is still open.
+        search_document_queue.flush()
+        relevance_queue.flush()
+
+    def put_categories(self, categories):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(
+                '/api/v1/users/job-seeker/category', {'category': categories}, format='json'
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_added_category_refreshes_talent_count(self):
+        self.put_categories([str(self.sub_category.id)])
+        self.assertTrue(Categories.objects.filter(user=self.user, category=self.sub_category).exists())
+        self.assertEqual(JobCategoryStats.objects.get(category=self.category).talent_count, 1)
+
+    def test_added_category_refreshes_search_document(self):
+        self.put_categories([str(self.sub_category.id)])
+        search_document_queue.flush()
+        document = CandidateSearchDocument.objects.get(user=self.user)
+        self.assertEqual(document.categories, ['Development'])
+
+
+class SkillsViewTests(TestCase):
+    """
+    Tests of the job seeker skills endpoint, whose removals are a queryset `delete()` sending no signals.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(email='seeker@example.com', name='Seeker', role='job_seeker', is_active=True)
+        self.country = Country.objects.create(title='Kenya')
+        JobSeekerProfile.objects.create(
+            user=self.user, gender='female', experience=2, dob=date(1990, 1, 1), employment_status='employed',
+            country=self.country, city=City.objects.create(title='Nairobi', country=self.country),
+            highest_education=EducationLevel.objects.create(title='Degree')
+        )
+        self.skill = JobSeekerSkill.objects.create(user=self.user, skill=Skill.objects.create(title='Python'))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def tearDown(self):
+        # Write what the test queued while its transaction is still open.
+        search_document_queue.flush()
+        relevance_queue.flush()
+
+    def remove_skill(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                '/api/v1/users/job-seeker/skills', {'skill_remove': [str(self.skill.id)], 'skill_add': []},
+                format='json'
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(JobSeekerSkill.objects.filter(user=self.user).exists())
+
+    def test_removed_skill_rescores_applications(self):
+        with mock.patch.object(relevance_queue, 'add') as add:
+            self.remove_skill()
+        add.assert_any_call(('user', self.user.id))
+
+    def test_removing_the_last_skill_blocks_applying(self):
+        self.assertTrue(JobSeekerProfile.objects.get(user=self.user).is_complete)
+        self.remove_skill()
+        profile = JobSeekerProfile.objects.get(user=self.user)
+        self.assertFalse(profile.is_complete)
+        self.assertEqual(profile.missing_fields, ['skills'])
+        employer = User.objects.create(email='employer@example.com', name='Employer', role='employer')
+        job = JobDetails.objects.create(
+            title='Developer', description='Job', user=employer, country=self.country,
+            deadline=date.today() + timedelta(days=30)
+        )
+        response = self.client.post('/api/v1/users/job-seeker/jobs/apply/{0}'.format(job.id), {}, format='json')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data['missing_fields'], ['skills'])
+
+    def test_removed_skill_leaves_search_document(self):
+        search_document_queue.add(self.user.id)
+        search_document_queue.flush()
+        self.assertIn('Python', CandidateSearchDocument.objects.get(user=self.user).search_text)
+        self.remove_skill()
+        search_document_queue.flush()
+        self.assertNotIn('Python', CandidateSearchDocument.objects.get(user=self.user).search_text)
+
+
+class ApplicationRelevanceTests(TestCase):
+    """
+    Tests of the relevance sort of the job applications endpoint.
+    """
+
+    def setUp(self):
+        self.employer = User.objects.create(email='employer@example.com', name='Employer', role='employer')
+        self.seeker = User.objects.create(email='seeker@example.com', name='Seeker', role='job_seeker')
+        skill = Skill.objects.create(title='Python')
+        JobSeekerSkill.objects.create(user=self.seeker, skill=skill)
+        self.job = JobDetails.objects.create(
+            title='Developer', description='Job', user=self.employer, country=Country.objects.create(title='Kenya'),
+            deadline=date.today() + timedelta(days=30)
+        )
+        self.job.skill.add(skill)
+        self.application = AppliedJob.objects.create(job=self.job, user=self.seeker)
+        self.client = APIClient()
+        self.client.force_authenticate(self.employer)
+
+    def test_unscored_applications_are_scored_before_sorting(self):
+        self.assertIsNone(AppliedJob.objects.get(id=self.application.id).relevance_score)
+        response = self.client.get('/api/v1/jobs/{0}/applications'.format(self.job.id), {'sort': 'relevance'})
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(AppliedJob.objects.get(id=self.application.id).relevance_score, 0)
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class CoverLetterTests(TestCase):
+    """
+    Tests of the cover letter of an application, which updates the profile title with a queryset `update()`.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(email='seeker@example.com', name='Seeker', role='job_seeker', is_active=True)
+        country = Country.objects.create(title='Kenya')
+        JobSeekerProfile.objects.create(user=self.user, country=country)
+        employer = User.objects.create(email='employer@example.com', name='Employer', role='employer')
+        self.job = JobDetails.objects.create(
+            title='Developer', description='Job', user=employer, country=country,
+            deadline=date.today() + timedelta(days=30)
+        )
+
+    def tearDown(self):
+        # Write what the test queued while its transaction is still open.
+        search_document_queue.flush()
+
+    def test_profile_title_refreshes_search_document(self):
+        serializer = CoverLetterSerializers(data={
+            'profile_title': 'Backend Engineer', 'name_or_address': 'Seeker', 'cover_letter': 'Hello',
+            'signature_file': SimpleUploadedFile('signature.gif', b'GIF89a', content_type='image/gif'),
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with self.captureOnCommitCallbacks(execute=True):
+            serializer.save(user=self.user, job_instance=self.job)
+        search_document_queue.flush()
+        self.assertIn('Backend Engineer', CandidateSearchDocument.objects.get(user=self.user).search_text)
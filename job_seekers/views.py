@@ -21,12 +21,12 @@ from core.emails import get_email_object
 from jobs.models import JobDetails, JobSubCategory, JobCategory
 from koor.config.common import Common
 from user_profile.models import JobSeekerProfile
-from users.models import User
+from users.models import User, schedule_search_document
 from employers.models import BlackList
 from .models import (
     EducationRecord, EmploymentRecord, JobSeekerLanguageProficiency,
     JobSeekerSkill, AppliedJob, SavedJob, JobPreferences, CoverLetter,
-    Resume
+    Resume, schedule_rescore
 )
 from .serializers import (
     UpdateAboutSerializers, EducationSerializers, JobSeekerLanguageProficiencySerializers,
@@ -268,7 +268,7 @@ class UploadResumeView(generics.GenericAPIView):
         context = dict()
         if self.request.user.role == "job_seeker":
             profile_instance = get_object_or_404(JobSeekerProfile, user=request.user)
-            serializer = self.serializer_class(data=request.data)
+            serializer = self.serializer_class(data=request.data, context={'user': request.user})
             try:
                 serializer.is_valid(raise_exception=True)
                 serializer.save(user=request.user)
@@ -870,6 +870,13 @@ class SkillsView(generics.GenericAPIView):
                             pass
                     except JobSeekerSkill.DoesNotExist:
                         JobSeekerSkill.objects.create(skill_id=data, user=request.user)
+                if request.data.get('skill_remove'):
+                    # The skills are removed with a queryset `delete()`, an UPDATE of the soft deleted rows that
+                    # sends no signals, see `rescore_applicant_applications`, `refresh_profile_completeness_skills`
+                    # and `refresh_search_document_related`.
+                    schedule_rescore('user', request.user.id)
+                    JobSeekerProfile.refresh_completeness(request.user.id)
+                    schedule_search_document(request.user.id)
                 context["message"] = "Skills added."
                 return response.Response(
                     data=context,
@@ -894,7 +901,50 @@ class SkillsView(generics.GenericAPIView):
             )
 
 
-class JobsApplyView(generics.ListAPIView):
+class ApplyEligibilityMixin:
+    """
+    The checks shared by the views applying a job seeker to a job.
+    """
+
+    def check_apply_eligibility(self, request, jobId):
+        """
+        Return `(job_instance, None)` when the job seeker may apply for the job, or `(job_instance, response)` with
+        the error to answer.
+
+        Whether the employer blacklisted the job seeker and whether the job seeker already applied are `EXISTS`
+        subqueries of the job query, and the completeness is read from the stored `is_complete` and
+        `missing_fields` of the profile, so the checks cost two indexed reads.
+
+        Raises:
+            JobDetails.DoesNotExist: If the job does not exist.
+        """
+        job_instance = JobDetails.objects.annotate(
+            is_blacklisted=Exists(BlackList.objects.filter(user=OuterRef('user'), blacklisted_user=request.user)),
+            is_applied=Exists(AppliedJob.objects.filter(job=OuterRef('pk'), user=request.user)),
+        ).get(id=jobId)
+        if job_instance.is_blacklisted:
+            return job_instance, response.Response(
+                data={"message": ["You are blacklisted for this job."]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if job_instance.is_applied:
+            return job_instance, response.Response(
+                data={"message": ["You are already applied"]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        profile = JobSeekerProfile.objects.filter(user=request.user).values('is_complete', 'missing_fields').first()
+        if not profile or not profile['is_complete']:
+            return job_instance, response.Response(
+                data={
+                    "message": ["Your Profile information is not enough to apply for a job, Please complete your profile."],
+                    "missing_fields": profile['missing_fields'] if profile else ['profile']
+                },
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return job_instance, None
+
+
+class JobsApplyView(ApplyEligibilityMixin, generics.ListAPIView):
     """
     A view for retrieving a list of applied jobs.
 
@@ -971,53 +1021,25 @@ class JobsApplyView(generics.ListAPIView):
         """
 
         context = dict()
-        blacklisted_user = []
         if request.user.role == "job_seeker":
             try:
-                job_instance = JobDetails.objects.get(id=jobId)
-                blacklisted_list = BlackList.objects.filter(user=job_instance.user)
-                for blacklisted_data in blacklisted_list:
-                    blacklisted_user.append(blacklisted_data.blacklisted_user)
-                if request.user in blacklisted_user:
-                    context["message"] = ["You are blacklisted for this job."]
+                job_instance, error_response = self.check_apply_eligibility(request, jobId)
+                if error_response:
+                    return error_response
+                serializer = AppliedJobSerializers(data=request.data, context={'user': request.user})
+                try:
+                    serializer.is_valid(raise_exception=True)
+                    serializer.save(user=request.user, job_instance=job_instance)
+                    context["message"] = ["Applied Successfully"]
                     return response.Response(
                         data=context,
+                        status=status.HTTP_200_OK
+                    )
+                except serializers.ValidationError:
+                    return response.Response(
+                        data=str(serializer.errors),
                         status=status.HTTP_400_BAD_REQUEST
                     )
-                try:
-                    if AppliedJob.objects.get(job=job_instance, user=request.user):
-                        context["message"] = ["You are already applied"]
-                        return response.Response(
-                            data=context,
-                            status=status.HTTP_400_BAD_REQUEST
-                        )
-                except AppliedJob.DoesNotExist:
-                    if request.user.name and request.user.user_profile_jobseekerprofile_user.gender and request.user.user_profile_jobseekerprofile_user.experience and request.user.user_profile_jobseekerprofile_user.dob and request.user.user_profile_jobseekerprofile_user.employment_status and request.user.user_profile_jobseekerprofile_user.country and request.user.user_profile_jobseekerprofile_user.city and request.user.user_profile_jobseekerprofile_user.highest_education:
-                        if JobSeekerSkill.objects.filter(user=request.user).exists():
-                            serializer = AppliedJobSerializers(data=request.data)
-                            try:
-                                serializer.is_valid(raise_exception=True)
-                                serializer.save(user=request.user, job_instance=job_instance)
-                                context["message"] = ["Applied Successfully"]
-                                return response.Response(
-                                    data=context,
-                                    status=status.HTTP_200_OK
-                                )
-                            except serializers.ValidationError:
-                                return response.Response(
-                                    data=str(serializer.errors),
-                                    status=status.HTTP_400_BAD_REQUEST
-                                )
-                        else:
-                            return response.Response(
-                                data={"message": ["Your Profile information is not enough to apply for a job, Please complete your profile."]},
-                                status=status.HTTP_404_NOT_FOUND
-                            )
-                    else:
-                        return response.Response(
-                            data={"message": ["Your Profile information is not enough to apply for a job, Please complete your profile."]},
-                            status=status.HTTP_404_NOT_FOUND
-                        )
             except JobDetails.DoesNotExist:
                 return response.Response(
                     data={"job": "Does Not Exist"},
@@ -1064,7 +1086,7 @@ class JobsApplyView(generics.ListAPIView):
 
         context = dict()
         if self.request.user.role == "job_seeker":
-            serializer = UpdateAppliedJobSerializers(data=request.data)
+            serializer = UpdateAppliedJobSerializers(data=request.data, context={'user': request.user})
             try:
                 job_instance = JobDetails.objects.get(id=jobId)
                 try:
@@ -1206,103 +1228,75 @@ class JobsApplyView(generics.ListAPIView):
         )
 
 
-class JobsApplyByEmailView(generics.GenericAPIView):
+class JobsApplyByEmailView(ApplyEligibilityMixin, generics.GenericAPIView):
     
     permission_classes = [permissions.IsAuthenticated]
     
     def post(self, request, jobId):
         
         context = dict()
-        blacklisted_user = []
         if request.user.role == "job_seeker":
             try:
-                job_instance = JobDetails.objects.get(id=jobId)
-                blacklisted_list = BlackList.objects.filter(user=job_instance.user)
-                for blacklisted_data in blacklisted_list:
-                    blacklisted_user.append(blacklisted_data.blacklisted_user)
-                if request.user in blacklisted_user:
-                    context["message"] = ["You are blacklisted for this job."]
-                    return response.Response(
-                        data=context,
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-                try:
-                    if AppliedJob.objects.get(job=job_instance, user=request.user):
-                        context["message"] = ["You are already applied"]
+                job_instance, error_response = self.check_apply_eligibility(request, jobId)
+                if error_response:
+                    return error_response
+                if job_instance.apply_through_email:
+                    # serializer = AppliedJobSerializers(data=request.data)
+                    # try:
+                    #     serializer.is_valid(raise_exception=True)
+                    #     serializer.save(user=request.user, job_instance=job_instance)
+                    user_email = []
+                    if job_instance.user:
+                        if job_instance.user.email:
+                            user_email.append(job_instance.user.email)
+                    if job_instance.contact_email:
+                        user_email.append(job_instance.contact_email)
+                    if job_instance.cc1:
+                        user_email.append(job_instance.cc1)
+                    if job_instance.cc2:
+                        user_email.append(job_instance.cc2)
+                    if user_email:
+                        email_context = dict()
+                        if job_instance.user:
+                            if job_instance.user.name:
+                                user_name = job_instance.user.name
+                            else:
+                                user_name = user_email[0]
+                        elif job_instance.company:
+                            user_name = job_instance.company
+                        else:
+                            user_name = user_email[0]
+                        email_context["yourname"] = user_name
+                        email_context["username"] = request.user
+                        email_context["resume_link"] = Common.BASE_URL  + "/api/v1/users/job-seeker/resume/user-id?user-id=" + str(request.user.id)
+                        email_context["notification_type"] = "applied job"
+                        email_context["job_instance"] = job_instance
+                        get_email_object(
+                            subject=f'Applied job through email',
+                            email_template_name='email-templates/mail-for-apply-job.html',
+                            context=email_context,
+                            to_email=user_email
+                        )
+                        context["message"] = ["Applied Successfully"]
                         return response.Response(
                             data=context,
-                            status=status.HTTP_400_BAD_REQUEST
+                            status=status.HTTP_200_OK
                         )
-                except AppliedJob.DoesNotExist:
-                    if request.user.name and request.user.user_profile_jobseekerprofile_user.gender and request.user.user_profile_jobseekerprofile_user.experience and request.user.user_profile_jobseekerprofile_user.dob and request.user.user_profile_jobseekerprofile_user.employment_status and request.user.user_profile_jobseekerprofile_user.country and request.user.user_profile_jobseekerprofile_user.city and request.user.user_profile_jobseekerprofile_user.highest_education:
-                        if JobSeekerSkill.objects.filter(user=request.user).exists():
-                            if job_instance.apply_through_email:
-                                # serializer = AppliedJobSerializers(data=request.data)
-                                # try:
-                                #     serializer.is_valid(raise_exception=True)
-                                #     serializer.save(user=request.user, job_instance=job_instance)
-                                user_email = []
-                                if job_instance.user:
-                                    if job_instance.user.email:
-                                        user_email.append(job_instance.user.email)
-                                if job_instance.contact_email:
-                                    user_email.append(job_instance.contact_email)
-                                if job_instance.cc1:
-                                    user_email.append(job_instance.cc1)
-                                if job_instance.cc2:
-                                    user_email.append(job_instance.cc2)
-                                if user_email:
-                                    email_context = dict()
-                                    if job_instance.user:
-                                        if job_instance.user.name:
-                                            user_name = job_instance.user.name
-                                        else:
-                                            user_name = user_email[0]
-                                    elif job_instance.company:
-                                        user_name = job_instance.company
-                                    else:
-                                        user_name = user_email[0]
-                                    email_context["yourname"] = user_name
-                                    email_context["username"] = request.user
-                                    email_context["resume_link"] = Common.BASE_URL  + "/api/v1/users/job-seeker/resume/user-id?user-id=" + str(request.user.id)
-                                    email_context["notification_type"] = "applied job"
-                                    email_context["job_instance"] = job_instance
-                                    get_email_object(
-                                        subject=f'Applied job through email',
-                                        email_template_name='email-templates/mail-for-apply-job.html',
-                                        context=email_context,
-                                        to_email=user_email
-                                    )
-                                    context["message"] = ["Applied Successfully"]
-                                    return response.Response(
-                                        data=context,
-                                        status=status.HTTP_200_OK
-                                    )
-                                else:
-                                    context["message"] = ["Employer email not detected."]
-                                    return response.Response(
-                                        data=context,
-                                        status=status.HTTP_400_BAD_REQUEST
-                                    )
-                                
-                            else:
-                                context["message"] = ["Employer not active apply through email."]
-                                return response.Response(
-                                    data=context,
-                                    status=status.HTTP_400_BAD_REQUEST
-                                )
-                            
-                            
-                        else:
-                            return response.Response(
-                                data={"message": ["Your Profile information is not enough to apply for a job, Please complete your profile."]},
-                                status=status.HTTP_404_NOT_FOUND
-                            )
                     else:
+                        context["message"] = ["Employer email not detected."]
                         return response.Response(
-                            data={"message": ["Your Profile information is not enough to apply for a job, Please complete your profile."]},
-                            status=status.HTTP_404_NOT_FOUND
+                            data=context,
+                            status=status.HTTP_400_BAD_REQUEST
                         )
+                    
+                else:
+                    context["message"] = ["Employer not active apply through email."]
+                    return response.Response(
+                        data=context,
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                
+                
             except JobDetails.DoesNotExist:
                 return response.Response(
                     data={"job": "Does Not Exist"},
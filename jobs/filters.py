@@ -1,4 +1,5 @@
 import django_filters as filters
+from rest_framework.exceptions import ValidationError
 
 from .models import JobDetails
 
@@ -9,7 +10,11 @@ class JobDetailsFilter(filters.FilterSet):
         - `country`: the name of the `country` where the job is located (case-insensitive)
         - `city`: the name of the `city` where the job is located (case-insensitive)
         - `timing`: the `working days` for the job (case-insensitive)
-        - `salary`: the `budget amount` range for the job (inclusive)
+        - `salary`: the salary range for the job (inclusive). The bounds are converted from `salary_currency`
+          (the reference currency if not given) and compared with the normalized salary of the jobs. With a
+          `salary_pay_period` they are annualized and compared with the annual salary, otherwise they are compared
+          with the salary per pay period of every job. A `salary_currency` without an exchange rate is rejected,
+          and jobs in such a currency never match.
 
     Note that not all criteria need to be provided for a query.
 
@@ -23,7 +28,26 @@ class JobDetailsFilter(filters.FilterSet):
     country = filters.CharFilter(field_name='country__title', lookup_expr='iexact')
     city = filters.CharFilter(field_name='city__title', lookup_expr='iexact')
     timing = filters.CharFilter(field_name='duration', lookup_expr='iexact')
-    salary = filters.RangeFilter(field_name='budget_amount', lookup_expr='iexact')
+    salary = filters.RangeFilter(field_name='normalized_salary', method='filter_salary')
     class Meta:
         model = JobDetails
-        fields = ['country', 'city', 'timing', 'salary']
\ No newline at end of file
+        fields = ['country', 'city', 'timing', 'salary']
+
+    def filter_salary(self, queryset, name, value):
+        if not value:
+            return queryset
+        currency = self.data.get('salary_currency')
+        if currency and JobDetails.get_exchange_rate(currency) is None:
+            raise ValidationError({'salary_currency': ['No exchange rate for the currency "{0}".'.format(currency)]})
+        pay_period = self.data.get('salary_pay_period')
+        if not pay_period:
+            queryset = queryset.annotate(period_salary=JobDetails.get_period_salary())
+            name = 'period_salary'
+            pay_period = 'yearly'
+        if value.start is not None:
+            start = JobDetails.normalize_salary(value.start, currency, pay_period)
+            queryset = queryset.filter(**{name + '__gte': start})
+        if value.stop is not None:
+            stop = JobDetails.normalize_salary(value.stop, currency, pay_period)
+            queryset = queryset.filter(**{name + '__lte': stop})
+        return queryset
@@ -0,0 +1,73 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:31
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import uuid
+
+
+def store_category_stats(apps, schema_editor):
+    """
+    Compute the statistics of the existing job categories, like `JobCategoryStats.refresh`.
+    """
+    JobCategory = apps.get_model('jobs', 'JobCategory')
+    JobCategoryStats = apps.get_model('jobs', 'JobCategoryStats')
+    job_counts = JobCategory.objects.annotate(
+        count=models.Count(
+            'jobs_jobdetails_job_category',
+            distinct=True,
+            filter=models.Q(
+                jobs_jobdetails_job_category__is_removed=False,
+                jobs_jobdetails_job_category__status="active"
+            )
+        )
+    ).values_list('id', 'count')
+    talent_counts = dict(JobCategory.objects.annotate(
+        count=models.Count(
+            'jobs_jobsubcategory_categories__job_seekers_categories_categories__user',
+            distinct=True,
+            filter=models.Q(
+                jobs_jobsubcategory_categories__job_seekers_categories_categories__user__job_seekers_jobpreferences_user__display_in_search=True,
+                jobs_jobsubcategory_categories__job_seekers_categories_categories__user__is_active=True,
+                jobs_jobsubcategory_categories__is_removed=False,
+            )
+        )
+    ).values_list('id', 'count'))
+    JobCategoryStats.objects.bulk_create([
+        JobCategoryStats(category_id=category_id, job_count=count, talent_count=talent_counts.get(category_id, 0))
+        for category_id, count in job_counts
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('jobs', '0005_alter_jobdetails_slug'),
+        ('job_seekers', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobCategoryStats',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('id', model_utils.fields.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('job_count', models.PositiveIntegerField(db_column='job_count', default=0, verbose_name='Job Count')),
+                ('talent_count', models.PositiveIntegerField(db_column='talent_count', default=0, verbose_name='Talent Count')),
+                ('category', models.OneToOneField(db_column='category', on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)s_category', to='jobs.jobcategory', verbose_name='Category')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'verbose_name': 'Job Category Stats',
+                'verbose_name_plural': 'Job Category Stats',
+                'db_table': 'JobCategoryStats',
+                'ordering': ['-job_count'],
+            },
+        ),
+        migrations.RunPython(store_category_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:33
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Round
+
+PAY_PERIODS_PER_YEAR = {'yearly': 1, 'quarterly': 4, 'monthly': 12, 'weekly': 52, 'hourly': 2080}
+
+
+def store_normalized_salaries(apps, schema_editor):
+    """
+    Compute `normalized_salary` of the existing jobs with a single UPDATE, like
+    `JobDetails.recompute_normalized_salaries`.
+    """
+    JobDetails = apps.get_model('jobs', 'JobDetails')
+    ExchangeRate = apps.get_model('project_meta', 'ExchangeRate')
+    decimal_field = models.DecimalField(max_digits=19, decimal_places=8)
+    rates = dict(ExchangeRate.objects.values_list('currency', 'rate'))
+    rates[settings.SALARY_REFERENCE_CURRENCY] = Decimal(1)
+    rate = models.Case(
+        models.When(
+            models.Q(budget_currency__isnull=True) | models.Q(budget_currency=''), then=models.Value(Decimal(1))
+        ),
+        *[
+            models.When(budget_currency__iexact=currency, then=models.Value(currency_rate))
+            for currency, currency_rate in rates.items()
+        ],
+        default=models.Value(None),
+        output_field=decimal_field,
+    )
+    annual_amount = models.Case(
+        *[
+            models.When(budget_pay_period=period, then=models.F('budget_amount') * periods)
+            for period, periods in PAY_PERIODS_PER_YEAR.items()
+        ],
+        default=models.F('budget_amount'),
+        output_field=decimal_field,
+    )
+    JobDetails.objects.update(normalized_salary=Round(annual_amount * rate, 2))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_jobcategorystats'),
+        ('project_meta', '0002_exchangerate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobdetails',
+            name='normalized_salary',
+            field=models.DecimalField(blank=True, db_column='normalized_salary', db_index=True, decimal_places=2, max_digits=19, null=True, verbose_name='Normalized Salary'),
+        ),
+        migrations.RunPython(store_normalized_salaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:38
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('jobs', '0008_jobdetails_job_live_deadline_idx_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='jobdetails',
+            index=models.Index(fields=['status', 'deadline', '-created'], name='job_status_deadline_idx'),
+        ),
+    ]
@@ -0,0 +1,15 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:43
+
+from core.identifiers import create_identifier_sequence
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0009_jobdetails_job_status_deadline_idx'),
+    ]
+
+    operations = [
+        create_identifier_sequence('job_identifier_seq'),
+    ]
@@ -1,8 +1,17 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from django.db.models.functions import Round
+from django.dispatch import receiver, Signal
 from django.utils.translation import gettext as _
 
-from random import randint
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
 from django.template.defaultfilters import slugify
+from core.cache import bump_cache_version
+from core.counters import CounterBuffer
+from core.identifiers import next_identifier
+from core.slugs import SlugAllocator
 from core.models import (
     SlugBaseModel, BaseModel, SoftDeleteModel
 )
@@ -10,9 +19,11 @@ from users.models import (
     TimeStampedModel, User
 )
 from project_meta.models import (
-    EducationLevel, Country, City, Language, Skill, Media
+    EducationLevel, Country, City, Language, Skill, Media,
+    ExchangeRate
 )
 from autoslug import AutoSlugField
+from koor.config.common import Common
 
 class JobCategory(SlugBaseModel, TimeStampedModel, models.Model):
     """
@@ -55,12 +66,7 @@ class JobSubCategory(SlugBaseModel, TimeStampedModel, models.Model):
     def save(self, *args, **kwargs):
         if not self.slug or self.title != self._original_title:
             base_slug = slugify(self.title) + "-" + slugify(self.category.title)
-            unique_slug = base_slug
-            counter = 1
-            while JobSubCategory.objects.filter(slug=unique_slug).exclude(pk=self.pk).exists():
-                unique_slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = unique_slug
+            self.slug = SlugAllocator(JobSubCategory.objects.all()).allocate(base_slug, exclude=self.pk)
         return super().save(*args, **kwargs)
 
     def __init__(self, *args, **kwargs):
@@ -77,6 +83,8 @@ class JobDetails(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
     - `budget_currency`: the currency used for the job budget
     - `budget_amount`: the amount of the job budget
     - `budget_pay_period`: the pay period associated with the job budget
+    - `normalized_salary`: the job budget as an annual amount in the reference currency, used to filter and sort
+      by salary. Empty if the budget currency has no exchange rate
     - `description`: a description of the job
     - `country`: the country where the job is located
     - `city`: the city where the job is located
@@ -101,6 +109,14 @@ class JobDetails(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         ('weekly', "Weekly"),
         ('hourly', "Hourly"),
     )
+    # Number of pay periods in a year, used to annualize the budget. A budget without pay period counts as yearly.
+    PAY_PERIODS_PER_YEAR = {
+        'yearly': 1,
+        'quarterly': 4,
+        'monthly': 12,
+        'weekly': 52,
+        'hourly': 2080,
+    }
     STATUS_CHOICE = (
         ('active', "Active"),
         ('inactive', "Inactive"),
@@ -162,6 +178,15 @@ class JobDetails(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         blank=True,
         choices=PAY_PERIOD_CHOICE,
     )
+    normalized_salary = models.DecimalField(
+        max_digits=19,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        db_index=True,
+        verbose_name=_('Normalized Salary'),
+        db_column="normalized_salary",
+    )
     description = models.TextField(
         verbose_name=_('Description'),
         null=True,
@@ -359,19 +384,141 @@ class JobDetails(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         verbose_name_plural = "Job Details"
         db_table = "JobDetails"
         ordering = ['-created']
+        indexes = [
+            # Employer and admin listings filter on any status, so they need a full index.
+            models.Index(fields=['status', 'deadline', '-created'], name='job_status_deadline_idx'),
+            # Partial indexes on the live jobs, which the public listings and the expiry sweeper read.
+            models.Index(
+                fields=['deadline'], name='job_live_deadline_idx',
+                condition=models.Q(status='active', is_removed=False)
+            ),
+            models.Index(
+                fields=['-created'], name='job_live_created_idx',
+                condition=models.Q(status='active', is_removed=False)
+            ),
+        ]
     
     def save(self, *args, **kwargs):
         if not self.job_id:
             self.job_id = unique_job_id()
+        if self.status == 'expired' and self.deadline and self.deadline >= date.today():
+            # The deadline of an expired job was extended, so the job is live again.
+            self.status = 'active'
+        self.normalized_salary = self.get_normalized_salary()
         return super().save(*args, **kwargs)
-    
+
+    def get_normalized_salary(self):
+        """
+        Return the budget as an annual amount in the reference currency, or None if the job has no budget or its
+        currency has no exchange rate.
+        """
+        return self.normalize_salary(self.budget_amount, self.budget_currency, self.budget_pay_period)
+
+    @staticmethod
+    def get_exchange_rate(currency):
+        """
+        Return the value of one unit of `currency` in the reference currency, or None if the currency has no
+        exchange rate. An empty currency is the reference currency.
+        """
+        currency = (currency or Common.SALARY_REFERENCE_CURRENCY).upper()
+        if currency == Common.SALARY_REFERENCE_CURRENCY:
+            return Decimal(1)
+        return ExchangeRate.objects.filter(currency__iexact=currency).values_list('rate', flat=True).first()
+
+    @classmethod
+    def normalize_salary(cls, amount, currency, pay_period):
+        """
+        Convert an amount paid per `pay_period` in `currency` to an annual amount in the reference currency.
+
+        Args:
+            amount (Decimal): The amount per pay period.
+            currency (str): The currency code of the amount. The reference currency if empty.
+            pay_period (str): One of the `PAY_PERIOD_CHOICE` keys. Yearly if empty.
+
+        Returns:
+            Decimal or None: The normalized amount, or None if there is no amount or the currency has no exchange
+            rate.
+        """
+        if amount is None:
+            return None
+        rate = cls.get_exchange_rate(currency)
+        if rate is None:
+            return None
+        periods = cls.PAY_PERIODS_PER_YEAR.get(pay_period, 1)
+        return (Decimal(amount) * periods * rate).quantize(Decimal('0.01'))
+
+    @classmethod
+    def recompute_normalized_salaries(cls, currencies=None):
+        """
+        Recompute the normalized salary of all jobs, or only of the jobs in the given currencies, with a single
+        UPDATE instead of saving every job.
+
+        Args:
+            currencies (iterable): The currency codes to recompute. All currencies if None.
+
+        Returns:
+            int: The number of updated jobs.
+        """
+        decimal_field = models.DecimalField(max_digits=19, decimal_places=8)
+        rates = dict(ExchangeRate.objects.values_list('currency', 'rate'))
+        rates[Common.SALARY_REFERENCE_CURRENCY] = Decimal(1)
+        # As in `normalize_salary`, an empty currency is the reference currency and a currency without an
+        # exchange rate has no normalized salary.
+        rate = models.Case(
+            models.When(
+                models.Q(budget_currency__isnull=True) | models.Q(budget_currency=''), then=models.Value(Decimal(1))
+            ),
+            *[
+                models.When(budget_currency__iexact=currency, then=models.Value(currency_rate))
+                for currency, currency_rate in rates.items()
+            ],
+            default=models.Value(None),
+            output_field=decimal_field,
+        )
+        annual_amount = models.Case(
+            *[
+                models.When(budget_pay_period=period, then=models.F('budget_amount') * periods)
+                for period, periods in cls.PAY_PERIODS_PER_YEAR.items()
+            ],
+            default=models.F('budget_amount'),
+            output_field=decimal_field,
+        )
+        jobs = cls.all_objects.all()
+        if currencies is not None:
+            currency_filter = models.Q(pk__in=[])
+            for currency in currencies:
+                currency_filter |= models.Q(budget_currency__iexact=currency)
+            jobs = jobs.filter(currency_filter)
+        return jobs.update(normalized_salary=Round(annual_amount * rate, 2))
+
+    @classmethod
+    def get_period_salary(cls):
+        """
+        Return an expression of the normalized salary per pay period of the job, i.e. the budget converted to the
+        reference currency but not annualized.
+        """
+        return Round(
+            models.Case(
+                *[
+                    models.When(budget_pay_period=period, then=models.F('normalized_salary') / periods)
+                    for period, periods in cls.PAY_PERIODS_PER_YEAR.items()
+                ],
+                default=models.F('normalized_salary'),
+                output_field=models.DecimalField(max_digits=19, decimal_places=2),
+            ),
+            2
+        )
+
+
+# Postgres sequence the job IDs are allocated from, created by the `0010_job_id_sequence` migration.
+JOB_ID_SEQUENCE = "job_identifier_seq"
+
+
 def unique_job_id():
-    job_id = str(randint(1000, 9999)) + "-" + str(randint(1000, 9999))
-    try:
-        if JobDetails.objects.get(job_id=job_id):
-            return unique_job_id()
-    except JobDetails.DoesNotExist:
-        return job_id
+    """
+    Allocate the next job ID in the format `"XXXX-XXXX"` from the `JOB_ID_SEQUENCE` Postgres sequence.
+    """
+    return next_identifier(JOB_ID_SEQUENCE)
     
 class JobAttachmentsItem(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
     """
@@ -652,6 +799,8 @@ class JobShare(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         db_column="direct_link",
     )
 
+    PLATFORMS = ('whatsapp', 'telegram', 'facebook', 'linked_in', 'mail', 'direct_link')
+
     def __str__(self):
         return str(self.job.title)
 
@@ -660,3 +809,332 @@ class JobShare(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         verbose_name_plural = "Job Shares"
         db_table = "JobShare"
         ordering = ['-created']
+
+    @classmethod
+    def add_shares(cls, shares):
+        """
+        Add the buffered `{(job id, platform): increment}` shares with one `F()` update per job.
+        """
+        updates = defaultdict(dict)
+        for (job_id, platform), increment in shares.items():
+            updates[job_id][platform] = models.F(platform) + increment
+        with transaction.atomic():
+            for job_id, fields in updates.items():
+                cls.objects.filter(job=job_id).update(**fields)
+
+
+# Buffers the shares of `jobs.views.JobShareView`, keyed by `(job id, platform)`.
+job_share_counter = CounterBuffer(JobShare.add_shares)
+
+
+class JobCategoryStats(BaseModel, TimeStampedModel, models.Model):
+    """
+    Materialized statistics of a job category, used by the category landing endpoints.
+
+    The rows are kept up to date by the signal handlers below whenever jobs or job seeker categories change, and
+    are fully rebuilt every night by the `rebuild_category_stats` management command.
+
+    Columns:
+    - `category`: the job category the statistics belong to
+    - `job_count`: the number of active jobs in the category
+    - `talent_count`: the number of active job seekers, visible in search, with a sub category of the category
+    """
+    category = models.OneToOneField(
+        JobCategory,
+        verbose_name=_('Category'),
+        on_delete=models.CASCADE,
+        db_column="category",
+        related_name='%(app_label)s_%(class)s_category'
+    )
+    job_count = models.PositiveIntegerField(
+        verbose_name=_('Job Count'),
+        default=0,
+        db_column="job_count",
+    )
+    talent_count = models.PositiveIntegerField(
+        verbose_name=_('Talent Count'),
+        default=0,
+        db_column="talent_count",
+    )
+
+    def __str__(self):
+        return str(self.category)
+
+    class Meta:
+        verbose_name = "Job Category Stats"
+        verbose_name_plural = "Job Category Stats"
+        db_table = "JobCategoryStats"
+        ordering = ['-job_count']
+
+    @classmethod
+    def refresh(cls, category_ids=None, fields=('job_count', 'talent_count')):
+        """
+        Recompute the statistics of the given job categories (all of them if `category_ids` is None).
+
+        Every requested count is computed with one grouped query restricted to the categories, and the rows are
+        written with a single upsert.
+
+        Args:
+            category_ids (iterable): The IDs of the job categories to refresh.
+            fields (tuple): The counts to recompute.
+
+        Returns:
+            None
+        """
+        categories = JobCategory.objects.all()
+        if category_ids is not None:
+            categories = categories.filter(id__in=list(category_ids))
+        counts = {category_id: dict() for category_id in categories.values_list('id', flat=True)}
+        if not counts:
+            return
+        if 'job_count' in fields:
+            job_counts = categories.annotate(
+                count=models.Count(
+                    'jobs_jobdetails_job_category',
+                    distinct=True,
+                    filter=models.Q(
+                        jobs_jobdetails_job_category__is_removed=False,
+                        jobs_jobdetails_job_category__status="active"
+                    )
+                )
+            ).values_list('id', 'count')
+            for category_id, count in job_counts:
+                counts[category_id]['job_count'] = count
+        if 'talent_count' in fields:
+            talent_counts = categories.annotate(
+                count=models.Count(
+                    'jobs_jobsubcategory_categories__job_seekers_categories_categories__user',
+                    distinct=True,
+                    filter=models.Q(
+                        jobs_jobsubcategory_categories__job_seekers_categories_categories__user__job_seekers_jobpreferences_user__display_in_search=True,
+                        jobs_jobsubcategory_categories__job_seekers_categories_categories__user__is_active=True,
+                        jobs_jobsubcategory_categories__is_removed=False,
+                    )
+                )
+            ).values_list('id', 'count')
+            for category_id, count in talent_counts:
+                counts[category_id]['talent_count'] = count
+        cls.objects.bulk_create(
+            [cls(category_id=category_id, **values) for category_id, values in counts.items()],
+            update_conflicts=True,
+            unique_fields=['category'],
+            update_fields=list(fields),
+        )
+
+
+# Sent by the `expire_listings` command with the `ids` of every batch of jobs it moved to the expired status.
+jobs_expired = Signal()
+
+# Namespace of the versioned job detail cache, see `jobs.views.JobDetailView`.
+JOB_DETAIL_CACHE = "job-detail"
+# Namespace of the anonymous job search cache, see `jobs.views.JobSearchView`.
+JOB_SEARCH_CACHE = "job-search"
+# Namespaces of the cached application pipeline counts, see `jobs.views.JobApplicationsView`.
+JOB_APPLICATION_STATS_CACHE = "job-application-stats"
+EMPLOYER_BLACKLIST_CACHE = "employer-blacklist"
+
+
+@receiver(post_save, sender=JobDetails)
+@receiver(post_delete, sender=JobDetails)
+def invalidate_job_detail(sender, instance, **kwargs):
+    """
+    Signal handler to invalidate the cached detail of a job when the job itself is saved or deleted. It also starts
+    a new generation of the cached job search pages, as a created, updated or expired job changes them.
+
+    Args:
+        sender (Type[JobDetails]): The model class that sent the signal.
+        instance (JobDetails): The job that was saved or deleted.
+        **kwargs: Additional keyword arguments that may be passed by the signal.
+
+    Returns:
+        None
+    """
+    bump_cache_version(JOB_DETAIL_CACHE, instance.id)
+    bump_cache_version(JOB_SEARCH_CACHE)
+
+
+@receiver(post_save, sender=JobAttachmentsItem)
+@receiver(post_delete, sender=JobAttachmentsItem)
+@receiver(post_save, sender=JobsLanguageProficiency)
+@receiver(post_delete, sender=JobsLanguageProficiency)
+@receiver(post_save, sender='job_seekers.AppliedJob')
+@receiver(post_delete, sender='job_seekers.AppliedJob')
+def invalidate_job_detail_related(sender, instance, **kwargs):
+    """
+    Signal handler to invalidate the cached detail of a job when one of its attachments, languages or applications
+    is saved or deleted.
+
+    Args:
+        sender (Type[Model]): The model class that sent the signal.
+        instance (Model): The related row that was saved or deleted.
+        **kwargs: Additional keyword arguments that may be passed by the signal.
+
+    Returns:
+        None
+    """
+    if instance.job_id:
+        bump_cache_version(JOB_DETAIL_CACHE, instance.job_id)
+
+
+@receiver(post_save, sender='job_seekers.AppliedJob')
+@receiver(post_delete, sender='job_seekers.AppliedJob')
+def invalidate_job_application_stats(sender, instance, **kwargs):
+    """
+    Signal handler to invalidate the cached pipeline counts of a job when one of its applications is created,
+    shortlisted, rejected, scheduled for an interview or deleted.
+    """
+    if instance.job_id:
+        bump_cache_version(JOB_APPLICATION_STATS_CACHE, instance.job_id)
+
+
+@receiver(post_save, sender='employers.BlackList')
+@receiver(post_delete, sender='employers.BlackList')
+def invalidate_employer_blacklist(sender, instance, **kwargs):
+    """
+    Signal handler to invalidate the cached blacklisted counts of every job of an employer when the employer
+    blacklists or unblocks a user.
+    """
+    if instance.user_id:
+        bump_cache_version(EMPLOYER_BLACKLIST_CACHE, instance.user_id)
+
+
+@receiver(post_save, sender=Media)
+@receiver(pre_delete, sender=Media)
+def invalidate_job_detail_company_logo(sender, instance, **kwargs):
+    """
+    Signal handler to invalidate the cached detail of a job when its company logo is saved or deleted, e.g. when
+    the file of the logo is moved. Deletes are handled before the `SET_NULL` update of the job, which sends no
+    `post_save`.
+
+    Args:
+        sender (Type[Media]): The model class that sent the signal.
+        instance (Media): The media that was saved or is deleted.
+        **kwargs: Additional keyword arguments that may be passed by the signal.
+
+    Returns:
+        None
+    """
+    for job_id in JobDetails.all_objects.filter(company_logo=instance).values_list('id', flat=True):
+        bump_cache_version(JOB_DETAIL_CACHE, job_id)
+
+
+@receiver(m2m_changed, sender=JobDetails.job_category.through)
+@receiver(m2m_changed, sender=JobDetails.job_sub_category.through)
+@receiver(m2m_changed, sender=JobDetails.skill.through)
+def invalidate_job_detail_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Signal handler to invalidate the cached detail of a job when its categories, sub categories or skills change.
+
+    Args:
+        sender (Type[Model]): The intermediate model of the many-to-many relation.
+        instance (Model): The job, or the category/skill when the relation is changed from the reverse side.
+        action (str): The type of update that was done on the relation.
+        reverse (bool): Whether the relation was changed from the reverse side.
+        pk_set (set): The primary keys added to or removed from the relation.
+        **kwargs: Additional keyword arguments that may be passed by the signal.
+
+    Returns:
+        None
+    """
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        bump_cache_version(JOB_DETAIL_CACHE, instance.id)
+    elif pk_set:
+        for job_id in pk_set:
+            bump_cache_version(JOB_DETAIL_CACHE, job_id)
+
+
+def refresh_job_category_stats(category_ids, fields=('job_count', 'talent_count')):
+    """
+    Refresh the `JobCategoryStats` of the given categories once the current transaction commits.
+    """
+    category_ids = set(category_ids)
+    if category_ids:
+        transaction.on_commit(lambda: JobCategoryStats.refresh(category_ids, fields))
+
+
+@receiver(post_save, sender=JobCategory)
+def create_job_category_stats(sender, instance, created, **kwargs):
+    """
+    Signal handler to create the (empty) statistics row of a new job category.
+    """
+    if created:
+        JobCategoryStats.objects.get_or_create(category=instance)
+
+
+@receiver(post_save, sender=JobDetails)
+def update_job_category_stats(sender, instance, created, **kwargs):
+    """
+    Signal handler to refresh the job counts of the categories of an updated job, as its status or removal may
+    have changed. New jobs are counted when their categories are added (see `update_job_category_stats_m2m`).
+    """
+    if not created:
+        refresh_job_category_stats(instance.job_category.values_list('id', flat=True), ('job_count',))
+
+
+@receiver(m2m_changed, sender=JobDetails.job_category.through)
+def update_job_category_stats_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Signal handler to refresh the job counts of the categories that were added to or removed from a job.
+    """
+    if reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            refresh_job_category_stats([instance.id], ('job_count',))
+    elif action == "pre_clear":
+        instance._cleared_job_category_ids = list(instance.job_category.values_list('id', flat=True))
+    elif action == "post_clear":
+        refresh_job_category_stats(getattr(instance, '_cleared_job_category_ids', []), ('job_count',))
+    elif action in ("post_add", "post_remove"):
+        refresh_job_category_stats(pk_set or [], ('job_count',))
+
+
+@receiver(post_save, sender='job_seekers.Categories')
+@receiver(post_delete, sender='job_seekers.Categories')
+def update_talent_category_stats(sender, instance, **kwargs):
+    """
+    Signal handler to refresh the talent count of a category when a job seeker adds or removes one of its sub
+    categories.
+    """
+    refresh_job_category_stats(
+        JobSubCategory.objects.filter(id=instance.category_id).values_list('category', flat=True),
+        ('talent_count',)
+    )
+
+
+@receiver(post_save, sender='job_seekers.JobPreferences')
+def update_talent_category_stats_preferences(sender, instance, created, **kwargs):
+    """
+    Signal handler to refresh the talent counts of the categories of a job seeker when the job preferences, which
+    hold the visibility of the job seeker in search, are saved.
+    """
+    refresh_job_category_stats(
+        JobSubCategory.objects.filter(
+            job_seekers_categories_categories__user=instance.user_id
+        ).values_list('category', flat=True),
+        ('talent_count',)
+    )
+
+
+@receiver(post_save, sender=ExchangeRate)
+@receiver(post_delete, sender=ExchangeRate)
+def update_normalized_salaries(sender, instance, **kwargs):
+    """
+    Signal handler to recompute the normalized salary of the jobs in a currency when its exchange rate changes.
+    """
+    transaction.on_commit(lambda: JobDetails.recompute_normalized_salaries([instance.currency]))
+
+
+@receiver(jobs_expired)
+def invalidate_expired_jobs(sender, ids, **kwargs):
+    """
+    Signal handler for a batch of expired jobs. The sweeper updates the jobs in bulk without `post_save`, so the
+    cached details, the cached search pages and the category statistics are invalidated here.
+    """
+    for job_id in ids:
+        bump_cache_version(JOB_DETAIL_CACHE, job_id)
+    bump_cache_version(JOB_SEARCH_CACHE)
+    refresh_job_category_stats(
+        JobDetails.job_category.through.objects.filter(jobdetails__in=ids).values_list('jobcategory', flat=True),
+        ('job_count',)
+    )
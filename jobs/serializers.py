@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from collections import defaultdict
 from datetime import date
 from django.db.models import Q
 
@@ -19,6 +20,7 @@ from project_meta.serializers import (
     SkillSerializer, HighestEducationSerializer
 )
 
+from users.loaders import load_applicant_bundles
 from users.serializers import UserSerializer, ApplicantDetailSerializers
 
 
@@ -289,7 +291,11 @@ class GetJobsSerializers(serializers.ModelSerializer):
 
     def get_company_logo(self, obj):
         if obj.company_logo:
-            return {'id':str(obj.company_logo.id), 'path':obj.company_logo.file_path.url}
+            # List cards only need the small WebP variant, the original stays available as `original`.
+            return {
+                'id': str(obj.company_logo.id), 'path': obj.company_logo.get_variant_url('card_webp'),
+                'original': obj.company_logo.file_path.url
+            }
         return None
 
     def get_country(self, obj):
@@ -905,7 +911,8 @@ class AppliedJobSerializers(serializers.ModelSerializer):
 
     The `get_user`, `get_education`, `get_language`, and `get_skill` methods are used
     to customize the serialization of the `user`, `education`, `language`, and `skill` fields,
-    respectively.
+    respectively. They read the rows loaded by `get_page_context` for a page of applications when the view passes
+    them in the context, and query per application otherwise.
 
     """
     user = serializers.SerializerMethodField()
@@ -921,6 +928,36 @@ class AppliedJobSerializers(serializers.ModelSerializer):
             'short_letter', 'user', 'education', 'language', 'skill', 'job'
         ]
 
+    @classmethod
+    def get_page_context(cls, applications):
+        """
+        Return the serializer context for a page of applications: the applicant bundles (see `users.loaders`) and
+        the required languages and skills of their jobs, with one query per relation whatever the page size. The
+        applications should come with `select_related('user__image', 'job')`.
+        """
+        job_ids = {application.job_id for application in applications}
+        job_languages = defaultdict(set)
+        for job_id, language_id in JobsLanguageProficiency.objects.filter(job__in=job_ids).values_list(
+                'job', 'language'
+        ):
+            job_languages[job_id].add(language_id)
+        job_skills = defaultdict(set)
+        for job_id, skill_id in JobDetails.skill.through.objects.filter(jobdetails__in=job_ids).values_list(
+                'jobdetails', 'skill'
+        ):
+            job_skills[job_id].add(skill_id)
+        return {
+            'applicants': load_applicant_bundles(
+                {application.user for application in applications},
+                ('profile', 'education_records', 'languages', 'skills', 'blacklist')
+            ),
+            'job_languages': job_languages,
+            'job_skills': job_skills,
+        }
+
+    def get_applicant_bundle(self, obj):
+        return (self.context.get('applicants') or {}).get(obj.user_id)
+
     def get_user(self, obj):
         """
         A method for customizing the serialization of the `user` field.
@@ -936,7 +973,7 @@ class AppliedJobSerializers(serializers.ModelSerializer):
 
         """
         context = {}
-        get_data = UserSerializer(obj.user)
+        get_data = UserSerializer(obj.user, context=self.context)
         if get_data.data:
             context = get_data.data
         return context
@@ -955,6 +992,11 @@ class AppliedJobSerializers(serializers.ModelSerializer):
             - A boolean value indicating whether the job seeker has the required education level.
 
         """
+        bundle = self.get_applicant_bundle(obj)
+        if bundle:
+            return any(
+                record.education_level_id == obj.job.highest_education_id for record in bundle.education_records
+            )
         education_record = EducationRecord.objects.filter(
             user=obj.user,
             education_level=obj.job.highest_education
@@ -976,6 +1018,10 @@ class AppliedJobSerializers(serializers.ModelSerializer):
             languages for the job.
 
         """
+        bundle = self.get_applicant_bundle(obj)
+        if bundle:
+            job_languages = self.context['job_languages'][obj.job_id]
+            return any(language.language_id in job_languages for language in bundle.languages)
         language_list = []
         data = JobsLanguageProficiency.objects.filter(job=obj.job)
         for get_data in data:
@@ -1001,6 +1047,10 @@ class AppliedJobSerializers(serializers.ModelSerializer):
             skills for the job.
 
         """
+        bundle = self.get_applicant_bundle(obj)
+        if bundle:
+            job_skills = self.context['job_skills'][obj.job_id]
+            return any(skill.skill_id in job_skills for skill in bundle.skills)
         skill_record = JobSeekerSkill.objects.filter(
             user=obj.user,
             skill__in=obj.job.skill.all()
@@ -1,3 +1,114 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.template.defaultfilters import slugify
 from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework.exceptions import ValidationError
+
+from core.slugs import backfill_slugs
+from project_meta.models import Country, ExchangeRate
+from users.models import User
+
+from .filters import JobDetailsFilter
+from .models import JobDetails
+
+
+class SalaryFilterTests(TestCase):
+    """
+    Tests of the normalized salary used by the `salary` filter of `JobDetailsFilter`.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(email='employer@example.com', name='Employer', role='employer')
+        self.country = Country.objects.create(title='Kenya')
+
+    def create_job(self, title, amount, currency, pay_period='yearly'):
+        return JobDetails.objects.create(
+            title=title, description='Job', user=self.user, country=self.country,
+            deadline=date.today() + timedelta(days=30), budget_amount=amount, budget_currency=currency,
+            budget_pay_period=pay_period
+        )
+
+    def filter_titles(self, data):
+        return sorted(JobDetailsFilter(data, queryset=JobDetails.objects.all()).qs.values_list('title', flat=True))
+
+    def test_bounds_without_pay_period_match_the_job_period(self):
+        self.create_job('monthly', 1000, 'KES', 'monthly')
+        self.create_job('yearly', 1000, 'KES')
+        self.assertEqual(self.filter_titles({'salary_min': 500, 'salary_max': 1500}), ['monthly', 'yearly'])
+        data = {'salary_min': 10000, 'salary_max': 15000, 'salary_pay_period': 'yearly'}
+        self.assertEqual(self.filter_titles(data), ['monthly'])
+
+    def test_filter_bounds_are_converted_from_salary_currency(self):
+        ExchangeRate.objects.create(currency='USD', rate=Decimal('130'))
+        self.create_job('kes', 100000, 'KES')
+        self.create_job('usd', 1000, 'USD')
+        self.assertEqual(self.filter_titles({'salary_max': 900, 'salary_currency': 'usd'}), ['kes'])
+        self.assertEqual(self.filter_titles({'salary_min': 120000}), ['usd'])
+
+    def test_currency_without_rate_is_excluded(self):
+        self.create_job('kes', 1000, 'KES')
+        self.create_job('usd', 1000, 'USD')
+        self.assertEqual(self.filter_titles({'salary_min': 10}), ['kes'])
+        with self.assertRaises(ValidationError):
+            self.filter_titles({'salary_min': 10, 'salary_currency': 'USD'})
+
+    def test_recompute_matches_save(self):
+        jobs = [
+            self.create_job('empty', 100, ''),
+            self.create_job('none', 100, None, 'monthly'),
+            self.create_job('kes', 100, 'KES', 'weekly'),
+            self.create_job('usd', 100, 'USD'),
+        ]
+        saved = {job.id: job.normalized_salary for job in jobs}
+        JobDetails.objects.update(normalized_salary=None)
+        JobDetails.recompute_normalized_salaries()
+        self.assertEqual(dict(JobDetails.objects.values_list('id', 'normalized_salary')), saved)
+
+
+class BackfillSlugsTests(TestCase):
+    """
+    Tests of `core.slugs.backfill_slugs` on jobs.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(email='employer@example.com', name='Employer', role='employer')
+        self.country = Country.objects.create(title='Kenya')
+
+    def test_suffixed_slug_and_plain_slug_do_not_collide(self):
+        jobs = [
+            JobDetails.objects.create(
+                title=title, description='Job', user=self.user, country=self.country, deadline=date.today()
+            )
+            for title in ('Foo', 'Foo', 'Foo 1')
+        ]
+        for offset, job in enumerate(jobs):
+            JobDetails.objects.filter(id=job.id).update(created=date(2024, 1, 1) + timedelta(days=offset))
+        backfill_slugs(JobDetails.objects.all(), lambda job: slugify(job.title))
+        slugs = [JobDetails.objects.get(id=job.id).slug for job in jobs]
+        self.assertEqual(slugs, ['foo', 'foo-1', 'foo-1-1'])
+
+
+class JobDetailViewTests(TestCase):
+    """
+    Tests of the cached payload of `JobDetailView`.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(email='employer@example.com', name='Employer', role='employer')
+        self.job = JobDetails.objects.create(
+            title='Developer', description='Job', user=self.user, country=Country.objects.create(title='Kenya'),
+            deadline=date.today() + timedelta(days=30)
+        )
+        self.client = APIClient()
 
-# Create your tests here.
+    def test_employer_is_read_per_request(self):
+        response = self.client.get('/api/v1/jobs/{0}'.format(self.job.slug))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['user']['name'], 'Employer')
+        User.objects.filter(id=self.user.id).update(name='Renamed')
+        response = self.client.get('/api/v1/jobs/{0}'.format(self.job.slug))
+        self.assertEqual(response.data['user']['name'], 'Renamed')
@@ -2,7 +2,7 @@ from django.urls import path
 
 from .views import (
     JobSearchView, JobDetailView, JobApplicationsView,
-    RecentApplicationsView, ApplicationsDetailView, JobSuggestionView,
+    RecentApplicationsView, ApplicationsDetailView, BulkApplicationsView, JobSuggestionView,
     JobFilterView, JobShareView, JobCategoryView,
     PopularJobCategoryView, DownloadImage
 )
@@ -16,6 +16,7 @@ urlpatterns = [
     path('/download-image', DownloadImage.as_view(), name='download_image'),
     
     path('/applications', RecentApplicationsView.as_view(), name="recent_applications"),
+    path('/applications/bulk/<str:action>', BulkApplicationsView.as_view(), name="bulk_applications"),
     
     path('/filter', JobFilterView.as_view(), name="job_filter"),
     path('/filter/<str:filterId>', JobFilterView.as_view(), name="job_filter"),
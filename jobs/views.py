@@ -1,7 +1,11 @@
+from django.core.cache import cache
+from django.http import Http404
+from django.db import transaction
 from django.db.models import (
     Value, F, Case, When, IntegerField, Q,
-    Count
+    Count, Exists, OuterRef, Subquery, CharField
 )
+from django.db.models.functions import Cast, Coalesce
 
 
 from rest_framework import (
@@ -9,22 +13,29 @@ from rest_framework import (
     permissions, filters, serializers
 )
 
+import uuid
 from datetime import datetime, date
+from urllib.parse import unquote, urlparse
+from koor.config.common import Common
 
 from django_filters import rest_framework as django_filters
 
-from core.emails import get_email_object
+from core.cache import get_cache_version, bump_cache_version, AnonymousListCacheMixin
+from core.emails import get_email_object, queue_email_batch
+from core.media import serve_media
 from core.pagination import CustomPagination
 
 from jobs.models import (
     JobDetails, JobFilters, JobShare,
-    JobCategory, JobSubCategory
+    JobSubCategory, JobCategoryStats,
+    JOB_DETAIL_CACHE, JOB_SEARCH_CACHE, JOB_APPLICATION_STATS_CACHE,
+    EMPLOYER_BLACKLIST_CACHE, job_share_counter
 )
 from tenders.models import (
-    TenderCategory
+    TenderCategoryStats
 )
 
-from job_seekers.models import AppliedJob
+from job_seekers.models import AppliedJob, SavedJob
 from jobs.serializers import (
     GetAppliedJobsSerializers, JobCategorySerializer
 )
@@ -32,6 +43,8 @@ from jobs.serializers import (
 from notification.models import Notification
 
 from employers.models import BlackList
+from users.models import User
+from users.serializers import UserSerializer
 
 from .serializers import (
     GetJobsSerializers,
@@ -44,7 +57,7 @@ from .serializers import (
 from .filters import JobDetailsFilter
 
 
-class JobSearchView(generics.ListAPIView):
+class JobSearchView(AnonymousListCacheMixin, generics.ListAPIView):
     """
     A view for searching and filtering job details.
 
@@ -62,9 +75,14 @@ class JobSearchView(generics.ListAPIView):
         - `filterset_class`: A Django FilterSet class used for filtering the queryset.
         - `search_fields`: A list of fields that can be searched for a given query.
         - `pagination_class`: A Django Rest Framework pagination class for paginating the results of the view.
+        - `cache_namespace`: The generation counter of the cached anonymous responses, bumped by `JobDetails`
+                             changes.
 
     Methods:
-        - `list(self, request)`: Returns a paginated list of job details that match the specified criteria.
+        - `list(self, request)`: Returns a paginated list of job details that match the specified criteria. With
+                                 `facets=true` the response also contains the facet counts of the result.
+        - `get_facets(self, queryset)`: Returns the category, sub category, country, city and employment type
+                                        counts of the filtered jobs.
 
     Returns:
         - A paginated list of job details that match the specified criteria.
@@ -85,6 +103,8 @@ class JobSearchView(generics.ListAPIView):
     #     'country__title', 'city__title', 'user__name'
     # ]
     pagination_class = CustomPagination
+    cache_namespace = JOB_SEARCH_CACHE
+    cache_timeout = Common.SEARCH_CACHE_TIMEOUT
 
     def list(self, request):
         """
@@ -134,10 +154,80 @@ class JobSearchView(generics.ListAPIView):
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True, context=context)
-            return self.get_paginated_response(serializer.data)
+            paginated_response = self.get_paginated_response(serializer.data)
+            if request.GET.get('facets'):
+                paginated_response.data['facets'] = self.get_facets(queryset)
+            return paginated_response
         serializer = self.get_serializer(queryset, many=True, context=context)
         return response.Response(serializer.data)
 
+    def get_facets(self, queryset):
+        """
+        Return the facet counts of the filtered job search result.
+
+        The counts are computed for the category, sub category, country, city and employment type of the jobs in
+        `queryset`. Every facet is a grouped aggregation over the IDs of the filtered jobs, and all of them are
+        combined with `UNION ALL`, so the counts cost a single extra query.
+
+        Args:
+            queryset: The filtered `JobDetails` queryset of the search.
+
+        Returns:
+            A dictionary with one list of `{id, title, count}` items per facet.
+        """
+
+        job_ids = queryset.order_by().values('id')
+        facet_queries = []
+        for facet, through, column in (
+            ('category', JobDetails.job_category.through, 'jobcategory'),
+            ('sub_category', JobDetails.job_sub_category.through, 'jobsubcategory'),
+        ):
+            facet_queries.append(
+                through.objects.filter(jobdetails__in=job_ids).annotate(
+                    facet=Value(facet),
+                    facet_id=Cast(column, CharField()),
+                    facet_title=F(column + '__title'),
+                ).values('facet', 'facet_id', 'facet_title').annotate(
+                    count=Count('jobdetails', distinct=True)
+                ).order_by()
+            )
+        for facet in ('country', 'city'):
+            facet_queries.append(
+                JobDetails.objects.filter(id__in=job_ids, **{facet + '__isnull': False}).annotate(
+                    facet=Value(facet),
+                    facet_id=Cast(facet, CharField()),
+                    facet_title=F(facet + '__title'),
+                ).values('facet', 'facet_id', 'facet_title').annotate(
+                    count=Count('id')
+                ).order_by()
+            )
+        for field, key, title in (
+            ('is_full_time', 'full_time', 'Full Time'),
+            ('is_part_time', 'part_time', 'Part Time'),
+            ('has_contract', 'contract', 'Contract'),
+        ):
+            facet_queries.append(
+                JobDetails.objects.filter(id__in=job_ids, **{field: True}).annotate(
+                    facet=Value('employment_type'),
+                    facet_id=Value(key),
+                    facet_title=Value(title),
+                ).values('facet', 'facet_id', 'facet_title').annotate(
+                    count=Count('id')
+                ).order_by()
+            )
+        facets = {
+            'category': [], 'sub_category': [], 'country': [],
+            'city': [], 'employment_type': []
+        }
+        for row in facet_queries[0].union(*facet_queries[1:], all=True):
+            if row['count']:
+                facets[row['facet']].append(
+                    {'id': row['facet_id'], 'title': row['facet_title'], 'count': row['count']}
+                )
+        for facet_items in facets.values():
+            facet_items.sort(key=lambda item: (-item['count'], item['title'] or ''))
+        return facets
+
     def get_queryset(self, **kwargs):
         """
         Returns the queryset of applied jobs for the authenticated user.
@@ -153,16 +243,18 @@ class JobSearchView(generics.ListAPIView):
             order.
         """
         order_by = None
-        filters = Q(is_removed=False)
+        filters = Q(is_removed=False, status="active")
         if 'filter_by' in self.request.GET:
             filter_by = self.request.GET['filter_by']
             if filter_by == "active": filters = filters & Q(deadline__gte=date.today())
-            if filter_by == 'expired': filters = filters & Q(deadline__lt=date.today())
+            if filter_by == 'expired':
+                # Jobs past their deadline are moved to the expired status by the `expire_listings` command.
+                filters = Q(is_removed=False, status__in=["active", "expired"], deadline__lt=date.today())
 
         if 'search_by' in self.request.GET:
             search_by = self.request.GET['search_by']
             if search_by == 'salary':
-                order_by = 'budget_amount'
+                order_by = 'normalized_salary'
             elif search_by == 'expiration':
                 order_by = 'deadline'
             elif search_by == 'created_at':
@@ -170,36 +262,26 @@ class JobSearchView(generics.ListAPIView):
             if order_by:
                 if 'order_by' in self.request.GET:
                     if 'descending' in self.request.GET['order_by']:
-                        return JobDetails.objects.filter(
-                            # deadline__gte=date.today(),
-                            # is_removed=False,
-                            status="active"
-                        ).filter(filters).order_by("-" + str(order_by), '-created')
+                        return JobDetails.objects.filter(filters).order_by("-" + str(order_by), '-created')
                     else:
-                        return JobDetails.objects.filter(
-                            # deadline__gte=date.today(),
-                            # is_removed=False,
-                            status="active"
-                        ).filter(filters).order_by(str(order_by), 'created')
+                        return JobDetails.objects.filter(filters).order_by(str(order_by), 'created')
                 else:
-                    return JobDetails.objects.filter(
-                        # deadline__gte=date.today(),
-                        # is_removed=False,
-                        status="active"
-                    ).filter(filters).order_by(str(order_by, 'created'))
-        return JobDetails.objects.filter(
-            # deadline__gte=date.today(),
-            # is_removed=False,
-            status="active"
-        ).filter(filters)
+                    return JobDetails.objects.filter(filters).order_by(str(order_by), 'created')
+        return JobDetails.objects.filter(filters)
 
 
 class JobDetailView(generics.GenericAPIView):
     """
     A view that returns a serialized JobDetail object for a given jobId.
 
+    The user independent part of the response is cached per job under a version that is bumped whenever the job,
+    its attachments, languages, categories, skills or applications change (see the signal handlers in
+    `jobs.models`). The employer who posted the job is read per request, as its profile is not part of that
+    version. Authenticated requests add their own application state on top of the cached payload with a single
+    query.
+
     Parameters:
-        - jobId (int): The ID of the job to retrieve details for.
+        - jobId (str): The slug or the ID of the job to retrieve details for.
 
     Returns:
         - data (dict): A dictionary containing the serialized job details.
@@ -211,34 +293,144 @@ class JobDetailView(generics.GenericAPIView):
 
     def get(self, request, jobId):
         response_context = dict()
-        context = dict()
         try:
-            if request.user.is_authenticated:
-                context = {"user": request.user}
             if jobId:
-                try:
-                    job_data = JobDetails.objects.get(slug=jobId)
-                except JobDetails.DoesNotExist:
-                    try:
-                        job_data = JobDetails.objects.get(id=jobId)
-                    except JobDetails.DoesNotExist:
-                        return response.Response(
-                            data={"job": "Does Not Exist"},
-                            status=status.HTTP_404_NOT_FOUND
-                        )
-                get_data = self.serializer_class(job_data, context=context)
-                response_context = get_data.data
+                response_context = self.get_cached_detail(jobId)
+                if response_context is None:
+                    return response.Response(
+                        data={"job": "Does Not Exist"},
+                        status=status.HTTP_404_NOT_FOUND
+                    )
+                response_context['user'] = self.get_employer_detail(response_context['user'])
+                if request.user.is_authenticated:
+                    response_context.update(self.get_user_detail(response_context['id'], request.user))
             return response.Response(
                 data=response_context,
                 status=status.HTTP_200_OK
             )
         except Exception as e:
-            response_context["message"] = str(e)
+            response_context = {"message": str(e)}
             return response.Response(
                 data=response_context,
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+    def get_cached_detail(self, job_lookup):
+        """
+        Return the user independent detail of a job, looked up by slug and then by ID.
+
+        The lookup value is mapped to the job ID in the cache, so a cache hit resolves both the job and its
+        payload without a query. A payload is only reused if it still matches the lookup value, which covers
+        slugs that changed together with the job title.
+
+        Args:
+            job_lookup (str): The slug or the ID of the job.
+
+        Returns:
+            dict or None: The serialized job detail, or None if no job matches the lookup value.
+        """
+
+        lookup_key = 'job-detail-lookup:{0}'.format(job_lookup)
+        job_id = cache.get(lookup_key)
+        if job_id:
+            detail = cache.get(self.get_cache_key(job_id))
+            if detail and job_lookup in (detail['slug'], str(detail['id'])):
+                return detail
+        job_data = self.get_job(job_lookup)
+        if not job_data:
+            return None
+        cache_key = self.get_cache_key(job_data.id)
+        detail = dict(self.serializer_class(job_data).data)
+        # The employer block changes with the employer's own profile, so only its ID is cached, see
+        # `get_employer_detail`.
+        detail['user'] = job_data.user_id
+        cache.set(cache_key, detail, Common.JOB_DETAIL_CACHE_TIMEOUT)
+        cache.set(lookup_key, job_data.id, Common.JOB_DETAIL_CACHE_TIMEOUT)
+        return detail
+
+    def get_cache_key(self, job_id):
+        version = get_cache_version(JOB_DETAIL_CACHE, job_id)
+        return 'job-detail:{0}:{1}'.format(job_id, version)
+
+    def get_job(self, job_lookup):
+        queryset = JobDetails.objects.select_related(
+            'user', 'country', 'city', 'highest_education', 'company_logo'
+        ).prefetch_related('job_category', 'job_sub_category', 'skill')
+        job_data = queryset.filter(slug=job_lookup).first()
+        if not job_data:
+            try:
+                job_data = queryset.filter(id=uuid.UUID(str(job_lookup))).first()
+            except ValueError:
+                job_data = None
+        return job_data
+
+    def get_employer_detail(self, employer_id):
+        """
+        Return the `user` field of the job detail, the employer who posted the job.
+
+        It is serialized per request like `get_user_detail`, the employer's name, image, profile and online state
+        are not tracked by the job detail cache version.
+
+        Args:
+            employer_id (UUID): The ID of the employer, as cached by `get_cached_detail`.
+
+        Returns:
+            dict: The serialized employer, or an empty dictionary if the job has no employer.
+        """
+
+        employer = User.objects.select_related('image').filter(id=employer_id).first() if employer_id else None
+        if not employer:
+            return dict()
+        return UserSerializer(employer).data
+
+    def get_user_detail(self, job_id, user):
+        """
+        Return the fields of the job detail that depend on the requesting user.
+
+        All of them are read in one query: the application of the user is joined in through correlated
+        subqueries and the saved state through an EXISTS.
+
+        Args:
+            job_id (UUID): The ID of the job.
+            user (User): The authenticated user.
+
+        Returns:
+            dict: The `is_applied`, `application`, `is_saved`, `is_editable`, `is_rejected`, `is_shortlisted`
+            and `interview_at` fields of `GetJobsDetailSerializers`.
+        """
+
+        applications = AppliedJob.objects.filter(job=OuterRef('pk'), user=user)
+        record = JobDetails.objects.filter(id=job_id).annotate(
+            application_id=Subquery(applications.values('id')[:1]),
+            application_created=Subquery(applications.values('created')[:1]),
+            application_shortlisted_at=Subquery(applications.values('shortlisted_at')[:1]),
+            application_rejected_at=Subquery(applications.values('rejected_at')[:1]),
+            application_interview_at=Subquery(applications.values('interview_at')[:1]),
+            is_saved=Exists(SavedJob.objects.filter(job=OuterRef('pk'), user=user)),
+        ).values(
+            'application_id', 'application_created', 'application_shortlisted_at',
+            'application_rejected_at', 'application_interview_at', 'is_saved'
+        ).first() or dict()
+        is_applied = record.get('application_id') is not None
+        application = dict()
+        is_editable = False
+        if is_applied:
+            application = {'id': record['application_id'], 'created': record['application_created']}
+            is_editable = (
+                record['application_shortlisted_at'] is None
+                and record['application_rejected_at'] is None
+                and record['application_created'].date() >= date.today()
+            )
+        return {
+            'is_applied': is_applied,
+            'application': application,
+            'is_saved': record.get('is_saved', False),
+            'is_editable': is_editable,
+            'is_rejected': record.get('application_rejected_at') is not None,
+            'is_shortlisted': record.get('application_shortlisted_at') is not None,
+            'interview_at': record.get('application_interview_at'),
+        }
+
 
 class JobApplicationsView(generics.ListAPIView):
     """
@@ -268,31 +460,25 @@ class JobApplicationsView(generics.ListAPIView):
                 job_instance = JobDetails.objects.get(id=jobId, user=request.user)
                 filters = Q(job=job_instance)
                 filter_list = self.request.GET.getlist('filter')
-                blacklisted_user_list = []
-                for data in BlackList.objects.all():
-                    blacklisted_user_list.append(data.blacklisted_user)
+                # Semi-join on the blacklist of this employer, `BlackList` is never loaded into Python.
+                blacklisted = Exists(BlackList.objects.filter(user=request.user, blacklisted_user=OuterRef('user')))
                 for filter_data in filter_list:
                     if filter_data == "rejected": filters = filters & ~Q(rejected_at=None)
                     if filter_data == "shortlisted": filters = filters & ~Q(shortlisted_at=None)
                     if filter_data == "planned_interviews": filters = filters & ~Q(interview_at=None)
-                    if filter_data == "blacklisted": filters = filters & Q(user__in=blacklisted_user_list)
-                queryset = self.filter_queryset(AppliedJob.objects.filter(filters))
+                    if filter_data == "blacklisted": filters = filters & Q(blacklisted)
+                queryset = AppliedJob.objects.filter(filters)
+                if self.request.GET.get('sort') == 'relevance':
+                    AppliedJob.score_unscored(queryset)
+                    queryset = queryset.order_by('-relevance_score', '-created')
+                queryset = self.filter_queryset(queryset.select_related('user__image', 'job'))
                 page = self.paginate_queryset(queryset)
                 if page is not None:
-                    serializer = self.get_serializer(page, many=True, context={"request": request})
+                    serializer = self.get_serializer(
+                        page, many=True, context={"request": request, **self.serializer_class.get_page_context(page)}
+                    )
                     serialized_response = self.get_paginated_response(serializer.data)
-                    serialized_response.data['rejected_count'] = AppliedJob.objects.filter(job=job_instance).filter(
-                        ~Q(rejected_at=None)).count()
-                    serialized_response.data['shortlisted_count'] = AppliedJob.objects.filter(job=job_instance).filter(
-                        ~Q(shortlisted_at=None)).count()
-                    serialized_response.data['planned_interview_count'] = AppliedJob.objects.filter(
-                        job=job_instance).filter(~Q(interview_at=None)).count()
-                    user_list = []
-                    for data in AppliedJob.objects.filter(job=job_instance):
-                        user_list.append(data.user)
-                    serialized_response.data['blacklisted_count'] = BlackList.objects.filter(
-                        blacklisted_user__in=user_list).order_by('blacklisted_user').distinct(
-                        'blacklisted_user').count()
+                    serialized_response.data.update(self.get_pipeline_counts(job_instance, blacklisted))
                     return response.Response(data=serialized_response.data, status=status.HTTP_200_OK)
                 serializer = self.get_serializer(queryset, many=True, context={"request": request})
                 return response.Response(serializer.data)
@@ -314,6 +500,36 @@ class JobApplicationsView(generics.ListAPIView):
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
+    def get_pipeline_counts(self, job_instance, blacklisted):
+        """
+        Return the rejected, shortlisted, planned interview and blacklisted counts of the applications of a job.
+
+        All four are computed by one conditional aggregation over the applications of the job and cached until an
+        application of the job or the blacklist of the employer changes.
+
+        Args:
+            job_instance (JobDetails): The job of the applications.
+            blacklisted (Exists): Whether the applicant is blacklisted by the employer of the job.
+
+        Returns:
+            dict: The counts, keyed like the response fields.
+        """
+        cache_key = 'job-application-stats:{0}:{1}:{2}'.format(
+            job_instance.id,
+            get_cache_version(JOB_APPLICATION_STATS_CACHE, job_instance.id),
+            get_cache_version(EMPLOYER_BLACKLIST_CACHE, job_instance.user_id)
+        )
+        counts = cache.get(cache_key)
+        if counts is None:
+            counts = AppliedJob.objects.filter(job=job_instance).aggregate(
+                rejected_count=Count('id', filter=Q(rejected_at__isnull=False)),
+                shortlisted_count=Count('id', filter=Q(shortlisted_at__isnull=False)),
+                planned_interview_count=Count('id', filter=Q(interview_at__isnull=False)),
+                blacklisted_count=Count('user', filter=Q(blacklisted), distinct=True),
+            )
+            cache.set(cache_key, counts, Common.APPLICATION_STATS_CACHE_TIMEOUT)
+        return counts
+
 
 class RecentApplicationsView(generics.ListAPIView):
     """
@@ -340,10 +556,16 @@ class RecentApplicationsView(generics.ListAPIView):
         context = dict()
         if self.request.user.role == "employer":
             try:
-                queryset = self.filter_queryset(self.get_queryset())
+                queryset = self.get_queryset()
+                if self.request.GET.get('sort') == 'relevance':
+                    AppliedJob.score_unscored(queryset)
+                    queryset = queryset.order_by('-relevance_score', '-created')
+                queryset = self.filter_queryset(queryset.select_related('user__image', 'job'))
                 page = self.paginate_queryset(queryset)
                 if page is not None:
-                    serializer = self.get_serializer(page, many=True, context={"request": request})
+                    serializer = self.get_serializer(
+                        page, many=True, context={"request": request, **self.serializer_class.get_page_context(page)}
+                    )
                     return self.get_paginated_response(serializer.data)
                 serializer = self.get_serializer(queryset, many=True, context={"request": request})
                 return response.Response(serializer.data)
@@ -576,11 +798,191 @@ class ApplicationsDetailView(generics.GenericAPIView):
             )
 
 
+class BulkApplicationsView(generics.GenericAPIView):
+    """
+    Applies one action of `ApplicationsDetailView.put` to many applications of the employer in one transaction.
+
+    The request body holds the `applications` ids, plus the `reason` for `blacklisted` and the `interview_at` for
+    `planned_interviews`. The applications are updated with one query per action, the notifications are written
+    with one `bulk_create`, and the emails are sent as a single batch after the commit. The response holds one
+    result per application id, in the order of the request.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    actions = ('shortlisted', 'rejected', 'blacklisted', 'planned_interviews')
+    max_applications = 500
+    email_templates = {
+        'shortlisted': ('Notification for shortlisted job', 'email-templates/send-notification-old.html',
+                        'shortlisted jobs'),
+        'rejected': ('Notification for rejected job', 'email-templates/send-notification-old.html', 'rejected job'),
+        'planned_interviews': ('Notification for interview planned', 'email-templates/new/notification.html',
+                               'interview planned'),
+    }
+
+    def put(self, request, action):
+        context = dict()
+        if request.user.role != "employer":
+            context['message'] = ["You do not have permission to perform this action."]
+            return response.Response(data=context, status=status.HTTP_401_UNAUTHORIZED)
+        if action not in self.actions:
+            context['message'] = ["Unknown action."]
+            return response.Response(data=context, status=status.HTTP_400_BAD_REQUEST)
+        application_ids = request.data.get('applications')
+        if not isinstance(application_ids, list) or not application_ids:
+            return response.Response(
+                data={"applications": ["A list of application ids is required."]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(application_ids) > self.max_applications:
+            return response.Response(
+                data={"applications": ["At most {0} applications can be updated at once.".format(
+                    self.max_applications
+                )]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            application_ids = [str(uuid.UUID(str(application_id))) for application_id in application_ids]
+        except ValueError:
+            return response.Response(
+                data={"applications": ["Invalid application id."]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        interview_at = None
+        if action == "blacklisted" and not request.data.get('reason'):
+            return response.Response(
+                data={"message": ["Please select a reason"]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if action == "planned_interviews":
+            if 'interview_at' not in request.data:
+                return response.Response(
+                    data={"interview_at": ["This field is requeired."]},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            try:
+                interview_at = datetime.strptime(request.data['interview_at'], '%Y-%m-%dT%H:%M:%S')
+            except ValueError:
+                try:
+                    interview_at = datetime.strptime(request.data['interview_at'], '%Y-%m-%dT%H:%M')
+                except ValueError:
+                    interview_at = None
+            if interview_at is None or interview_at < datetime.now():
+                return response.Response(
+                    data={"message": ["Interview date in invalid."]},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        with transaction.atomic():
+            applications = {
+                str(application.id): application
+                for application in AppliedJob.objects.select_for_update(of=('self',)).select_related(
+                    'user', 'job'
+                ).filter(id__in=application_ids, job__user=request.user)
+            }
+            if action == "blacklisted":
+                results = self.blacklist(request, applications)
+            else:
+                results = self.transition(request, action, applications, interview_at)
+        context['results'] = [
+            {'id': application_id, 'message': results.get(application_id, "Does Not Exist")}
+            for application_id in application_ids
+        ]
+        return response.Response(data=context, status=status.HTTP_200_OK)
+
+    def transition(self, request, action, applications, interview_at):
+        """
+        Shortlist, reject or plan an interview for `applications` and notify the applicants.
+
+        Returns:
+            dict: The result message of every application id.
+        """
+        results = dict()
+        updated = []
+        for application_id, application in applications.items():
+            if action == "shortlisted" and application.shortlisted_at:
+                results[application_id] = "Already shortlisted"
+            elif action == "rejected" and application.rejected_at:
+                results[application_id] = "Already rejected"
+            elif action == "planned_interviews" and application.rejected_at:
+                results[application_id] = "Application already rejected."
+            else:
+                results[application_id] = "Successfully " + action
+                updated.append(application)
+        if not updated:
+            return results
+        now = datetime.now()
+        queryset = AppliedJob.objects.filter(id__in=[application.id for application in updated])
+        if action == "shortlisted":
+            queryset.update(shortlisted_at=now)
+        elif action == "rejected":
+            queryset.update(shortlisted_at=None, rejected_at=now)
+        else:
+            queryset.update(interview_at=interview_at, shortlisted_at=Coalesce(F('shortlisted_at'), Value(now)))
+        # `update()` sends no signals, so the caches kept by the `AppliedJob` handlers are invalidated here.
+        for job_id in {application.job_id for application in updated}:
+            bump_cache_version(JOB_DETAIL_CACHE, job_id)
+            bump_cache_version(JOB_APPLICATION_STATS_CACHE, job_id)
+
+        subject, email_template_name, notification_type = self.email_templates[action]
+        notifications = []
+        emails = []
+        for application in updated:
+            applicant = application.user
+            if not applicant.get_notification:
+                continue
+            notifications.append(Notification(
+                user=applicant, application=application, notification_type=action,
+                created_by=request.user, job=application.job
+            ))
+            if applicant.email and applicant.get_email:
+                emails.append({
+                    'subject': subject,
+                    'email_template_name': email_template_name,
+                    'context': {
+                        'yourname': applicant.name or applicant.email,
+                        'notification_type': notification_type,
+                        'job_instance': application.job,
+                        'job_link': Common.FRONTEND_BASE_URL + "/jobs/details/" + str(application.job.slug),
+                    },
+                    'to_email': [applicant.email, ],
+                })
+        Notification.bulk_notify(notifications)
+        queue_email_batch(emails)
+        return results
+
+    def blacklist(self, request, applications):
+        """
+        Blacklist the applicants of `applications`, with one query for the existing entries and one `bulk_create`.
+
+        Returns:
+            dict: The result message of every application id.
+        """
+        results = dict()
+        already = set(BlackList.objects.filter(
+            user=request.user,
+            blacklisted_user__in={application.user_id for application in applications.values()}
+        ).values_list('blacklisted_user', flat=True))
+        entries = []
+        for application_id, application in applications.items():
+            if application.user_id in already:
+                results[application_id] = "Already blacklisted"
+                continue
+            already.add(application.user_id)
+            entries.append(BlackList(
+                user=request.user, blacklisted_user_id=application.user_id, reason=request.data['reason']
+            ))
+            results[application_id] = "Successfully blacklisted"
+        if entries:
+            BlackList.objects.bulk_create(entries)
+            # `bulk_create()` sends no signals, see `jobs.models.invalidate_employer_blacklist`.
+            bump_cache_version(EMPLOYER_BLACKLIST_CACHE, request.user.id)
+        return results
+
+
 class JobSuggestionView(generics.ListAPIView):
     serializer_class = GetJobsSerializers
     permission_classes = [permissions.AllowAny]
-    # queryset = JobDetails.objects.all()
-    queryset = JobDetails.objects.filter(deadline__gte=date.today(), is_removed=False, status="active")
+    queryset = None
     filter_backends = [filters.SearchFilter, django_filters.DjangoFilterBackend]
     filterset_class = JobDetailsFilter
     search_fields = ['title']
@@ -593,7 +995,7 @@ class JobSuggestionView(generics.ListAPIView):
         queryset = self.filter_queryset(self.get_queryset())
         try:
             job_instance = JobDetails.objects.get(slug=jobId)
-            annotated_job_details = JobDetails.objects.filter(deadline__gte=date.today(), is_removed=False, status="active").filter(~Q(id=job_instance.id)).annotate(
+            annotated_job_details = self.get_queryset().filter(~Q(id=job_instance.id)).annotate(
                 matches=Value(0)
             ).annotate(
                 matches=Case(
@@ -665,6 +1067,10 @@ class JobSuggestionView(generics.ListAPIView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
+    def get_queryset(self):
+        # Evaluated per request, a class level queryset would keep the date of the process start.
+        return JobDetails.objects.filter(deadline__gte=date.today(), status="active")
+
 
 class JobFilterView(generics.GenericAPIView):
     """
@@ -906,26 +1312,12 @@ class JobShareView(generics.GenericAPIView):
     def put(self, request, jobId, platform):
         context = dict()
         try:
-            job_instance = JobDetails.objects.get(id=jobId)
-            job_share_instance = JobShare.objects.get(job=job_instance)
-            if platform == "whatsapp":
-                job_share_instance.whatsapp = job_share_instance.whatsapp + 1
-                job_share_instance.save()
-            elif platform == "telegram":
-                job_share_instance.telegram = job_share_instance.telegram + 1
-                job_share_instance.save()
-            elif platform == "facebook":
-                job_share_instance.facebook = job_share_instance.facebook + 1
-                job_share_instance.save()
-            elif platform == "mail":
-                job_share_instance.mail = job_share_instance.mail + 1
-                job_share_instance.save()
-            elif platform == "linked_in":
-                job_share_instance.linked_in = job_share_instance.linked_in + 1
-                job_share_instance.save()
-            elif platform == "direct_link":
-                job_share_instance.direct_link = job_share_instance.direct_link + 1
-                job_share_instance.save()
+            if not JobShare.objects.filter(job=jobId, job__is_removed=False).exists():
+                JobDetails.objects.get(id=jobId)
+                raise JobShare.DoesNotExist
+            if platform in JobShare.PLATFORMS:
+                # Written by the counter buffer within `COUNTER_FLUSH_INTERVAL` seconds.
+                job_share_counter.add((jobId, platform))
             return response.Response(
                 data={"message": "Share details updated"},
                 status=status.HTTP_200_OK
@@ -997,47 +1389,27 @@ class JobCategoryView(generics.ListAPIView):
         tenders = []
 
         # Retrieve the top job categories and their counts of associated jobs
-        all_jobs = JobCategory.objects.annotate(
-            category_count=Count(
-                'jobs_jobdetails_job_category',
-                distinct=True,
-                filter=Q(jobs_jobdetails_job_category__is_removed=False, jobs_jobdetails_job_category__status="active")
-            )
-        ).order_by('-category_count')[:5]
+        all_jobs = JobCategoryStats.objects.select_related('category').order_by('-job_count', 'category__title')[:5]
         # Retrieve the top job categories and their counts of associated talents
-        all_talents = JobCategory.objects.annotate(
-            category_count=Count(
-                'jobs_jobsubcategory_categories__job_seekers_categories_categories__user',
-                distinct=True,
-                filter=Q(
-                    jobs_jobsubcategory_categories__job_seekers_categories_categories__user__job_seekers_jobpreferences_user__display_in_search=True,
-                    jobs_jobsubcategory_categories__job_seekers_categories_categories__user__is_active=True,
-                    jobs_jobsubcategory_categories__is_removed=False,
-                    jobs_jobsubcategory_categories__isnull=False,
-                )
-            )
-        ).order_by('-category_count')[:5]
-
+        all_talents = JobCategoryStats.objects.select_related('category').order_by(
+            '-talent_count', 'category__title'
+        )[:5]
         # Retrieve the top tenders categories and their counts of associated tender
-        all_tenders = TenderCategory.objects.annotate(
-            category_count=Count(
-                'tenders_tenderdetails_tender_category',
-                distinct=True,
-                filter=Q(tenders_tenderdetails_tender_category__is_removed=False, tenders_tenderdetails_tender_category__status='active')
-            )
-        ).order_by('-category_count')[:5]
+        all_tenders = TenderCategoryStats.objects.select_related('category').order_by(
+            '-tender_count', 'category__title'
+        )[:5]
 
         # Prepare the jobs list with title and count information
-        for category in all_jobs:
-            jobs.append({"id": category.id, "title": category.title, "count": category.category_count})
+        for stats in all_jobs:
+            jobs.append({"id": stats.category.id, "title": stats.category.title, "count": stats.job_count})
 
         # Prepare the talents list with title and count information
-        for category in all_talents:
-            talents.append({"id": category.id, "title": category.title, "count": category.category_count})
-            
+        for stats in all_talents:
+            talents.append({"id": stats.category.id, "title": stats.category.title, "count": stats.talent_count})
+
         # Prepare the tenders list with title and count information
-        for category in all_tenders:
-            tenders.append({"id": category.id, "title": category.title, "count": category.category_count})
+        for stats in all_tenders:
+            tenders.append({"id": stats.category.id, "title": stats.category.title, "count": stats.tender_count})
 
         # Populate the context dictionary with jobs and talents information
         context['jobs'] = jobs
@@ -1087,49 +1459,46 @@ class PopularJobCategoryView(generics.ListAPIView):
         job_categories = []
 
         # Retrieve the popular job categories and their counts
-        most_used_categories = JobDetails.objects.filter(is_removed=False, status="active"
-                        ).values('job_category__id', 'job_category__title').annotate(
-            category_count=Count('job_category')).order_by('-category_count')
+        most_used_categories = JobCategoryStats.objects.filter(job_count__gt=0).select_related(
+            'category'
+        ).order_by('-job_count', 'category__title')
         # Prepare the job categories list with title and count information
-        all_job_category_id = []
-        job_category = JobCategory.objects.all()
-        for cat_id in job_category:
-            all_job_category_id.append(cat_id.id)
-        for category in most_used_categories:
-            if category['job_category__id'] in all_job_category_id:
-                job_categories.append(
-                    {
-                        "id": category['job_category__id'],
-                        "title": category['job_category__title'],
-                        "count": category['category_count']
-                    }
-                )
+        for stats in most_used_categories:
+            job_categories.append(
+                {
+                    "id": stats.category.id,
+                    "title": stats.category.title,
+                    "count": stats.job_count
+                }
+            )
         total_jobs = JobDetails.objects.filter(is_removed=False, status="active").count()
         return response.Response(
             # data= job_categories,
             data= {"total_jobs":total_jobs , 'job_categories':job_categories} ,
             status=status.HTTP_200_OK
         )
-        
-from django.http import FileResponse
-from django.shortcuts import get_object_or_404
-from koor.config.common import Common
-import base64
 
 
 class DownloadImage(generics.GenericAPIView):
+    """
+    Download a media file given by its URL in the `file_path` query parameter.
+
+    The file is streamed as an attachment by `core.media.serve_media`, with support for `Range` and conditional
+    requests, instead of being read into memory and returned base64 encoded.
+    """
     permission_classes = [permissions.AllowAny]
 
     def get(self, request):
-        context = dict()
-        file_path = request.GET.get('file_path', None)
-        file_path = file_path.split("media")
-        new_file_path = Common.MEDIA_ROOT + file_path[1]
-        encoded_string = ""
-        with open(new_file_path, "rb") as image_file:
-            encoded_string = base64.b64encode(image_file.read())
-        context['base_image'] = encoded_string
-        return response.Response(
-            data=context,
-            status=status.HTTP_200_OK
-        )
+        file_path = urlparse(request.GET.get('file_path', '')).path
+        if Common.MEDIA_URL not in file_path:
+            return response.Response(
+                data={'file_path': 'Invalid file path.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            return serve_media(request, unquote(file_path.split(Common.MEDIA_URL, 1)[1]), as_attachment=True)
+        except Http404:
+            return response.Response(
+                data={'file_path': 'File does not exist.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
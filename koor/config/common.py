@@ -44,6 +44,13 @@ class Common(Configuration):
     # ('59 23 * * *', 'notification.views.ExpiredSavedJobs'),
     # ('50 23 * * 7', 'job_seekers.views.RemoveAvailability'),
     ('1 1 * * *', 'superadmin.views.GenerateInvoice'),
+    ('5 0 * * *', 'django.core.management.call_command', ['expire_listings']),
+    ('30 2 * * *', 'django.core.management.call_command', ['rebuild_category_stats']),
+    ('45 2 * * *', 'django.core.management.call_command', ['score_applications']),
+    ('0 3 * * *', 'django.core.management.call_command', ['rebuild_search_documents']),
+    ('15 3 * * *', 'django.core.management.call_command', ['index_talent_alerts']),
+    ('20 * * * *', 'django.core.management.call_command', ['rebuild_search_documents', '--missing']),
+    ('15 * * * *', 'django.core.management.call_command', ['rollup_daily_analytics']),
     ]
 
     # https://docs.djangoproject.com/en/2.0/topics/http/middleware/
@@ -77,6 +84,33 @@ class Common(Configuration):
         }
     }
 
+    # Cache
+    # https://docs.djangoproject.com/en/4.1/topics/cache/
+    CACHES = {
+        'default': {
+            'BACKEND': config('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+            'LOCATION': config('CACHE_LOCATION', 'koor'),
+        }
+    }
+
+    # Number of seconds a cached job detail payload is kept before it is rebuilt from the database.
+    JOB_DETAIL_CACHE_TIMEOUT = int(config('JOB_DETAIL_CACHE_TIMEOUT', 300))
+    # Number of seconds an anonymous job/tender search page is kept in the cache.
+    SEARCH_CACHE_TIMEOUT = int(config('SEARCH_CACHE_TIMEOUT', 60))
+    # Number of seconds the application pipeline counts of a job are cached, status changes invalidate them.
+    APPLICATION_STATS_CACHE_TIMEOUT = int(config('APPLICATION_STATS_CACHE_TIMEOUT', 300))
+
+    # Lists that opt into approximate counts only use the planner estimate from this number of rows on.
+    PAGINATION_EXACT_COUNT_THRESHOLD = int(config('PAGINATION_EXACT_COUNT_THRESHOLD', 10000))
+
+    # Currency the job salaries are normalized to, see `project_meta.models.ExchangeRate`.
+    SALARY_REFERENCE_CURRENCY = config('SALARY_REFERENCE_CURRENCY', 'KES').upper()
+
+    # Number of seconds share, analytic and visitor counters are buffered in memory before they are written.
+    COUNTER_FLUSH_INTERVAL = int(config('COUNTER_FLUSH_INTERVAL', 5))
+    # Whether a `VisitorLog` row is stored per visitor and day next to the daily `VisitorSketch`.
+    STORE_VISITOR_LOGS = bool(strtobool(config('STORE_VISITOR_LOGS', 'yes')))
+
     # Email
     EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 
@@ -144,6 +178,23 @@ class Common(Configuration):
     # Media files
     MEDIA_ROOT = join(os.path.dirname(BASE_DIR), 'media')
     MEDIA_URL = '/media/'
+    # Header used to hand media transfers to the front proxy: 'X-Accel-Redirect' (nginx), 'X-Sendfile' (Apache,
+    # lighttpd) or empty to stream them from Django.
+    MEDIA_SENDFILE_HEADER = config('MEDIA_SENDFILE_HEADER', '')
+    # Internal proxy location that maps to MEDIA_ROOT, used with X-Accel-Redirect.
+    MEDIA_ACCEL_REDIRECT_PREFIX = config('MEDIA_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+    # Number of seconds browsers and proxies may cache a media file. Uploads get a unique path, so they don't change.
+    MEDIA_CACHE_MAX_AGE = int(config('MEDIA_CACHE_MAX_AGE', 86400))
+    # Chunked uploads, see `project_meta.models.UploadSession`.
+    CHUNKED_UPLOAD_DIRECTORY = config('CHUNKED_UPLOAD_DIRECTORY', join(os.path.dirname(BASE_DIR), 'uploads'))
+    CHUNKED_UPLOAD_MAX_SIZE = int(config('CHUNKED_UPLOAD_MAX_SIZE', 100 * 1024 * 1024))
+    CHUNKED_UPLOAD_MAX_CHUNK_SIZE = int(config('CHUNKED_UPLOAD_MAX_CHUNK_SIZE', 5 * 1024 * 1024))
+    CHUNKED_UPLOAD_EXPIRY = int(config('CHUNKED_UPLOAD_EXPIRY', 24))
+    # Hash uploads while they stream in, so Media can store them by content without reading them again.
+    FILE_UPLOAD_HANDLERS = [
+        'core.uploads.HashingMemoryFileUploadHandler',
+        'core.uploads.HashingTemporaryFileUploadHandler',
+    ]
 
     TEMPLATES = [
         {
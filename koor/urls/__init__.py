@@ -1,9 +1,10 @@
 from django.conf import settings
 from django.urls import path, re_path, include
-from django.conf.urls.static import static
 from django.contrib import admin
 from django.views.generic.base import RedirectView
 
+from core.media import MediaView
+
 DEFAULT_VERSION = 'v1'
 
 urlpatterns = [
@@ -14,4 +15,5 @@ urlpatterns = [
     # http://www.django-rest-framework.org/api-guide/routers/#defaultrouter
     re_path(r'^$', RedirectView.as_view(url='api/{0}/'.format(DEFAULT_VERSION), permanent=False)),
 
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    re_path(r'^{0}(?P<path>.+)$'.format(settings.MEDIA_URL.lstrip('/')), MediaView.as_view(), name='media'),
+]
@@ -18,4 +18,6 @@ urlpatterns = [
     path('admin', include('superadmin.urls')),
     
     path('chat', include('chat.urls')),
+
+    path('uploads', include('project_meta.urls')),
 ]
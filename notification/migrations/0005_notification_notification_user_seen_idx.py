@@ -0,0 +1,19 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:38
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('notification', '0004_remove_notification_active_and_more'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='notification',
+            index=models.Index(fields=['user', 'seen', '-created'], name='notification_user_seen_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.1.5 on 2026-10-19 01:36
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('user_profile', '0006_userfilterterm'),
+        ('notification', '0005_notification_notification_user_seen_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='candidate',
+            field=models.ForeignKey(blank=True, db_column='candidate', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)s_candidate', to=settings.AUTH_USER_MODEL, verbose_name='Candidate'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='user_filter',
+            field=models.ForeignKey(blank=True, db_column='user_filter', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_user_filter', to='user_profile.userfilters', verbose_name='User Filter'),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='notification_type',
+            field=models.CharField(choices=[('applied', 'Applied'), ('applied_tender', 'Applied Tender'), ('password_update', 'Password Updated'), ('shortlisted', 'Shortlisted'), ('rejected', 'Rejected'), ('planned_interviews', 'Planned Interviews'), ('message', 'Message'), ('advance_filter', 'Advance Filter'), ('job_preference', 'Job Preference'), ('expired_save_job', 'Expired Save Job'), ('talent_alert', 'Talent Alert'), ('message', 'Message')], db_column='nitification_type', max_length=25, verbose_name='Notification Type'),
+        ),
+    ]
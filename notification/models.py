@@ -1,7 +1,7 @@
 from asgiref.sync import async_to_sync
 
 from channels.layers import get_channel_layer
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext as _
 
 from core.models import (
@@ -9,6 +9,7 @@ from core.models import (
 )
 from job_seekers.models import AppliedJob
 from jobs.models import JobFilters, JobDetails
+from user_profile.models import UserFilters
 from users.models import (
     TimeStampedModel, User
 
@@ -25,6 +26,8 @@ class Notification(BaseModel, TimeStampedModel, models.Model):
         - `notification_type (CharField)`: The type of the notification.
         - `application (ForeignKey)`: The applied job associated with the notification (if applicable).
         - `job_filter (ForeignKey)`: The job filter associated with the notification (if applicable).
+        - `user_filter (ForeignKey)`: The saved talent filter a talent alert is about (if applicable).
+        - `candidate (ForeignKey)`: The job seeker or vendor a talent alert is about (if applicable).
         - `seen (BooleanField)`: Whether the notification has been seen by the user.
 
     Methods:
@@ -48,6 +51,7 @@ class Notification(BaseModel, TimeStampedModel, models.Model):
         ('advance_filter', "Advance Filter"),
         ('job_preference', "Job Preference"),
         ('expired_save_job', "Expired Save Job"),
+        ('talent_alert', "Talent Alert"),
         ('message', "Message"),
     )
     user = models.ForeignKey(
@@ -136,6 +140,24 @@ class Notification(BaseModel, TimeStampedModel, models.Model):
         db_column="job_filter",
         related_name='%(app_label)s_%(class)s_job_filter'
     )
+    user_filter = models.ForeignKey(
+        UserFilters,
+        verbose_name=_('User Filter'),
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_column="user_filter",
+        related_name='%(app_label)s_%(class)s_user_filter'
+    )
+    candidate = models.ForeignKey(
+        User,
+        verbose_name=_('Candidate'),
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        db_column="candidate",
+        related_name='%(app_label)s_%(class)s_candidate'
+    )
     seen = models.BooleanField(
         verbose_name=_('Seen'),
         null=True,
@@ -152,6 +174,9 @@ class Notification(BaseModel, TimeStampedModel, models.Model):
         verbose_name_plural = "Notifications"
         db_table = "Notification"
         ordering = ['-created']
+        indexes = [
+            models.Index(fields=['user', 'seen', '-created'], name='notification_user_seen_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         channel_layer = get_channel_layer()
@@ -163,3 +188,28 @@ class Notification(BaseModel, TimeStampedModel, models.Model):
             }
         )
         return super().save(*args, **kwargs)
+
+    @classmethod
+    def bulk_notify(cls, notifications):
+        """
+        Insert `notifications` with one `bulk_create` and, once the transaction commits, send the same live update
+        as `save` once per notified user.
+        """
+        notifications = cls.objects.bulk_create(notifications)
+
+        def send_updates():
+            channel_layer = get_channel_layer()
+            notification_types = {}
+            for notification in notifications:
+                notification_types.setdefault(str(notification.user_id), notification.notification_type)
+            for user_id, notification_type in notification_types.items():
+                async_to_sync(channel_layer.group_send)(
+                    user_id,
+                    {
+                        "type": "update_notification",
+                        "content": "You got a notification about " + str(notification_type),
+                    }
+                )
+
+        transaction.on_commit(send_updates)
+        return notifications
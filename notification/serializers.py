@@ -31,6 +31,8 @@ class GetNotificationSerializers(serializers.ModelSerializer):
     tender = serializers.SerializerMethodField()
     job = serializers.SerializerMethodField()
     job_filter = serializers.SerializerMethodField()
+    user_filter = serializers.SerializerMethodField()
+    candidate = serializers.SerializerMethodField()
     receiver = serializers.SerializerMethodField()
     message_sender = serializers.SerializerMethodField()
     
@@ -39,7 +41,8 @@ class GetNotificationSerializers(serializers.ModelSerializer):
         fields = [
             'id', 'notification_type', 'message', 'application', 'job', 
             'tender_application', 'tender', 'job_filter', 'seen', 'created', 
-            'message_sender', 'message_id', 'conversation_id', 'receiver'
+            'message_sender', 'message_id', 'conversation_id', 'receiver',
+            'user_filter', 'candidate'
         ]
 
         
@@ -146,3 +149,23 @@ class GetNotificationSerializers(serializers.ModelSerializer):
         if obj.job_filter:
             return {"id": obj.job_filter.id, "title": obj.job_filter.title}
         return None
+
+    def get_user_filter(self, obj):
+        if obj.user_filter:
+            return {"id": obj.user_filter.id, "title": obj.user_filter.title, "role": obj.user_filter.role}
+        return None
+
+    def get_candidate(self, obj):
+        if obj.candidate:
+            user = dict()
+            user['id'] = obj.candidate.id
+            user['name'] = obj.candidate.name
+            user['email'] = obj.candidate.email
+            user['role'] = obj.candidate.role
+            if obj.candidate.image:
+                if obj.candidate.image.title == "profile image":
+                    user['image'] = str(obj.candidate.image.file_path)
+                else:
+                    user['image'] = obj.candidate.image.file_path.url
+            return user
+        return None
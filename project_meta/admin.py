@@ -1,3 +1,8 @@
 from django.contrib import admin
+from .models import ExchangeRate
 
-# Register your models here.
+
+class ExchangeRateAdmin(admin.ModelAdmin):
+    list_display = ('currency', 'rate', 'modified')
+
+admin.site.register(ExchangeRate, ExchangeRateAdmin)
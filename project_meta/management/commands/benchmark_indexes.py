@@ -0,0 +1,213 @@
+import json
+import random
+import statistics
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from chat.models import Conversation, ChatMessage
+from employers.models import BlackList
+from job_seekers.models import AppliedJob, SavedJob
+from jobs.models import JobDetails
+from notification.models import Notification
+from project_meta.models import Country
+from user_profile.models import UserAnalytic
+from users.models import User, VisitorLog
+
+
+class Command(BaseCommand):
+    help = 'Seed synthetic rows and compare the query plans and timings of the hot lookups without and with their indexes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', type=int, default=50000,
+            help='Number of rows seeded into each of the benchmarked tables'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=5,
+            help='Number of times every query is run, the median execution time is reported'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Everything runs inside one transaction that is rolled back at the end, so neither the seeded rows nor the
+        dropped indexes survive the run. Dropping an index locks its table until the rollback, so run this
+        against a local or staging database only.
+        """
+        if connection.vendor != 'postgresql':
+            raise CommandError('The benchmark needs a PostgreSQL database')
+        self.repeat = options['repeat']
+        with transaction.atomic():
+            sample = self.seed(options['rows'], random.Random(0))
+            queries = self.get_queries(sample)
+            with connection.cursor() as cursor:
+                for model in {model for model, name, queryset in queries}:
+                    cursor.execute('ANALYZE "{0}"'.format(model._meta.db_table))
+
+            savepoint = transaction.savepoint()
+            with connection.cursor() as cursor:
+                for model, name, queryset in queries:
+                    if name in {constraint.name for constraint in model._meta.constraints}:
+                        cursor.execute('ALTER TABLE "{0}" DROP CONSTRAINT "{1}"'.format(model._meta.db_table, name))
+                    else:
+                        cursor.execute('DROP INDEX IF EXISTS "{0}"'.format(name))
+            before = [self.measure(queryset) for model, name, queryset in queries]
+            transaction.savepoint_rollback(savepoint)
+            after = [self.measure(queryset) for model, name, queryset in queries]
+
+            for (model, name, queryset), (before_plan, before_time), (after_plan, after_time) in zip(
+                    queries, before, after
+            ):
+                self.stdout.write(self.style.MIGRATE_HEADING(f'{model.__name__} ({name})'))
+                self.stdout.write(f'  before: {before_time:.3f} ms  {before_plan}')
+                self.stdout.write(f'  after:  {after_time:.3f} ms  {after_plan}')
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS('Benchmark finished, the seeded rows were rolled back'))
+
+    def seed(self, rows, rng):
+        """
+        Bulk insert `rows` rows into every benchmarked table and return the rows the queries look up.
+        """
+        now = timezone.now()
+        today = date.today()
+
+        def created():
+            return now - timedelta(minutes=rng.randrange(60 * 24 * 365))
+
+        country = Country.objects.create(
+            title='Benchmark', currency_code='USD', country_code='+0', iso_code2='BM', iso_code3='BMK'
+        )
+        users = User.objects.bulk_create(
+            User(email=f'benchmark-{index}@example.com', password='!', role='job_seeker')
+            for index in range(max(rows // 50, 2))
+        )
+        jobs = JobDetails.objects.bulk_create(
+            JobDetails(
+                title=f'Benchmark job {index}', user=rng.choice(users), country=country, address='Benchmark',
+                status=rng.choice(['active', 'active', 'inactive', 'expired']),
+                deadline=today + timedelta(days=rng.randrange(-180, 180)), created=created()
+            ) for index in range(max(rows // 25, 1))
+        )
+        conversations = Conversation.objects.bulk_create(
+            Conversation() for index in range(max(rows // 100, 1))
+        )
+        AppliedJob.objects.bulk_create(
+            (AppliedJob(job=rng.choice(jobs), user=rng.choice(users), created=created()) for index in range(rows)),
+            batch_size=5000
+        )
+        SavedJob.objects.bulk_create(
+            (SavedJob(job=rng.choice(jobs), user=rng.choice(users), created=created()) for index in range(rows)),
+            batch_size=5000
+        )
+        Notification.objects.bulk_create(
+            (
+                Notification(
+                    user=rng.choice(users), notification_type='applied', seen=rng.random() < 0.8, created=created()
+                ) for index in range(rows)
+            ), batch_size=5000
+        )
+        ChatMessage.objects.bulk_create(
+            (
+                ChatMessage(
+                    user=rng.choice(users), conversation=rng.choice(conversations), message='Benchmark',
+                    created=created()
+                ) for index in range(rows)
+            ), batch_size=5000
+        )
+        BlackList.objects.bulk_create(
+            (BlackList(user=rng.choice(users), blacklisted_user=rng.choice(users)) for index in range(rows)),
+            batch_size=5000
+        )
+        VisitorLog.objects.bulk_create(
+            (
+                VisitorLog(
+                    ip_address=f'10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}',
+                    created_at=today - timedelta(days=rng.randrange(365))
+                ) for index in range(rows)
+            ), batch_size=5000, ignore_conflicts=True
+        )
+        UserAnalytic.objects.bulk_create(
+            (
+                UserAnalytic(user=rng.choice(users), date=today - timedelta(days=rng.randrange(365)), count=1)
+                for index in range(rows)
+            ), batch_size=5000, ignore_conflicts=True
+        )
+        return {
+            'application': AppliedJob.objects.order_by('?').first(),
+            'saved_job': SavedJob.objects.order_by('?').first(),
+            'user': rng.choice(users),
+            'conversation': rng.choice(conversations),
+            'blacklist': BlackList.objects.order_by('?').first(),
+            'visitor': VisitorLog.objects.order_by('?').first(),
+            'analytic': UserAnalytic.objects.order_by('?').first(),
+        }
+
+    def get_queries(self, sample):
+        """
+        Return `(model, index or unique constraint name, queryset)` for every hot lookup, written the way the views
+        run them.
+        """
+        today = date.today()
+        application = sample['application']
+        saved_job = sample['saved_job']
+        blacklist = sample['blacklist']
+        visitor = sample['visitor']
+        analytic = sample['analytic']
+        return [
+            (
+                AppliedJob, 'appliedjob_job_user_idx',
+                AppliedJob.objects.filter(job=application.job_id, user=application.user_id)[:1]
+            ),
+            (
+                SavedJob, 'savedjob_job_user_idx',
+                SavedJob.objects.filter(job=saved_job.job_id, user=saved_job.user_id)[:1]
+            ),
+            (
+                Notification, 'notification_user_seen_idx',
+                Notification.objects.filter(user=sample['user'], seen=False).order_by('-created')[:10]
+            ),
+            (
+                JobDetails, 'job_status_deadline_idx',
+                JobDetails.objects.filter(status='inactive', deadline__gte=today).order_by('-created')[:10]
+            ),
+            (
+                ChatMessage, 'chatmessage_conv_created_idx',
+                ChatMessage.objects.filter(conversation=sample['conversation']).order_by('-created')[:20]
+            ),
+            (
+                BlackList, 'blacklist_user_blacklisted_idx',
+                BlackList.objects.filter(user=blacklist.user_id, blacklisted_user=blacklist.blacklisted_user_id)[:1]
+            ),
+            (
+                VisitorLog, 'visitorlog_ip_created_uniq',
+                VisitorLog.objects.filter(ip_address=visitor.ip_address, created_at=visitor.created_at)[:1]
+            ),
+            (
+                UserAnalytic, 'useranalytic_user_date_uniq',
+                UserAnalytic.objects.filter(user=analytic.user_id, date=analytic.date)[:1]
+            ),
+        ]
+
+    def measure(self, queryset):
+        """
+        Run `EXPLAIN ANALYZE` on `queryset` and return the plan outline with the median execution time.
+        """
+        timings = []
+        for run in range(self.repeat):
+            result = json.loads(queryset.explain(analyze=True, format='json'))[0]
+            timings.append(result['Execution Time'])
+        return self.outline(result['Plan']), statistics.median(timings)
+
+    def outline(self, plan):
+        """
+        Return the node types of a JSON plan as one line, e.g. `Limit > Index Scan using appliedjob_job_user_idx`.
+        """
+        node = plan['Node Type']
+        if 'Index Name' in plan:
+            node = f"{node} using {plan['Index Name']}"
+        children = [self.outline(child) for child in plan.get('Plans', [])]
+        if children:
+            node = f"{node} > {', '.join(children)}"
+        return node
@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models.deletion import ProtectedError
+from django.utils import timezone
+
+from project_meta.models import Media, MediaBlob
+
+
+class Command(BaseCommand):
+    help = 'Delete the media blobs and blob files that no Media references anymore'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-age', type=int, default=24,
+            help='Only collect blobs and files older than this number of hours, which keeps uploads in progress'
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Report what would be deleted without deleting it'
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options['min_age'])
+        dry_run = options['dry_run']
+        storage = MediaBlob._meta.get_field('file').storage
+
+        unreferenced = MediaBlob.objects.filter(media__isnull=True, created__lt=cutoff)
+        blob_count = unreferenced.count()
+        if not dry_run:
+            for blob in unreferenced.iterator(chunk_size=500):
+                try:
+                    blob.delete()
+                except ProtectedError:
+                    # Reused by an upload since the query.
+                    blob_count -= 1
+
+        # Every file below the blob directory that is neither a blob nor the variant of a Media is garbage, this
+        # also covers the variants of the blobs deleted above.
+        live_files = set(MediaBlob.objects.values_list('file', flat=True).iterator(chunk_size=5000))
+        for variants in Media.objects.filter(blob__isnull=False).values_list('variants', flat=True).iterator(
+                chunk_size=5000
+        ):
+            live_files.update((variants or {}).values())
+        file_count = 0
+        freed = 0
+        for name in self.walk(storage, MediaBlob.DIRECTORY):
+            if name in live_files or storage.get_modified_time(name) >= cutoff:
+                continue
+            file_count += 1
+            freed += storage.size(name)
+            if not dry_run:
+                storage.delete(name)
+
+        self.stdout.write(self.style.SUCCESS(
+            '{0}{1} blobs and {2} files ({3:.1f} MB) collected'.format(
+                'Dry run: ' if dry_run else '', blob_count, file_count, freed / 1024 / 1024
+            )
+        ))
+
+    def walk(self, storage, directory):
+        if not storage.exists(directory):
+            return
+        directories, files = storage.listdir(directory)
+        for name in files:
+            yield f'{directory}/{name}'
+        for name in directories:
+            yield from self.walk(storage, f'{directory}/{name}')
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from project_meta.models import Media, MediaBlob
+
+
+class Command(BaseCommand):
+    help = 'Move the Media files stored before content addressing into deduplicated blobs'
+
+    def handle(self, *args, **options):
+        storage = Media._meta.get_field('file_path').storage
+        count = 0
+        missing = 0
+        for media in Media.objects.filter(blob__isnull=True).exclude(file_path='').order_by('id').iterator(
+                chunk_size=500
+        ):
+            old_name = media.file_path.name
+            if not storage.exists(old_name):
+                # Missing files and the provider URLs of social login profile images.
+                missing += 1
+                continue
+            with storage.open(old_name, 'rb') as content:
+                blob = MediaBlob.store(content, old_name)
+            Media.objects.filter(id=media.id).update(file_path=blob.file.name, blob=blob)
+            if old_name != blob.file.name:
+                storage.delete(old_name)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f'{count} Media instances moved to blobs, {missing} without a file'))
@@ -0,0 +1,44 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from jobs.models import JobDetails, jobs_expired
+from tenders.models import TenderDetails, tenders_expired
+
+
+class Command(BaseCommand):
+    help = 'Move active JobDetails and TenderDetails instances whose deadline has passed to the expired status'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='Number of rows expired per transaction'
+        )
+
+    def handle(self, *args, **options):
+        for model, signal in ((JobDetails, jobs_expired), (TenderDetails, tenders_expired)):
+            expired = self.expire(model, signal, options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'{expired} {model.__name__} instances expired'))
+
+    def expire(self, model, signal, batch_size):
+        """
+        Expire the live rows of `model` with a passed deadline in batches of `batch_size`.
+
+        Every batch is selected through the partial index on the deadline of the live rows, locked with
+        `SKIP LOCKED` so a running edit is not waited on, updated in one statement and announced with `signal`
+        inside the same transaction.
+        """
+        today = date.today()
+        expired = 0
+        while True:
+            with transaction.atomic():
+                ids = list(
+                    model.objects.select_for_update(skip_locked=True).filter(
+                        status='active', deadline__lt=today
+                    ).order_by('deadline').values_list('id', flat=True)[:batch_size]
+                )
+                if not ids:
+                    return expired
+                model.objects.filter(id__in=ids).update(status='expired')
+                signal.send(sender=model, ids=ids)
+            expired += len(ids)
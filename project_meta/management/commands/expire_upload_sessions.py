@@ -0,0 +1,23 @@
+import os
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from koor.config.common import Common
+from project_meta.models import UploadSession
+
+
+class Command(BaseCommand):
+    help = 'Delete the chunked uploads not touched for CHUNKED_UPLOAD_EXPIRY hours together with their received chunks'
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=Common.CHUNKED_UPLOAD_EXPIRY)
+        expired = UploadSession.objects.filter(modified__lt=cutoff)
+        count = 0
+        for upload in expired.iterator(chunk_size=500):
+            if os.path.exists(upload.part_path):
+                os.remove(upload.part_path)
+            count += 1
+        expired.delete()
+        self.stdout.write(self.style.SUCCESS(f'{count} UploadSession instances expired'))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from project_meta.models import Media
+
+
+class Command(BaseCommand):
+    help = 'Generate the missing thumbnail and WebP variants of the uploaded images'
+
+    def handle(self, *args, **options):
+        count = 0
+        images = Media.objects.filter(media_type='image').order_by('id')
+        for media in images.iterator(chunk_size=500):
+            if any(name not in media.variants for name in Media.VARIANTS):
+                media.generate_variants()
+                count += 1
+        self.stdout.write(self.style.SUCCESS(f'Variants generated for {count} Media instances'))
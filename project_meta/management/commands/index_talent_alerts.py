@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from user_profile.models import UserFilters
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the inverted index of the saved talent filters used by the talent alerts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        filter_ids = list(UserFilters.all_objects.order_by('id').values_list('id', flat=True))
+        for start in range(0, len(filter_ids), options['batch_size']):
+            UserFilters.index_alerts(filter_ids[start:start + options['batch_size']])
+        self.stdout.write(self.style.SUCCESS(f'Talent alert index rebuilt for {len(filter_ids)} filters'))
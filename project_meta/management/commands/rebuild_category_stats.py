@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from jobs.models import JobCategoryStats
+from tenders.models import TenderCategoryStats
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the job and tender category statistics used by the category landing endpoints'
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            JobCategoryStats.refresh()
+            TenderCategoryStats.refresh()
+        self.stdout.write(self.style.SUCCESS(
+            f'Category stats rebuilt for {JobCategoryStats.objects.count()} job categories '
+            f'and {TenderCategoryStats.objects.count()} tender categories'
+        ))
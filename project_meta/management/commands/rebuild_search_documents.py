@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef
+from users.models import CandidateSearchDocument, User
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the search documents of every job seeker and vendor used by the talent search, or with --missing '
+        'only create the documents that do not exist yet'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument(
+            '--missing', action='store_true',
+            help='Only build the documents of candidates without one, e.g. while the table is empty'
+        )
+
+    def handle(self, *args, **options):
+        # A rebuild only catches up with missed changes, so no talent alerts are sent for it.
+        count = 0
+        users = User.objects.filter(role__in=CandidateSearchDocument.ROLES)
+        if options['missing']:
+            users = users.filter(~Exists(CandidateSearchDocument.objects.filter(user=OuterRef('pk'))))
+        user_ids = users.order_by('id').values_list('id', flat=True)
+        batch = []
+        for user_id in user_ids.iterator(chunk_size=options['batch_size']):
+            batch.append(user_id)
+            if len(batch) == options['batch_size']:
+                CandidateSearchDocument.refresh(batch, alert=False)
+                count += len(batch)
+                batch = []
+        CandidateSearchDocument.refresh(batch, alert=False)
+        count += len(batch)
+        CandidateSearchDocument.objects.exclude(user__role__in=CandidateSearchDocument.ROLES).delete()
+        self.stdout.write(self.style.SUCCESS(f'Search documents rebuilt for {count} candidates'))
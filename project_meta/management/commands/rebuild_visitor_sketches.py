@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from core.hyperloglog import HyperLogLog
+from users.models import VisitorLog, VisitorSketch
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the daily VisitorSketch rows from the stored VisitorLog rows'
+
+    def handle(self, *args, **options):
+        sketches = {}
+        visits = VisitorLog.objects.filter(
+            ip_address__isnull=False, created_at__isnull=False
+        ).order_by().values_list('created_at', 'ip_address')
+        for day, ip_address in visits.iterator(chunk_size=5000):
+            sketches.setdefault(day, HyperLogLog()).add(ip_address)
+        VisitorSketch.objects.bulk_create(
+            [VisitorSketch(date=day, registers=sketch.to_bytes()) for day, sketch in sketches.items()],
+            batch_size=500, update_conflicts=True, unique_fields=['date'], update_fields=['registers']
+        )
+        self.stdout.write(self.style.SUCCESS(f'{len(sketches)} VisitorSketch instances rebuilt'))
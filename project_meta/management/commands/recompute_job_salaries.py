@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from jobs.models import JobDetails
+
+
+class Command(BaseCommand):
+    help = 'Recompute the normalized annual salary of JobDetails instances from the exchange rates'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--currency', action='append', dest='currencies',
+            help='Only recompute the jobs in this currency (can be repeated)'
+        )
+
+    def handle(self, *args, **options):
+        updated = JobDetails.recompute_normalized_salaries(options['currencies'])
+        self.stdout.write(self.style.SUCCESS(f'Normalized salary recomputed for {updated} JobDetails instances'))
@@ -0,0 +1,40 @@
+from datetime import date, datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from superadmin.models import DailyAnalytics
+
+
+class Command(BaseCommand):
+    help = (
+        'Roll up the DailyAnalytics facts of the last days, or backfill them from a given date. '
+        'The whole history is backfilled while the table is empty'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=2, help='Number of days up to today to roll up')
+        parser.add_argument('--since', help='First day to backfill, as YYYY-MM-DD; overrides --days')
+        parser.add_argument('--batch-size', type=int, default=366, help='Number of days rolled up per query')
+
+    def handle(self, *args, **options):
+        end_date = date.today()
+        if options['since']:
+            try:
+                start_date = datetime.strptime(options['since'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError('--since must be a date formatted as YYYY-MM-DD')
+        elif not DailyAnalytics.objects.exists():
+            start_date = DailyAnalytics.get_first_day() or end_date
+        else:
+            start_date = end_date - timedelta(days=max(options['days'], 1) - 1)
+        start_date = min(start_date, end_date)
+        batch_start = start_date
+        while batch_start <= end_date:
+            batch_end = min(batch_start + timedelta(days=options['batch_size'] - 1), end_date)
+            with transaction.atomic():
+                DailyAnalytics.refresh(batch_start, batch_end)
+            batch_start = batch_end + timedelta(days=1)
+        DailyAnalytics.refresh_cohorts()
+        self.stdout.write(self.style.SUCCESS(
+            f'DailyAnalytics rolled up from {start_date} to {end_date}'
+        ))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from jobs.models import JobDetails
+from job_seekers.models import AppliedJob
+
+
+class Command(BaseCommand):
+    help = 'Compute the relevance score of every job application'
+
+    def handle(self, *args, **options):
+        count = 0
+        jobs = JobDetails.objects.filter(id__in=AppliedJob.objects.values('job')).order_by('created')
+        for job in jobs.iterator(chunk_size=500):
+            AppliedJob.score_relevance(job)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f'Applications scored for {count} jobs'))
@@ -1,20 +1,24 @@
 from django.core.management.base import BaseCommand
-from random import randint
 from django.template.defaultfilters import slugify
-from jobs.models import JobDetails
+from core.cache import bump_cache_version
+from core.slugs import backfill_slugs
+from jobs.models import JobDetails, JOB_SEARCH_CACHE
 
 
 class Command(BaseCommand):
     help = 'Update slugs for JobDetails instances where slug is not added'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of rows read and written per batch'
+        )
+
     def handle(self, *args, **options):
-        job_details = JobDetails.objects.all()
-        for job_detail in job_details:
-            
-            unique_slug = slugify(job_detail.title)
-            counter = 1
-            while JobDetails.objects.filter(slug=unique_slug).exclude(pk=job_detail.pk).exists():
-                unique_slug = f"{unique_slug}-{counter}"
-                counter += 1
-            JobDetails.objects.filter(pk=job_detail.pk).update(slug=unique_slug)
-            self.stdout.write(self.style.SUCCESS(f'Slug added for JobDetails instance with id {job_detail.id}'))
\ No newline at end of file
+        updated = backfill_slugs(
+            JobDetails.objects.only('id', 'title', 'slug', 'created'),
+            lambda job_detail: slugify(job_detail.title),
+            options['batch_size']
+        )
+        bump_cache_version(JOB_SEARCH_CACHE)
+        self.stdout.write(self.style.SUCCESS(f'Slug updated for {updated} JobDetails instances'))
@@ -1,20 +1,24 @@
 from django.core.management.base import BaseCommand
-from random import randint
 from django.template.defaultfilters import slugify
-from tenders.models import TenderDetails
+from core.cache import bump_cache_version
+from core.slugs import backfill_slugs
+from tenders.models import TenderDetails, TENDER_SEARCH_CACHE
 
 
 class Command(BaseCommand):
     help = 'Add slugs for TenderDetails instances where slug is not added'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of rows read and written per batch'
+        )
+
     def handle(self, *args, **options):
-        tender_details = TenderDetails.objects.all()
-        for tender_detail in tender_details:
-            unique_slug = slugify(tender_detail.title)
-            counter = 1
-            while TenderDetails.objects.filter(slug=unique_slug).exclude(pk=tender_detail.pk).exists():
-                unique_slug = f"{unique_slug}-{counter}"
-                counter += 1
-                
-            TenderDetails.objects.filter(pk=tender_detail.pk).update(slug=unique_slug)
-            self.stdout.write(self.style.SUCCESS(f'Slug added for TenderDetails instance with id {tender_detail.id}'))
+        updated = backfill_slugs(
+            TenderDetails.objects.only('id', 'title', 'slug', 'created'),
+            lambda tender_detail: slugify(tender_detail.title),
+            options['batch_size']
+        )
+        bump_cache_version(TENDER_SEARCH_CACHE)
+        self.stdout.write(self.style.SUCCESS(f'Slug updated for {updated} TenderDetails instances'))
@@ -0,0 +1,31 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:33
+
+from django.db import migrations, models
+import django.utils.timezone
+import model_utils.fields
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_meta', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExchangeRate',
+            fields=[
+                ('id', model_utils.fields.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('currency', models.CharField(db_column='currency', max_length=5, unique=True, verbose_name='Currency')),
+                ('rate', models.DecimalField(db_column='rate', decimal_places=8, max_digits=19, verbose_name='Rate')),
+                ('modified', model_utils.fields.AutoLastModifiedField(db_column='modified', default=django.utils.timezone.now, editable=False, verbose_name='Modified')),
+            ],
+            options={
+                'verbose_name': 'Exchange Rate',
+                'verbose_name_plural': 'Exchange Rates',
+                'db_table': 'ExchangeRate',
+                'ordering': ['currency'],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_meta', '0002_exchangerate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='media',
+            name='variants',
+            field=models.JSONField(blank=True, db_column='variants', default=dict, verbose_name='Variants'),
+        ),
+    ]
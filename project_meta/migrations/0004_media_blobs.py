@@ -0,0 +1,38 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('project_meta', '0003_media_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaBlob',
+            fields=[
+                ('id', model_utils.fields.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('sha256', models.CharField(db_column='sha256', max_length=64, unique=True, verbose_name='SHA-256')),
+                ('file', models.FileField(db_column='file', max_length=250, upload_to='', verbose_name='File')),
+                ('size', models.BigIntegerField(db_column='size', verbose_name='Size')),
+                ('created', model_utils.fields.AutoCreatedField(db_column='created', default=django.utils.timezone.now, editable=False, verbose_name='Created')),
+            ],
+            options={
+                'verbose_name': 'Media Blob',
+                'verbose_name_plural': 'Media Blobs',
+                'db_table': 'MediaBlob',
+                'ordering': ['-created'],
+            },
+        ),
+        migrations.AddField(
+            model_name='media',
+            name='blob',
+            field=models.ForeignKey(blank=True, db_column='blob', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='media', to='project_meta.mediablob', verbose_name='Blob'),
+        ),
+    ]
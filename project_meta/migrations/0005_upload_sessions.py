@@ -0,0 +1,40 @@
+# Generated by Django 4.1.5 on 2026-10-19 01:01
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('project_meta', '0004_media_blobs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', model_utils.fields.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(db_column='filename', max_length=250, verbose_name='File Name')),
+                ('content_type', models.CharField(blank=True, db_column='content_type', max_length=250, verbose_name='Content Type')),
+                ('size', models.BigIntegerField(db_column='size', verbose_name='Size')),
+                ('offset', models.BigIntegerField(db_column='offset', default=0, verbose_name='Offset')),
+                ('checksum', models.CharField(blank=True, db_column='checksum', max_length=64, verbose_name='Checksum')),
+                ('created', model_utils.fields.AutoCreatedField(db_column='created', default=django.utils.timezone.now, editable=False, verbose_name='Created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(db_column='modified', default=django.utils.timezone.now, editable=False, verbose_name='Modified')),
+                ('media', models.ForeignKey(blank=True, db_column='media', null=True, on_delete=django.db.models.deletion.SET_NULL, to='project_meta.media', verbose_name='Media')),
+                ('user', models.ForeignKey(db_column='user', on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)s_user', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Upload Session',
+                'verbose_name_plural': 'Upload Sessions',
+                'db_table': 'UploadSession',
+                'ordering': ['-created'],
+            },
+        ),
+    ]
@@ -1,11 +1,93 @@
-from django.db import models
+import logging
+import os
+import threading
+
+from django.core.files.base import ContentFile, File
+from django.db import connections, models, transaction
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
 from django.utils.translation import gettext as _
 from django.template.defaultfilters import slugify
 
+from core.images import render_variant
+from core.uploads import file_sha256
 from core.models import (
     BaseModel, SlugBaseModel, upload_directory_path
 )
+from koor.config.common import Common
 from model_utils import models as misc_models
+from model_utils.fields import AutoCreatedField, AutoLastModifiedField
+
+logger = logging.getLogger(__name__)
+
+
+class MediaBlob(BaseModel, models.Model):
+    """
+    This table stores every distinct uploaded file once, addressed by the SHA-256 digest of its content.
+
+    Uploading content that is already stored reuses its blob instead of writing the file again, and `Media` rows
+    point at the blob. Blobs no `Media` row references are removed by the `collect_media_blobs` command.
+
+    Columns:
+    - `sha256`: The hex SHA-256 digest of the content.
+    - `file`: The stored file, `blobs/<2 digest chars>/<2 digest chars>/<digest><extension>`.
+    - `size`: The size of the file in bytes.
+    - `created`: The date and time the content was first stored.
+    """
+    DIRECTORY = 'blobs'
+    sha256 = models.CharField(
+        verbose_name=_('SHA-256'),
+        max_length=64,
+        unique=True,
+        db_column="sha256",
+    )
+    file = models.FileField(
+        verbose_name=_('File'),
+        max_length=250,
+        db_column="file",
+    )
+    size = models.BigIntegerField(
+        verbose_name=_('Size'),
+        db_column="size",
+    )
+    created = AutoCreatedField(
+        verbose_name=_('Created'),
+        db_column="created",
+    )
+
+    def __str__(self):
+        return str(self.sha256)
+
+    class Meta:
+        verbose_name = "Media Blob"
+        verbose_name_plural = "Media Blobs"
+        db_table = "MediaBlob"
+        ordering = ['-created']
+
+    @classmethod
+    def get_blob_path(cls, sha256, extension):
+        return '{0}/{1}/{2}/{3}{4}'.format(cls.DIRECTORY, sha256[:2], sha256[2:4], sha256, extension)
+
+    @classmethod
+    def store(cls, content, name):
+        """
+        Return the blob of the Django `File` `content`, writing the file only when the content is new. `name` is
+        the uploaded file name, its extension is kept so the served file gets the right content type.
+        """
+        sha256 = file_sha256(content)
+        blob = cls.objects.filter(sha256=sha256).first()
+        if blob:
+            return blob
+        storage = cls._meta.get_field('file').storage
+        path = cls.get_blob_path(sha256, os.path.splitext(name)[1].lower()[:10])
+        if not storage.exists(path):
+            path = storage.save(path, content)
+        # A concurrent upload of the same content may have created the row meanwhile, the file it wrote then
+        # isn't referenced and is removed by `collect_media_blobs`.
+        blob, created = cls.objects.get_or_create(sha256=sha256, defaults={'file': path, 'size': content.size})
+        return blob
 
 
 class Media(BaseModel, models.Model):
@@ -15,6 +97,9 @@ class Media(BaseModel, models.Model):
     Columns: 
     - `filepath`: A string representing the path of the media file. 
     - `mediatype`: A string representing the type of media (e.g. image, video, audio).
+    - `blob`: The deduplicated stored content (see `MediaBlob`), `filepath` is the name of its file.
+    - `variants`: A dictionary mapping the name of each generated derivative of an image (see `VARIANTS`) to its
+        file name in the storage.
 
     Returns: models.Model. 
     """
@@ -23,6 +108,13 @@ class Media(BaseModel, models.Model):
         ('video', "Video"),
         ('document', "Document"),
     )
+    # Derivatives generated for every uploaded image, stored next to the original.
+    VARIANTS = {
+        'thumbnail': {'size': (128, 128), 'crop': True, 'image_format': 'JPEG'},
+        'thumbnail_webp': {'size': (128, 128), 'crop': True, 'image_format': 'WEBP'},
+        'card': {'size': (400, 400), 'crop': False, 'image_format': 'JPEG'},
+        'card_webp': {'size': (400, 400), 'crop': False, 'image_format': 'WEBP'},
+    }
     title = models.CharField(
         verbose_name=_('Title'),
         max_length=250,
@@ -42,6 +134,21 @@ class Media(BaseModel, models.Model):
         choices=MEDIA_TYPE_CHOICE,
         default='image'
     )
+    blob = models.ForeignKey(
+        MediaBlob,
+        verbose_name=_('Blob'),
+        on_delete=models.PROTECT,
+        related_name='media',
+        null=True,
+        blank=True,
+        db_column="blob"
+    )
+    variants = models.JSONField(
+        verbose_name=_('Variants'),
+        default=dict,
+        blank=True,
+        db_column="variants"
+    )
 
     def __str__(self):
         return str(self.file_path)
@@ -51,6 +158,203 @@ class Media(BaseModel, models.Model):
         verbose_name_plural = "Media"
         db_table = "Media"
 
+    def save(self, *args, **kwargs):
+        if self.file_path and not self.file_path._committed:
+            # Store a new upload by its content instead of under `upload_to`, identical uploads share one file.
+            self.blob = MediaBlob.store(self.file_path.file, self.file_path.name)
+            self.file_path.name = self.blob.file.name
+            self.file_path._committed = True
+        super().save(*args, **kwargs)
+
+    def get_variant_url(self, name):
+        """
+        Return the URL of the `name` variant, or of the original file while the variant is not generated (yet).
+        """
+        if name in self.variants:
+            return self.file_path.storage.url(self.variants[name])
+        return self.file_path.url
+
+    def generate_variants(self):
+        """
+        Render every variant of `VARIANTS` missing for this image, save them next to the original and record them
+        in `variants`. Files Pillow can't read (e.g. SVG) are left without variants.
+        """
+        storage = self.file_path.storage
+        if not storage.exists(self.file_path.name):
+            # Social login profile images only store the URL of the provider.
+            return
+        base_name = os.path.splitext(self.file_path.name)[0]
+        variants = dict(self.variants)
+        if self.blob_id:
+            # Another upload of the same content already has the variants.
+            sibling_variants = Media.objects.filter(blob=self.blob_id).exclude(id=self.id).exclude(
+                variants={}
+            ).values_list('variants', flat=True).first()
+            variants = {**(sibling_variants or {}), **variants}
+        try:
+            for name, spec in self.VARIANTS.items():
+                if name in variants:
+                    continue
+                with storage.open(self.file_path.name, 'rb') as source:
+                    content, extension = render_variant(source, **spec)
+                variants[name] = storage.save(
+                    '{0}.{1}.{2}'.format(base_name, name, extension), ContentFile(content)
+                )
+        except Exception:
+            logger.exception('Generating the variants of media %s failed', self.id)
+        if variants != self.variants:
+            self.variants = variants
+            Media.objects.filter(id=self.id).update(variants=variants)
+
+
+class UploadSession(BaseModel, models.Model):
+    """
+    This table stores the state of a resumable chunked upload.
+
+    The client declares the file, sends it in chunks with `Content-Range` PUTs that are written to
+    `CHUNKED_UPLOAD_DIRECTORY` as they stream in, and completes the upload, which creates the `Media` row. A chunk
+    that was already received is accepted again without effect, so a client resumes a broken upload from `offset`.
+
+    Columns:
+    - `user`: The user uploading the file.
+    - `filename`: The name of the uploaded file.
+    - `content_type`: The content type declared by the client.
+    - `size`: The size of the file in bytes.
+    - `offset`: The number of bytes received, from the start of the file.
+    - `checksum`: The optional hex SHA-256 digest of the file, checked when the upload is completed.
+    - `media`: The Media created by completing the upload.
+    - `created`: The date and time the upload was started.
+    - `modified`: The date and time the last chunk was received.
+    """
+    user = models.ForeignKey(
+        'users.User',
+        verbose_name=_('User'),
+        on_delete=models.CASCADE,
+        db_column="user",
+        related_name='%(app_label)s_%(class)s_user'
+    )
+    filename = models.CharField(
+        verbose_name=_('File Name'),
+        max_length=250,
+        db_column="filename",
+    )
+    content_type = models.CharField(
+        verbose_name=_('Content Type'),
+        max_length=250,
+        db_column="content_type",
+        blank=True
+    )
+    size = models.BigIntegerField(
+        verbose_name=_('Size'),
+        db_column="size",
+    )
+    offset = models.BigIntegerField(
+        verbose_name=_('Offset'),
+        default=0,
+        db_column="offset",
+    )
+    checksum = models.CharField(
+        verbose_name=_('Checksum'),
+        max_length=64,
+        db_column="checksum",
+        blank=True
+    )
+    media = models.ForeignKey(
+        Media,
+        verbose_name=_('Media'),
+        on_delete=models.SET_NULL,
+        db_column="media",
+        null=True,
+        blank=True
+    )
+    created = AutoCreatedField(
+        verbose_name=_('Created'),
+        db_column="created",
+    )
+    modified = AutoLastModifiedField(
+        verbose_name=_('Modified'),
+        db_column="modified",
+    )
+
+    def __str__(self):
+        return str(self.filename)
+
+    class Meta:
+        verbose_name = "Upload Session"
+        verbose_name_plural = "Upload Sessions"
+        db_table = "UploadSession"
+        ordering = ['-created']
+
+    @classmethod
+    def get_completed_media(cls, user, upload_ids):
+        """
+        Return the Media of the completed uploads of `user` among `upload_ids`, in the order of `upload_ids`.
+        """
+        media = {
+            upload.id: upload.media
+            for upload in cls.objects.filter(user=user, id__in=upload_ids, media__isnull=False).select_related('media')
+        }
+        return [media[upload_id] for upload_id in upload_ids if upload_id in media]
+
+    @property
+    def part_path(self):
+        return os.path.join(Common.CHUNKED_UPLOAD_DIRECTORY, '{0}.part'.format(self.id))
+
+    @property
+    def media_type(self):
+        content_type = self.content_type.split("/")
+        return 'document' if content_type[0] not in ["video", "image"] else content_type[0]
+
+    def write_chunk(self, stream, start, length):
+        """
+        Write up to `length` bytes read from `stream` at `start` and move `offset` past them. The body is copied in
+        blocks, so memory use doesn't depend on the chunk size, and the bytes received before a connection drops
+        are kept. Returns the number of bytes written.
+        """
+        os.makedirs(Common.CHUNKED_UPLOAD_DIRECTORY, exist_ok=True)
+        position = start
+        part = os.open(self.part_path, os.O_WRONLY | os.O_CREAT, 0o600)
+        try:
+            while position < start + length:
+                data = stream.read(min(64 * 1024, start + length - position))
+                if not data:
+                    break
+                os.pwrite(part, data, position)
+                position += len(data)
+        finally:
+            os.close(part)
+        if position > start:
+            # A retried chunk overlapping the received bytes rewrites the same content, the offset never moves back.
+            UploadSession.objects.filter(id=self.id, offset__gte=start).update(
+                offset=Greatest('offset', position), modified=timezone.now()
+            )
+            self.refresh_from_db(fields=['offset', 'modified'])
+        return position - start
+
+    def complete(self):
+        """
+        Validate the received file and create its `Media`. Completing an upload again returns the same Media.
+        Raises ValueError when the file is incomplete or doesn't match `checksum`; a corrupted file is discarded
+        and the upload restarts from zero.
+        """
+        if self.media_id:
+            return self.media
+        if self.offset < self.size or not os.path.exists(self.part_path):
+            raise ValueError('The upload is incomplete, {0} of {1} bytes received.'.format(self.offset, self.size))
+        with open(self.part_path, 'rb') as part:
+            content = File(part, name=self.filename)
+            content.sha256 = file_sha256(content)
+            if content.size != self.size or (self.checksum and content.sha256 != self.checksum.lower()):
+                os.remove(self.part_path)
+                UploadSession.objects.filter(id=self.id).update(offset=0)
+                raise ValueError('The uploaded file does not match its size or checksum, upload it again.')
+            media = Media(title=self.filename, file_path=content, media_type=self.media_type)
+            media.save()
+        os.remove(self.part_path)
+        self.media = media
+        self.save(update_fields=['media', 'modified'])
+        return media
+
 
 class Tag(SlugBaseModel, models.Model):
     """
@@ -307,3 +611,61 @@ class OpportunityType(SlugBaseModel, models.Model):
         db_table = "OpportunityType"
         ordering = ['title']
 
+
+
+class ExchangeRate(BaseModel, models.Model):
+    """
+    This table stores the exchange rates used to normalize job salaries to the reference currency
+    (`SALARY_REFERENCE_CURRENCY`).
+
+    Columns:
+    - `currency`: A string representing the currency code (e.g. KES, USD).
+    - `rate`: The value of one unit of the currency in the reference currency.
+    - `modified`: The date and time the rate was last updated.
+    """
+    currency = models.CharField(
+        verbose_name=_('Currency'),
+        max_length=5,
+        unique=True,
+        db_column="currency",
+    )
+    rate = models.DecimalField(
+        verbose_name=_('Rate'),
+        max_digits=19,
+        decimal_places=8,
+        db_column="rate",
+    )
+    modified = AutoLastModifiedField(
+        verbose_name=_('Modified'),
+        db_column="modified",
+    )
+
+    def __str__(self):
+        return str(self.currency)
+
+    class Meta:
+        verbose_name = "Exchange Rate"
+        verbose_name_plural = "Exchange Rates"
+        db_table = "ExchangeRate"
+        ordering = ['currency']
+
+
+def generate_media_variants(media_id):
+    try:
+        Media.objects.get(id=media_id).generate_variants()
+    except Media.DoesNotExist:
+        pass
+    finally:
+        connections.close_all()
+
+
+@receiver(post_save, sender=Media)
+def schedule_media_variants(sender, instance, created, **kwargs):
+    """
+    Generate the variants of a new image in a background thread once the upload is committed, so the request
+    doesn't wait for the resizing.
+    """
+    if created and instance.media_type == 'image' and instance.file_path:
+        transaction.on_commit(
+            lambda: threading.Thread(target=generate_media_variants, args=(instance.id,)).start()
+        )
@@ -1,9 +1,13 @@
+import re
+
 from rest_framework import serializers
 
+from koor.config.common import Common
+
 from .models import (
     City, Country, Language,
     Skill, EducationLevel, Tag,
-    Choice, OpportunityType
+    Choice, OpportunityType, UploadSession
 )
 
 
@@ -156,3 +160,33 @@ class OpportunityTypeSerializer(serializers.ModelSerializer):
             'id',
             'title',
         )
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """
+    Serializer starting a resumable chunked upload and reporting its progress.
+
+    Attributes:
+        - `filename (str)`: The name of the file.
+        - `content_type (str)`: The content type of the file, e.g. `application/pdf`.
+        - `size (int)`: The size of the file in bytes, at most `CHUNKED_UPLOAD_MAX_SIZE`.
+        - `checksum (str)`: Optional hex SHA-256 digest of the file, checked when the upload is completed.
+        - `offset (int)`: Read only, the number of bytes received so far; the next chunk starts there.
+    """
+
+    class Meta:
+        model = UploadSession
+        fields = ['id', 'filename', 'content_type', 'size', 'checksum', 'offset']
+        read_only_fields = ['id', 'offset']
+
+    def validate_size(self, size):
+        if size <= 0 or size > Common.CHUNKED_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                'The size must be between 1 and {0} bytes.'.format(Common.CHUNKED_UPLOAD_MAX_SIZE)
+            )
+        return size
+
+    def validate_checksum(self, checksum):
+        if checksum and not re.fullmatch(r'[0-9a-fA-F]{64}', checksum):
+            raise serializers.ValidationError('The checksum must be a hex SHA-256 digest.')
+        return checksum.lower()
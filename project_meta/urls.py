@@ -0,0 +1,13 @@
+from django.urls import path
+
+from .views import (
+    UploadSessionView, UploadChunkView, UploadCompleteView
+)
+
+app_name = "project_meta"
+
+urlpatterns = [
+    path("", UploadSessionView.as_view(), name="upload_session"),
+    path("/<uuid:uploadId>", UploadChunkView.as_view(), name="upload_chunk"),
+    path("/<uuid:uploadId>/complete", UploadCompleteView.as_view(), name="upload_complete"),
+]
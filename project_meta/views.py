@@ -1,3 +1,109 @@
-from django.shortcuts import render
+import re
 
-# Create your views here.
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+
+from rest_framework import generics, permissions, response, serializers, status
+
+from koor.config.common import Common
+
+from .models import UploadSession
+from .serializers import UploadSessionSerializer
+
+CONTENT_RANGE_RE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+
+
+class UploadSessionView(generics.GenericAPIView):
+    """
+    Starts a resumable chunked upload, see `UploadChunkView` and `UploadCompleteView` for the next steps.
+
+    The response contains the `id` of the upload, used in the URL of the following calls.
+    """
+
+    serializer_class = UploadSessionSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = self.serializer_class(data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+            serializer.save(user=request.user)
+            return response.Response(data=serializer.data, status=status.HTTP_201_CREATED)
+        except serializers.ValidationError:
+            return response.Response(
+                data=serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+
+class UploadChunkView(generics.GenericAPIView):
+    """
+    Receives the chunks of a resumable upload and reports its progress.
+
+    Methods:
+        - `get(request, uploadId)`: Return the upload with its `offset`, where a broken upload resumes.
+        - `put(request, uploadId)`: Write the raw request body at the position given by the
+            `Content-Range: bytes <first>-<last>/<size>` header. The chunk must start at or before `offset`; chunks
+            already received are accepted again, so a retried request is harmless. A chunk starting after `offset`
+            is answered with `409 Conflict` and the current `offset`.
+    """
+
+    serializer_class = UploadSessionSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, uploadId):
+        upload = get_object_or_404(UploadSession, id=uploadId, user=request.user)
+        return response.Response(data=self.serializer_class(upload).data, status=status.HTTP_200_OK)
+
+    def put(self, request, uploadId):
+        context = dict()
+        upload = get_object_or_404(UploadSession, id=uploadId, user=request.user)
+        match = CONTENT_RANGE_RE.match(request.headers.get('Content-Range', ''))
+        if not match:
+            context['message'] = ["A Content-Range header 'bytes <first>-<last>/<size>' is required."]
+            return response.Response(data=context, status=status.HTTP_400_BAD_REQUEST)
+        start, end, size = (int(value) for value in match.groups())
+        length = end - start + 1
+        if size != upload.size or length <= 0 or end >= upload.size:
+            context['message'] = ["The Content-Range does not fit the size of the upload."]
+            return response.Response(data=context, status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+        if length > Common.CHUNKED_UPLOAD_MAX_CHUNK_SIZE or int(request.headers.get('Content-Length') or 0) != length:
+            context['message'] = [
+                "The body must have the length of the Content-Range and be at most {0} bytes.".format(
+                    Common.CHUNKED_UPLOAD_MAX_CHUNK_SIZE
+                )
+            ]
+            return response.Response(data=context, status=status.HTTP_400_BAD_REQUEST)
+        if upload.media_id or start > upload.offset:
+            return response.Response(data=self.serializer_class(upload).data, status=status.HTTP_409_CONFLICT)
+        # The body is read from the request stream, never through `request.data`, so it isn't buffered.
+        upload.write_chunk(request.stream, start, length)
+        return response.Response(data=self.serializer_class(upload).data, status=status.HTTP_200_OK)
+
+
+class UploadCompleteView(generics.GenericAPIView):
+    """
+    Completes a resumable upload: the received file is checked against the declared size and checksum and stored
+    as a `Media`, returned like an uploaded chat attachment. Completing an upload again returns the same Media.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, uploadId):
+        context = dict()
+        with transaction.atomic():
+            upload = get_object_or_404(UploadSession.objects.select_for_update(), id=uploadId, user=request.user)
+            try:
+                media_instance = upload.complete()
+            except ValueError as error:
+                context['message'] = [str(error)]
+                return response.Response(data=context, status=status.HTTP_400_BAD_REQUEST)
+        return response.Response(
+            data={
+                'id': str(media_instance.id),
+                'title': media_instance.title,
+                'media_type': media_instance.media_type,
+                'path': media_instance.file_path.url
+            },
+            status=status.HTTP_201_CREATED
+        )
@@ -0,0 +1,20 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:43
+
+from core.identifiers import create_identifier_sequence
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('superadmin', '0011_invoice_tender'),
+    ]
+
+    operations = [
+        create_identifier_sequence('invoice_identifier_seq'),
+        migrations.AlterField(
+            model_name='invoice',
+            name='invoice_id',
+            field=models.CharField(blank=True, db_column='invoice_id', max_length=255, null=True, unique=True, verbose_name='Invoice Id'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.1.5 on 2026-10-19 01:41
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('superadmin', '0012_invoice_id_sequence'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyAnalytics',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('id', model_utils.fields.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('date', models.DateField(db_column='date', unique=True, verbose_name='Date')),
+                ('users', models.PositiveIntegerField(db_column='users', default=0, verbose_name='Users')),
+                ('job_seekers', models.PositiveIntegerField(db_column='job_seekers', default=0, verbose_name='Job Seekers')),
+                ('employers', models.PositiveIntegerField(db_column='employers', default=0, verbose_name='Employers')),
+                ('vendors', models.PositiveIntegerField(db_column='vendors', default=0, verbose_name='Vendors')),
+                ('jobs_open', models.PositiveIntegerField(db_column='jobs_open', default=0, verbose_name='Jobs Open')),
+                ('active_jobs_open', models.PositiveIntegerField(db_column='active_jobs_open', default=0, verbose_name='Active Jobs Open')),
+                ('jobs_started', models.PositiveIntegerField(db_column='jobs_started', default=0, verbose_name='Jobs Started')),
+                ('active_jobs_started', models.PositiveIntegerField(db_column='active_jobs_started', default=0, verbose_name='Active Jobs Started')),
+                ('recharges', models.PositiveIntegerField(db_column='recharges', default=0, verbose_name='Recharges')),
+                ('gold_recharges', models.PositiveIntegerField(db_column='gold_recharges', default=0, verbose_name='Gold Recharges')),
+                ('silver_recharges', models.PositiveIntegerField(db_column='silver_recharges', default=0, verbose_name='Silver Recharges')),
+                ('copper_recharges', models.PositiveIntegerField(db_column='copper_recharges', default=0, verbose_name='Copper Recharges')),
+                ('active_users', models.PositiveIntegerField(db_column='active_users', default=0, verbose_name='Active Users')),
+                ('live_jobs_created', models.PositiveIntegerField(db_column='live_jobs_created', default=0, verbose_name='Live Jobs Created')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'verbose_name': 'Daily Analytics',
+                'verbose_name_plural': 'Daily Analytics',
+                'db_table': 'DailyAnalytics',
+                'ordering': ['-date'],
+            },
+        ),
+    ]
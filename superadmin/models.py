@@ -1,19 +1,21 @@
-import random, string
-from django.db import models
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+
+from django.db import models, transaction
 from django.db.models.signals import pre_save
 from django.utils.translation import gettext as _
 from django.template.defaultfilters import slugify
 from django.contrib.postgres.fields import ArrayField
 
-from random import randint
 from jobs.models import JobDetails
 from tenders.models import TenderDetails
+from core.identifiers import next_identifier
 from core.models import (
     BaseModel, SlugBaseModel, SoftDeleteModel, upload_directory_path
 )
 
 from users.models import (
-    TimeStampedModel, User
+    TimeStampedModel, User, UserSession
 )
 from project_meta.models import Media
 
@@ -773,7 +775,8 @@ class Invoice(BaseModel, TimeStampedModel, models.Model):
         max_length=255,
         db_column="invoice_id",
         null=True,
-        blank=True
+        blank=True,
+        unique=True
     )
     start_date = models.DateField(
         verbose_name=_('Start Date'),
@@ -838,60 +841,29 @@ class Invoice(BaseModel, TimeStampedModel, models.Model):
         db_table = "Invoice"
 
 
-def random_number_generator(size=6, chars=string.digits):
-    """
-    Generate a random string composed of specified characters.
-
-    This function generates a random string of specified size, composed of characters from the given 'chars' parameter.
-    By default, it generates a random number string of size 6 composed of digits.
-
-    Args:
-        size (int, optional): The length of the random string to be generated. Defaults to 6.
-        chars (str, optional): The pool of characters from which the random string is formed. Defaults to string.digits.
-
-    Returns:
-        str: A random string of the specified size composed of the provided characters.
-
-    Example:
-        >>> random_number_generator()
-        '325819'
-        >>> random_number_generator(8, 'ABCDEF')
-        'BFAEDCDB'
-    """
-
-    return ''.join(random.choice(chars) for _ in range(size))
+# Postgres sequence the invoice IDs are allocated from, created by the `0012_invoice_id_sequence` migration.
+INVOICE_ID_SEQUENCE = "invoice_identifier_seq"
 
 
 def invoice_id_generator(instance):
     """
-    Generate a unique invoice ID for the given instance using a random number generator.
+    Generate a unique invoice ID for the given instance from the `INVOICE_ID_SEQUENCE` Postgres sequence.
 
-    This function generates a unique invoice ID for the provided instance by repeatedly generating random numbers until
-    a unique ID is found within the corresponding model's database records. It prevents duplicate invoice IDs by
-    checking for existing records with the generated ID.
+    The sequence never hands out a value twice, so the ID is allocated with a single query and without checking the
+    existing records. The `invoice_id` column is additionally covered by a unique constraint.
 
     Args:
-        instance: An instance of a Django model for which the invoice ID needs to be generated.
+        instance: The Invoice instance the ID is generated for.
 
     Returns:
-        str: A unique invoice ID for the provided instance.
-
-    Note:
-        This function assumes the existence of a random_number_generator function and a corresponding model with an
-        'invoice_id' field, represented by user_instance.
+        str: A unique invoice ID in the format `"XXXX-XXXX"`.
 
     Example:
-        # Assuming there's a model named 'Invoice' with an 'invoice_id' field
         new_invoice = Invoice(...)
         unique_invoice_id = invoice_id_generator(new_invoice)
     """
 
-    invoice_id = random_number_generator()
-    user_instance = instance.__class__
-    qs_exists = user_instance.objects.filter(invoice_id=invoice_id).exists()
-    if qs_exists:
-        return invoice_id_generator(instance)
-    return invoice_id
+    return next_identifier(INVOICE_ID_SEQUENCE)
 
 
 def pre_save_create_invoice_id(sender, instance, *args, **kwargs):
@@ -1026,3 +998,286 @@ class Rights(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         db_table = "Rights"
         ordering = ['-created']
 
+
+class DailyAnalytics(BaseModel, TimeStampedModel, models.Model):
+    """
+    Daily fact table of the admin dashboards, so `UsersCountView`, `DashboardView` and `FinancialCountView` answer any
+    period with one aggregation over a few rows per day instead of counting the raw tables.
+
+    The facts of a day are recomputed by the `rollup_daily_analytics` management command every hour for the last
+    days; its first run on an empty table, or a run with `--since`, backfills the history. The cohort columns depend on the current state of the
+    users, sessions or jobs, e.g. a job no longer active, so every run recomputes them for all days from the few open
+    sessions and active jobs.
+
+    Columns:
+    - `date`: the day of the facts
+    - `users`, `job_seekers`, `employers`, `vendors`: the sign-ups of the day, `users` counts every role but admin
+    - `jobs_open`: the jobs whose start date and deadline include the day
+    - `jobs_started`: the jobs starting on the day
+    - `recharges`, `gold_recharges`, `silver_recharges`, `copper_recharges`: the recharges of the day, per package
+    - `active_jobs_open`, `active_jobs_started` (cohort): as `jobs_open` and `jobs_started`, for the active jobs
+    - `active_users` (cohort): the users who signed up on the day and have an open session
+    - `live_jobs_created` (cohort): the jobs created on the day that are active and running today
+    """
+    date = models.DateField(
+        verbose_name=_('Date'),
+        unique=True,
+        db_column="date",
+    )
+    users = models.PositiveIntegerField(
+        verbose_name=_('Users'),
+        default=0,
+        db_column="users",
+    )
+    job_seekers = models.PositiveIntegerField(
+        verbose_name=_('Job Seekers'),
+        default=0,
+        db_column="job_seekers",
+    )
+    employers = models.PositiveIntegerField(
+        verbose_name=_('Employers'),
+        default=0,
+        db_column="employers",
+    )
+    vendors = models.PositiveIntegerField(
+        verbose_name=_('Vendors'),
+        default=0,
+        db_column="vendors",
+    )
+    jobs_open = models.PositiveIntegerField(
+        verbose_name=_('Jobs Open'),
+        default=0,
+        db_column="jobs_open",
+    )
+    active_jobs_open = models.PositiveIntegerField(
+        verbose_name=_('Active Jobs Open'),
+        default=0,
+        db_column="active_jobs_open",
+    )
+    jobs_started = models.PositiveIntegerField(
+        verbose_name=_('Jobs Started'),
+        default=0,
+        db_column="jobs_started",
+    )
+    active_jobs_started = models.PositiveIntegerField(
+        verbose_name=_('Active Jobs Started'),
+        default=0,
+        db_column="active_jobs_started",
+    )
+    recharges = models.PositiveIntegerField(
+        verbose_name=_('Recharges'),
+        default=0,
+        db_column="recharges",
+    )
+    gold_recharges = models.PositiveIntegerField(
+        verbose_name=_('Gold Recharges'),
+        default=0,
+        db_column="gold_recharges",
+    )
+    silver_recharges = models.PositiveIntegerField(
+        verbose_name=_('Silver Recharges'),
+        default=0,
+        db_column="silver_recharges",
+    )
+    copper_recharges = models.PositiveIntegerField(
+        verbose_name=_('Copper Recharges'),
+        default=0,
+        db_column="copper_recharges",
+    )
+    active_users = models.PositiveIntegerField(
+        verbose_name=_('Active Users'),
+        default=0,
+        db_column="active_users",
+    )
+    live_jobs_created = models.PositiveIntegerField(
+        verbose_name=_('Live Jobs Created'),
+        default=0,
+        db_column="live_jobs_created",
+    )
+
+    FACT_FIELDS = (
+        'users', 'job_seekers', 'employers', 'vendors', 'jobs_open', 'jobs_started', 'recharges', 'gold_recharges',
+        'silver_recharges', 'copper_recharges'
+    )
+    COHORT_FIELDS = ('active_jobs_open', 'active_jobs_started', 'active_users', 'live_jobs_created')
+    # Sign-up column per user role and recharge column per package.
+    ROLE_FIELDS = {'job_seeker': 'job_seekers', 'employer': 'employers', 'vendor': 'vendors'}
+    PACKAGE_FIELDS = {'gold': 'gold_recharges', 'silver': 'silver_recharges', 'copper': 'copper_recharges'}
+
+    def __str__(self):
+        return str(self.date)
+
+    class Meta:
+        verbose_name = "Daily Analytics"
+        verbose_name_plural = "Daily Analytics"
+        db_table = "DailyAnalytics"
+        ordering = ['-date']
+
+    @staticmethod
+    def to_date(value):
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return datetime.strptime(str(value), '%Y-%m-%d').date()
+
+    @staticmethod
+    def get_first_day():
+        """
+        Return the first day with a sign-up, a recharge or a running job, or None if there is none: where a backfill
+        of the whole history starts.
+        """
+        days = [
+            User.objects.exclude(role='admin').aggregate(day=models.Min('date_joined__date'))['day'],
+            RechargeHistory.objects.aggregate(day=models.Min('created__date'))['day'],
+            JobDetails.objects.aggregate(day=models.Min('start_date'))['day'],
+        ]
+        days = [day for day in days if day is not None]
+        return min(days) if days else None
+
+    @staticmethod
+    def count_jobs(jobs, start_date, end_date):
+        """
+        Return `{day: (open jobs, started jobs)}` for every day from `start_date` to `end_date` of the `(start date,
+        deadline)` pairs of `jobs`. Every job adds one to the days between its start date and its deadline; the
+        changes are collected per day and summed up once over the range.
+        """
+        opened, started = Counter(), Counter()
+        for job_start, deadline in jobs:
+            if job_start >= start_date:
+                started[job_start] += 1
+            opened[max(job_start, start_date)] += 1
+            opened[deadline + timedelta(days=1)] -= 1
+        counts, running, day = {}, 0, start_date
+        while day <= end_date:
+            running += opened[day]
+            counts[day] = (running, started[day])
+            day += timedelta(days=1)
+        return counts
+
+    @classmethod
+    def refresh(cls, start_date, end_date):
+        """
+        Recompute the facts of every day from `start_date` to `end_date`, both included, with one grouped query per
+        source table and a single upsert. Days without any activity get a row of zeros, so the open jobs of every
+        day of the range are known.
+        """
+        start_date, end_date = cls.to_date(start_date), cls.to_date(end_date)
+        days = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+        if not days:
+            return
+        facts = {day: dict.fromkeys(cls.FACT_FIELDS, 0) for day in days}
+
+        sign_ups = User.objects.filter(
+            date_joined__date__gte=start_date, date_joined__date__lte=end_date
+        ).exclude(role='admin').values_list('date_joined__date', 'role').annotate(count=models.Count('id')).order_by()
+        for day, role, count in sign_ups:
+            facts[day]['users'] += count
+            if role in cls.ROLE_FIELDS:
+                facts[day][cls.ROLE_FIELDS[role]] += count
+
+        recharges = RechargeHistory.objects.filter(
+            created__date__gte=start_date, created__date__lte=end_date
+        ).values_list('created__date', 'package').annotate(count=models.Count('id')).order_by()
+        for day, package, count in recharges:
+            facts[day]['recharges'] += count
+            if package in cls.PACKAGE_FIELDS:
+                facts[day][cls.PACKAGE_FIELDS[package]] += count
+
+        jobs = JobDetails.objects.filter(
+            start_date__lte=end_date, deadline__gte=start_date
+        ).filter(deadline__gte=models.F('start_date')).values_list('start_date', 'deadline')
+        for day, (jobs_open, jobs_started) in cls.count_jobs(jobs, start_date, end_date).items():
+            facts[day]['jobs_open'] = jobs_open
+            facts[day]['jobs_started'] = jobs_started
+
+        cls.objects.bulk_create(
+            [cls(date=day, **values) for day, values in facts.items()],
+            update_conflicts=True,
+            unique_fields=['date'],
+            update_fields=list(cls.FACT_FIELDS) + ['modified'],
+        )
+
+    @classmethod
+    def refresh_cohorts(cls):
+        """
+        Recompute the cohort columns of every day: the active jobs open and starting on the rolled up days, the
+        users with an open session per sign-up day and the running active jobs per creation day.
+        """
+        today = date.today()
+        cohorts = defaultdict(lambda: dict.fromkeys(cls.COHORT_FIELDS, 0))
+        bounds = cls.objects.aggregate(first_day=models.Min('date'), last_day=models.Max('date'))
+        if bounds['first_day']:
+            active_jobs = JobDetails.objects.filter(
+                status='active', start_date__lte=bounds['last_day'], deadline__gte=bounds['first_day']
+            ).filter(deadline__gte=models.F('start_date')).values_list('start_date', 'deadline')
+            counts = cls.count_jobs(active_jobs, bounds['first_day'], bounds['last_day'])
+            for day, (jobs_open, jobs_started) in counts.items():
+                if jobs_open or jobs_started:
+                    cohorts[day]['active_jobs_open'] = jobs_open
+                    cohorts[day]['active_jobs_started'] = jobs_started
+        active_users = UserSession.objects.filter(expire_at=None).exclude(user__role='admin').values_list(
+            'user__date_joined__date'
+        ).annotate(count=models.Count('user', distinct=True)).order_by()
+        for day, count in active_users:
+            cohorts[day]['active_users'] = count
+        live_jobs = JobDetails.objects.filter(
+            status='active', start_date__lte=today, deadline__gte=today
+        ).values_list('created__date').annotate(count=models.Count('id')).order_by()
+        for day, count in live_jobs:
+            cohorts[day]['live_jobs_created'] = count
+        with transaction.atomic():
+            cls.objects.exclude(date__in=list(cohorts)).exclude(
+                **dict.fromkeys(cls.COHORT_FIELDS, 0)
+            ).update(**dict.fromkeys(cls.COHORT_FIELDS, 0))
+            cls.objects.bulk_create(
+                [cls(date=day, **values) for day, values in cohorts.items()],
+                update_conflicts=True,
+                unique_fields=['date'],
+                update_fields=list(cls.COHORT_FIELDS),
+            )
+
+    @classmethod
+    def summarize(cls, start_date, end_date):
+        """
+        Return the facts of the period from `start_date` to `end_date`, both included, with one aggregation.
+
+        Besides the sums of the columns, `total_jobs` and `active_jobs` count the jobs running at some point of the
+        period: those open on its first day plus those starting later in it.
+        """
+        start_date, end_date = cls.to_date(start_date), cls.to_date(end_date)
+        first_day = models.Q(date=start_date)
+        later_days = models.Q(date__gt=start_date)
+        # The filtered sums come first: the plain sums are named after their columns and would shadow them.
+        totals = cls.objects.filter(date__gte=start_date, date__lte=end_date).aggregate(
+            total_jobs_open=models.Sum('jobs_open', filter=first_day),
+            active_jobs_open_first=models.Sum('active_jobs_open', filter=first_day),
+            total_jobs_started=models.Sum('jobs_started', filter=later_days),
+            active_jobs_started_later=models.Sum('active_jobs_started', filter=later_days),
+            **{field: models.Sum(field) for field in cls.FACT_FIELDS + cls.COHORT_FIELDS},
+        )
+        totals = {field: value or 0 for field, value in totals.items()}
+        totals['total_jobs'] = totals.pop('total_jobs_open') + totals.pop('total_jobs_started')
+        totals['active_jobs'] = totals.pop('active_jobs_open_first') + totals.pop('active_jobs_started_later')
+        return totals
+
+    @classmethod
+    def summarize_by_month(cls, start_date, end_date, fields):
+        """
+        Return `{field: {'total': count, 'detail': [{'year', 'month', 'count'}]}}` of the period from `start_date`
+        to `end_date`, newest month first, with one grouped query. Months without any count are left out.
+        """
+        start_date, end_date = cls.to_date(start_date), cls.to_date(end_date)
+        months = cls.objects.filter(date__gte=start_date, date__lte=end_date).values(
+            'date__year', 'date__month'
+        ).annotate(**{field + '_count': models.Sum(field) for field in fields}).order_by('-date__year', '-date__month')
+        summary = {field: {'total': 0, 'detail': []} for field in fields}
+        for month in months:
+            for field in fields:
+                count = month[field + '_count']
+                if count:
+                    summary[field]['total'] += count
+                    summary[field]['detail'].append(
+                        {'year': month['date__year'], 'month': month['date__month'], 'count': count}
+                    )
+        return summary
@@ -1,6 +1,6 @@
 import json
-from datetime import date
-from django.db.models import Q, Sum, Count
+from django.db.models import Sum
+from django.utils.functional import cached_property
 from rest_framework import serializers
 from django.template.defaultfilters import slugify
 
@@ -25,7 +25,7 @@ from tenders.models import TenderCategory, TenderDetails, TenderAttachmentsItem
 from tenders.serializers import TenderCategorySerializer
 
 from users.backends import MobileOrEmailBackend as cb
-from users.models import User, UserSession, VisitorLog
+from users.models import User, VisitorSketch
 from users.serializers import UserSerializer
 
 from .models import (
@@ -33,7 +33,7 @@ from .models import (
     AboutUs, FaqCategory, FAQ,
     CategoryLogo, Testimonial, NewsletterUser,
     RechargeHistory, Packages, Invoice, GoogleAddSenseCode,
-    Rights, UserSubRights, UserRights
+    Rights, UserSubRights, UserRights, DailyAnalytics
 )
 
 
@@ -485,6 +485,7 @@ class UserCountSerializers(serializers.Serializer):
         - `get_job_seekers(self, obj)`: Retrieves the count of job seekers.
         - `get_employers(self, obj)`: Retrieves the count of employers.
         - `get_vendors(self, obj)`: Retrieves the count of vendors.
+        - `get_total_visitor(self, obj)`: Retrieves the estimated count of unique visitors.
 
     Returns:
         JSON-serializable data: The data containing the count of users and jobs in the system.
@@ -506,52 +507,35 @@ class UserCountSerializers(serializers.Serializer):
             'employers', 'vendors', 'active_user', 'total_visitor'
         ]
         
+    @cached_property
+    def analytics(self):
+        return DailyAnalytics.summarize(self.context['start_date'], self.context['end_date'])
+
     def get_active_jobs(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        return JobDetails.objects.filter(status='active', start_date__lte=end_date,
-                                         deadline__gte=start_date).count()
+        return self.analytics['active_jobs']
 
     def get_total_jobs(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        return JobDetails.objects.filter(start_date__lte=end_date,
-                                         deadline__gte=start_date).count()
+        return self.analytics['total_jobs']
 
     def get_total_user(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        return User.objects.filter(~Q(role='admin')).filter(date_joined__date__gte=start_date, date_joined__date__lte=end_date,).count()
+        return self.analytics['users']
 
     def get_active_user(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        return UserSession.objects.filter(~Q(user__role='admin')).filter(expire_at=None, 
-                                                                         user__date_joined__date__gte=start_date, 
-                                                                         user__date_joined__date__lte=end_date,
-                                                                         ).order_by('user').distinct('user').count()
+        return self.analytics['active_users']
 
     def get_job_seekers(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        return User.objects.filter(role='job_seeker', date_joined__date__gte=start_date, date_joined__date__lte=end_date,).count()
+        return self.analytics['job_seekers']
 
     def get_employers(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        return User.objects.filter(role='employer', date_joined__date__gte=start_date, date_joined__date__lte=end_date,).count()
+        return self.analytics['employers']
 
     def get_vendors(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        return User.objects.filter(role='vendor', date_joined__date__gte=start_date, date_joined__date__lte=end_date,).count()
+        return self.analytics['vendors']
 
     def get_total_visitor(self, obj):
-        # start_date = self.context['start_date']
-        # end_date = self.context['end_date']
-        start_date = date.today()
-        end_date = date.today()
-        return VisitorLog.objects.filter(created_at__gte=start_date, created_at__lte=end_date).count()
+        start_date = self.context['start_date']
+        end_date = self.context['end_date']
+        return VisitorSketch.count_visitors(start_date, end_date)
 
 
 class DashboardCountSerializers(serializers.Serializer):
@@ -583,69 +567,17 @@ class DashboardCountSerializers(serializers.Serializer):
             'employers', 'jobs'
         ]
 
+    @cached_property
+    def analytics(self):
+        return DailyAnalytics.summarize_by_month(
+            self.context['start_date'], self.context['end_date'], ('live_jobs_created', 'employers')
+        )
+
     def get_jobs(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        user_analytics = JobDetails.objects.filter(start_date__lte=date.today(), deadline__gte=date.today(),
-            created__date__gte=start_date, created__date__lte=end_date,status='active').order_by('-created')
-        data_by_month = user_analytics.values('created__year', 'created__month').annotate(total_count=Count('id')).order_by('-created__year', '-created__month')
-        
-        # Get aggregated counts by month and year
-        aggregated_data = {}
-        for entry in data_by_month:
-            year = entry['created__year']
-            month = entry['created__month']
-            count = entry['total_count']
-            key = (year, month)
-            if key in aggregated_data:
-                aggregated_data[key] += count
-            else:
-                aggregated_data[key] = count
-                
-        # Format the aggregated data
-        total_jobs =JobDetails.objects.filter(
-            start_date__lte=date.today(), deadline__gte=date.today(),
-            created__date__gte=start_date, created__date__lte=end_date,
-            status='active').count()
-        final = {'total':total_jobs}
-        formatted_data = [
-            {'year': year, 'month': month, 'count': count}
-            for (year, month), count in aggregated_data.items()
-        ]
-        final['detail'] = formatted_data
-        return final
-    
+        return self.analytics['live_jobs_created']
 
     def get_employers(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        
-        user_analytics = User.objects.filter(date_joined__date__gte=start_date, date_joined__date__lte=end_date, role='employer').order_by('-date_joined')
-        data_by_month = user_analytics.values('date_joined__year', 'date_joined__month').annotate(total_count=Count('id')).order_by('-date_joined__year', '-date_joined__month')
-        
-        # Get aggregated counts by month and year
-        aggregated_data = {}
-        for entry in data_by_month:
-            year = entry['date_joined__year']
-            month = entry['date_joined__month']
-            count = entry['total_count']
-            key = (year, month)
-            if key in aggregated_data:
-                aggregated_data[key] += count
-            else:
-                aggregated_data[key] = count
-                
-        # Format the aggregated data
-        total_employer = User.objects.filter(
-            date_joined__date__gte=start_date, date_joined__date__lte=end_date,
-            role='employer').count()
-        final = {'total':total_employer}
-        formatted_data = [
-            {'year': year, 'month': month, 'count': count}
-            for (year, month), count in aggregated_data.items()
-        ]
-        final['detail'] = formatted_data
-        return final
+        return self.analytics['employers']
 
 
 class TenderCategorySerializers(serializers.ModelSerializer):
@@ -2644,28 +2576,22 @@ class FinancialCountSerializers(serializers.Serializer):
             'total_credits', 'gold', 'silver', 'copper'
         ]
         
+    @cached_property
+    def analytics(self):
+        return DailyAnalytics.summarize(self.context['start_date'], self.context['end_date'])
+
     def get_total_credits(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        return RechargeHistory.objects.filter(created__date__lte=end_date,
-                                         created__date__gte=start_date).count()
+        return self.analytics['recharges']
 
     def get_gold(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        return RechargeHistory.objects.filter(package='gold', created__date__lte=end_date, created__date__gte=start_date).count()
+        return self.analytics['gold_recharges']
 
     def get_silver(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        return RechargeHistory.objects.filter(package='silver', created__date__lte=end_date,
-                                         created__date__gte=start_date).count()
+        return self.analytics['silver_recharges']
 
     def get_copper(self, obj):
-        start_date = self.context['start_date']
-        end_date = self.context['end_date']
-        return RechargeHistory.objects.filter(package='copper', created__date__lte=end_date,
-                                         created__date__gte=start_date).count()
+        return self.analytics['copper_recharges']
+
 
 class SubRightsSerializer(serializers.ModelSerializer):
 
@@ -1,3 +1,38 @@
+from datetime import date, datetime, timedelta
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
 
-# Create your tests here.
+from users.models import User
+
+from .models import DailyAnalytics, RechargeHistory
+
+
+class RollupDailyAnalyticsTests(TestCase):
+    """
+    Tests of the `rollup_daily_analytics` command filling `DailyAnalytics`.
+    """
+
+    def setUp(self):
+        self.joined = date.today() - timedelta(days=40)
+        self.user = User.objects.create(
+            email='seeker@example.com', name='Seeker', role='job_seeker', date_joined=datetime.combine(
+                self.joined, datetime.min.time()
+            )
+        )
+        RechargeHistory.objects.create(user=self.user, package='gold')
+
+    def test_first_run_backfills_the_history(self):
+        call_command('rollup_daily_analytics', stdout=StringIO())
+        self.assertEqual(DailyAnalytics.objects.order_by('date').first().date, self.joined)
+        totals = DailyAnalytics.summarize(self.joined, date.today())
+        self.assertEqual((totals['users'], totals['job_seekers'], totals['gold_recharges']), (1, 1, 1))
+
+    def test_later_runs_roll_up_the_last_days(self):
+        call_command('rollup_daily_analytics', stdout=StringIO())
+        User.objects.filter(id=self.user.id).update(role='vendor')
+        call_command('rollup_daily_analytics', stdout=StringIO())
+        self.assertEqual(DailyAnalytics.objects.get(date=self.joined).job_seekers, 1)
+        call_command('rollup_daily_analytics', since=str(self.joined), stdout=StringIO())
+        self.assertEqual(DailyAnalytics.objects.get(date=self.joined).vendors, 1)
@@ -1689,6 +1689,10 @@ class CandidatesListView(generics.ListAPIView):
                 In this case, it contains a single SearchFilter backend.
         - `search_fields`: A list of model fields that can be used for text search.
                 In this case, it contains the `'name'` field.
+        - `cursor_ordering`: Enables the keyset pagination of `CustomPagination` (`?cursor=`) ordered by
+                this field, so deep pages do not pay for an `OFFSET`.
+        - `approximate_count`: Unfiltered lists report the planner estimate as their count once it reaches
+                `PAGINATION_EXACT_COUNT_THRESHOLD` rows.
 
     Methods:
         - `list(request)`: The main method of this view, which returns a list of job seekers filtered by name.
@@ -1704,6 +1708,8 @@ class CandidatesListView(generics.ListAPIView):
     filterset_class = UsersFilter
     search_fields = ['name', 'email']
     pagination_class = CustomPagination
+    cursor_ordering = '-date_joined'
+    approximate_count = True
 
     def list(self, request):
         context = dict()
@@ -1943,6 +1949,10 @@ class JobsListView(generics.ListAPIView):
                 In this case, it contains a single SearchFilter backend.
         - `search_fields`: A list of model fields that can be used for text search.
                 In this case, it contains the `'title'` field.
+        - `cursor_ordering`: Enables the keyset pagination of `CustomPagination` (`?cursor=`) ordered by
+                this field, so deep pages do not pay for an `OFFSET`.
+        - `approximate_count`: Unfiltered lists report the planner estimate as their count once it reaches
+                `PAGINATION_EXACT_COUNT_THRESHOLD` rows.
 
     Methods:
         - `list(request)`: The main method of this view, which returns a list of jobs filtered by title.
@@ -1963,6 +1973,8 @@ class JobsListView(generics.ListAPIView):
         'city__title'
     ]
     pagination_class = CustomPagination
+    cursor_ordering = '-created'
+    approximate_count = True
 
     def list(self, request):
         """
@@ -3431,6 +3443,10 @@ class TenderListView(generics.ListAPIView):
                 In this case, it contains a single SearchFilter backend.
         - `search_fields`: A list of model fields that can be used for text search.
                 In this case, it contains the `'title'` field.
+        - `cursor_ordering`: Enables the keyset pagination of `CustomPagination` (`?cursor=`) ordered by
+                this field, so deep pages do not pay for an `OFFSET`.
+        - `approximate_count`: Unfiltered lists report the planner estimate as their count once it reaches
+                `PAGINATION_EXACT_COUNT_THRESHOLD` rows.
 
     Methods:
         - `list(request)`: The main method of this view, which returns a list of tenders filtered by title.
@@ -3451,6 +3467,8 @@ class TenderListView(generics.ListAPIView):
         'city__title'
     ]
     pagination_class = CustomPagination
+    cursor_ordering = '-created'
+    approximate_count = True
 
     def list(self, request):
         """
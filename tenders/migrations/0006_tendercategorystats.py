@@ -0,0 +1,59 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:31
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import uuid
+
+
+def store_category_stats(apps, schema_editor):
+    """
+    Compute the statistics of the existing tender categories, like `TenderCategoryStats.refresh`.
+    """
+    TenderCategory = apps.get_model('tenders', 'TenderCategory')
+    TenderCategoryStats = apps.get_model('tenders', 'TenderCategoryStats')
+    tender_counts = TenderCategory.objects.annotate(
+        count=models.Count(
+            'tenders_tenderdetails_tender_category',
+            distinct=True,
+            filter=models.Q(
+                tenders_tenderdetails_tender_category__is_removed=False,
+                tenders_tenderdetails_tender_category__status="active"
+            )
+        )
+    ).values_list('id', 'count')
+    TenderCategoryStats.objects.bulk_create([
+        TenderCategoryStats(category_id=category_id, tender_count=count) for category_id, count in tender_counts
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('tenders', '0005_alter_tenderdetails_slug'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TenderCategoryStats',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('id', model_utils.fields.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tender_count', models.PositiveIntegerField(db_column='tender_count', default=0, verbose_name='Tender Count')),
+                ('category', models.OneToOneField(db_column='category', on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)s_category', to='tenders.tendercategory', verbose_name='Category')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'verbose_name': 'Tender Category Stats',
+                'verbose_name_plural': 'Tender Category Stats',
+                'db_table': 'TenderCategoryStats',
+                'ordering': ['-tender_count'],
+            },
+        ),
+        migrations.RunPython(store_category_stats, migrations.RunPython.noop),
+    ]
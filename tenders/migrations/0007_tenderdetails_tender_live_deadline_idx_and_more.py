@@ -0,0 +1,21 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0006_tendercategorystats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tenderdetails',
+            index=models.Index(condition=models.Q(('is_removed', False), ('status', 'active')), fields=['deadline'], name='tender_live_deadline_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenderdetails',
+            index=models.Index(condition=models.Q(('is_removed', False), ('status', 'active')), fields=['-created'], name='tender_live_created_idx'),
+        ),
+    ]
@@ -0,0 +1,15 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:43
+
+from core.identifiers import create_identifier_sequence
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenders', '0007_tenderdetails_tender_live_deadline_idx_and_more'),
+    ]
+
+    operations = [
+        create_identifier_sequence('tender_identifier_seq'),
+    ]
@@ -1,8 +1,12 @@
-from random import randint
+from datetime import date
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver, Signal
 from django.utils.translation import gettext as _
 from autoslug import AutoSlugField
+from core.cache import bump_cache_version
+from core.identifiers import next_identifier
 from core.models import (
     SlugBaseModel, BaseModel, SoftDeleteModel
 )
@@ -40,7 +44,7 @@ class TenderDetails(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         - `SECTOR_CHOICE (tuple)`: A tuple of sector choices for the tender.
         - `user (ForeignKey)`: A foreign key representing the user who created the tender.
         - `title (CharField)`: A character field representing the title of the tender.
-        - `tender_id (CharField)`: A character field representing the unique ID of the tender, generated by the
+        - `tender_id (CharField)`: A character field representing the unique ID of the tender, allocated by the
             `unique_tender_id()` function.
         - `budget_currency (CharField)`: A character field representing the currency of the budget.
         - `budget_amount (DecimalField)`: A decimal field representing the budget amount.
@@ -275,17 +279,35 @@ class TenderDetails(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         verbose_name_plural = "Tender Details"
         db_table = "TenderDetails"
         ordering = ['-created']
+        indexes = [
+            # Partial indexes on the live tenders, which the public listings and the expiry sweeper read.
+            models.Index(
+                fields=['deadline'], name='tender_live_deadline_idx',
+                condition=models.Q(status='active', is_removed=False)
+            ),
+            models.Index(
+                fields=['-created'], name='tender_live_created_idx',
+                condition=models.Q(status='active', is_removed=False)
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.tender_id:
             self.tender_id = unique_tender_id()
+        if self.status == 'expired' and self.deadline and self.deadline >= date.today():
+            # The deadline of an expired tender was extended, so the tender is live again.
+            self.status = 'active'
         return super().save(*args, **kwargs)
 
 
+# Postgres sequence the tender IDs are allocated from, created by the `0008_tender_id_sequence` migration.
+TENDER_ID_SEQUENCE = "tender_identifier_seq"
+
+
 def unique_tender_id():
     """
-    Generates a unique tender ID using two random numbers and checks if it already exists in the TenderDetails model.
-    If the ID already exists, it recursively calls itself to generate a new unique ID.
+    Allocates a unique tender ID from the `TENDER_ID_SEQUENCE` Postgres sequence. The sequence hands out every
+    value once, so no lookup in the TenderDetails model is needed.
 
     Returns:
         str: A unique tender ID in the format `"XXXX-XXXX"`, where X represents a digit between `0-9`.
@@ -293,13 +315,7 @@ def unique_tender_id():
     Raises:
         None
     """
-
-    tender_id = str(randint(1000, 9999)) + "-" + str(randint(1000, 9999))
-    try:
-        if TenderDetails.objects.get(tender_id=tender_id):
-            return unique_tender_id()
-    except TenderDetails.DoesNotExist:
-        return tender_id
+    return next_identifier(TENDER_ID_SEQUENCE)
 
 
 class TenderAttachmentsItem(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
@@ -459,3 +475,153 @@ class TenderFilter(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         verbose_name_plural = "Tender Filters"
         db_table = "TenderFilter"
         ordering = ['-created']
+
+
+class TenderCategoryStats(BaseModel, TimeStampedModel, models.Model):
+    """
+    Materialized statistics of a tender category, used by the category landing endpoints.
+
+    The rows are kept up to date by the signal handlers below whenever tenders change, and are fully rebuilt
+    every night by the `rebuild_category_stats` management command.
+
+    Columns:
+    - `category`: the tender category the statistics belong to
+    - `tender_count`: the number of active tenders in the category
+    """
+    category = models.OneToOneField(
+        TenderCategory,
+        verbose_name=_('Category'),
+        on_delete=models.CASCADE,
+        db_column="category",
+        related_name='%(app_label)s_%(class)s_category'
+    )
+    tender_count = models.PositiveIntegerField(
+        verbose_name=_('Tender Count'),
+        default=0,
+        db_column="tender_count",
+    )
+
+    def __str__(self):
+        return str(self.category)
+
+    class Meta:
+        verbose_name = "Tender Category Stats"
+        verbose_name_plural = "Tender Category Stats"
+        db_table = "TenderCategoryStats"
+        ordering = ['-tender_count']
+
+    @classmethod
+    def refresh(cls, category_ids=None):
+        """
+        Recompute the statistics of the given tender categories (all of them if `category_ids` is None) with one
+        grouped query and write them with a single upsert.
+
+        Args:
+            category_ids (iterable): The IDs of the tender categories to refresh.
+
+        Returns:
+            None
+        """
+        categories = TenderCategory.objects.all()
+        if category_ids is not None:
+            categories = categories.filter(id__in=list(category_ids))
+        tender_counts = categories.annotate(
+            count=models.Count(
+                'tenders_tenderdetails_tender_category',
+                distinct=True,
+                filter=models.Q(
+                    tenders_tenderdetails_tender_category__is_removed=False,
+                    tenders_tenderdetails_tender_category__status="active"
+                )
+            )
+        ).values_list('id', 'count')
+        cls.objects.bulk_create(
+            [cls(category_id=category_id, tender_count=count) for category_id, count in tender_counts],
+            update_conflicts=True,
+            unique_fields=['category'],
+            update_fields=['tender_count'],
+        )
+
+
+# Sent by the `expire_listings` command with the `ids` of every batch of tenders it moved to the expired status.
+tenders_expired = Signal()
+
+# Namespace of the anonymous tender search cache, see `tenders.views.TenderSearchView`.
+TENDER_SEARCH_CACHE = "tender-search"
+
+
+@receiver(post_save, sender=TenderDetails)
+@receiver(post_delete, sender=TenderDetails)
+def invalidate_tender_search(sender, instance, **kwargs):
+    """
+    Signal handler to start a new generation of the cached tender search pages when a tender is created, updated,
+    expired or deleted.
+
+    Args:
+        sender (Type[TenderDetails]): The model class that sent the signal.
+        instance (TenderDetails): The tender that was saved or deleted.
+        **kwargs: Additional keyword arguments that may be passed by the signal.
+
+    Returns:
+        None
+    """
+    bump_cache_version(TENDER_SEARCH_CACHE)
+
+
+def refresh_tender_category_stats(category_ids):
+    """
+    Refresh the `TenderCategoryStats` of the given categories once the current transaction commits.
+    """
+    category_ids = set(category_ids)
+    if category_ids:
+        transaction.on_commit(lambda: TenderCategoryStats.refresh(category_ids))
+
+
+@receiver(post_save, sender=TenderCategory)
+def create_tender_category_stats(sender, instance, created, **kwargs):
+    """
+    Signal handler to create the (empty) statistics row of a new tender category.
+    """
+    if created:
+        TenderCategoryStats.objects.get_or_create(category=instance)
+
+
+@receiver(post_save, sender=TenderDetails)
+def update_tender_category_stats(sender, instance, created, **kwargs):
+    """
+    Signal handler to refresh the tender counts of the categories of an updated tender, as its status or removal
+    may have changed. New tenders are counted when their categories are added (see
+    `update_tender_category_stats_m2m`).
+    """
+    if not created:
+        refresh_tender_category_stats(instance.tender_category.values_list('id', flat=True))
+
+
+@receiver(m2m_changed, sender=TenderDetails.tender_category.through)
+def update_tender_category_stats_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Signal handler to refresh the tender counts of the categories that were added to or removed from a tender.
+    """
+    if reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            refresh_tender_category_stats([instance.id])
+    elif action == "pre_clear":
+        instance._cleared_tender_category_ids = list(instance.tender_category.values_list('id', flat=True))
+    elif action == "post_clear":
+        refresh_tender_category_stats(getattr(instance, '_cleared_tender_category_ids', []))
+    elif action in ("post_add", "post_remove"):
+        refresh_tender_category_stats(pk_set or [])
+
+
+@receiver(tenders_expired)
+def invalidate_expired_tenders(sender, ids, **kwargs):
+    """
+    Signal handler for a batch of expired tenders. The sweeper updates the tenders in bulk without `post_save`,
+    so the cached search pages and the category statistics are invalidated here.
+    """
+    bump_cache_version(TENDER_SEARCH_CACHE)
+    refresh_tender_category_stats(
+        TenderDetails.tender_category.through.objects.filter(
+            tenderdetails__in=ids
+        ).values_list('tendercategory', flat=True)
+    )
@@ -73,7 +73,11 @@ class TendersSerializers(serializers.ModelSerializer):
         
     def get_company_logo(self, obj):
         if obj.company_logo:
-            return {'id':str(obj.company_logo.id), 'path':obj.company_logo.file_path.url}
+            # List cards only need the small WebP variant, the original stays available as `original`.
+            return {
+                'id': str(obj.company_logo.id), 'path': obj.company_logo.get_variant_url('card_webp'),
+                'original': obj.company_logo.file_path.url
+            }
         return None
 
     def get_tender_category(self, obj):
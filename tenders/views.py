@@ -1,6 +1,5 @@
 from django.db.models import (
-    Value, F, Case, When, IntegerField, Q,
-    Count
+    Value, F, Case, When, IntegerField, Q
 )
 
 from datetime import date, datetime
@@ -12,10 +11,14 @@ from rest_framework import (
     response, permissions, filters
 )
 
+from core.cache import AnonymousListCacheMixin
 from core.emails import get_email_object
 from core.pagination import CustomPagination
 
-from tenders.models import TenderDetails, TenderFilter, TenderCategory
+from tenders.models import (
+    TenderDetails, TenderFilter, TenderCategoryStats,
+    TENDER_SEARCH_CACHE
+)
 from tenders.filters import TenderDetailsFilter
 from tenders.serializers import (
     TendersSerializers, TendersDetailSerializers,
@@ -31,7 +34,7 @@ from notification.models import Notification
 from employers.models import BlackList
 
 
-class TenderSearchView(generics.ListAPIView):
+class TenderSearchView(AnonymousListCacheMixin, generics.ListAPIView):
     """
     `TenderSearchView` is a class-based view that retrieves a list of tenders from the database based on the search
     query parameters.
@@ -44,6 +47,8 @@ class TenderSearchView(generics.ListAPIView):
         - `filterset_class`: The filterset class that contains the filter fields for the queryset.
         - `search_fields`: The fields that can be searched using the `search` query parameter.
         - `pagination_class`: The pagination class used to paginate the retrieved data.
+        - `cache_namespace`: The generation counter of the cached anonymous responses, bumped by `TenderDetails`
+            changes.
 
     Methods:
         - `get_queryset`: Retrieves the queryset to be used in the view.
@@ -66,6 +71,8 @@ class TenderSearchView(generics.ListAPIView):
     #     'city__title'
     # ]
     pagination_class = CustomPagination
+    cache_namespace = TENDER_SEARCH_CACHE
+    cache_timeout = Common.SEARCH_CACHE_TIMEOUT
 
     def list(self, request):
         """
@@ -114,7 +121,9 @@ class TenderSearchView(generics.ListAPIView):
         if 'filter_by' in self.request.GET:
             filter_by = self.request.GET['filter_by']
             if filter_by == "active": filters = filters & Q(deadline__gte=date.today())
-            if filter_by == 'expired': filters = filters & Q(deadline__lt=date.today())
+            if filter_by == 'expired':
+                # Tenders past their deadline are moved to the expired status by the `expire_listings` command.
+                filters = Q(status__in=['active', 'expired'], deadline__lt=date.today())
         if 'search_by' in self.request.GET:
             search_by = self.request.GET['search_by']
             if search_by == 'salary':
@@ -393,7 +402,7 @@ class TenderSuggestionView(generics.ListAPIView):
 
     serializer_class = TendersSuggestionSerializers
     permission_classes = [permissions.AllowAny]
-    queryset = TenderDetails.objects.filter(deadline__gte=date.today(), status='active')
+    queryset = None
     filter_backends = [filters.SearchFilter, django_filters.DjangoFilterBackend]
     filterset_class = TenderDetailsFilter
     search_fields = [
@@ -488,6 +497,10 @@ class TenderSuggestionView(generics.ListAPIView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
+    def get_queryset(self):
+        # Evaluated per request, a class level queryset would keep the date of the process start.
+        return TenderDetails.objects.filter(deadline__gte=date.today(), status='active')
+
 
 class ApplicationsDetailView(generics.GenericAPIView):
     """
@@ -796,24 +809,19 @@ class PopularTenderCategoryView(generics.ListAPIView):
         
         tender_categories = []
 
-        # Retrieve the popular job categories and their counts
-        most_used_categories = TenderDetails.objects.filter(is_removed=False, status="active"
-                        ).values('tender_category__id', 'tender_category__title').annotate(
-            category_count=Count('tender_category')).order_by('-category_count')
-        # Prepare the job categories list with title and count information
-        all_tender_category_id = []
-        tender_category = TenderCategory.objects.all()
-        for cat_id in tender_category:
-            all_tender_category_id.append(cat_id.id)
-        for category in most_used_categories:
-            if category['tender_category__id'] in all_tender_category_id:
-                tender_categories.append(
-                    {
-                        "id": category['tender_category__id'],
-                        "title": category['tender_category__title'],
-                        "count": category['category_count']
-                    }
-                )
+        # Retrieve the popular tender categories and their counts
+        most_used_categories = TenderCategoryStats.objects.filter(tender_count__gt=0).select_related(
+            'category'
+        ).order_by('-tender_count', 'category__title')
+        # Prepare the tender categories list with title and count information
+        for stats in most_used_categories:
+            tender_categories.append(
+                {
+                    "id": stats.category.id,
+                    "title": stats.category.title,
+                    "count": stats.tender_count
+                }
+            )
         total_tenders = TenderDetails.objects.filter(is_removed=False, status="active").count()
         return response.Response(
             # data= tender_categories,
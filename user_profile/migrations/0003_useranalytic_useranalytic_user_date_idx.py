@@ -0,0 +1,19 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:38
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('user_profile', '0002_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='useranalytic',
+            index=models.Index(fields=['user', 'date'], name='useranalytic_user_date_idx'),
+        ),
+    ]
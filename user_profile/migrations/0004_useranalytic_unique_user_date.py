@@ -0,0 +1,37 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:47
+
+from django.db import migrations, models
+
+
+def merge_duplicate_analytics(apps, schema_editor):
+    """
+    Merge the UserAnalytic rows of the same user and date into one row holding the sum of their counts.
+    """
+    UserAnalytic = apps.get_model('user_profile', 'UserAnalytic')
+    duplicates = UserAnalytic.objects.order_by().values('user', 'date').annotate(
+        rows=models.Count('id'), total=models.Sum('count')
+    ).filter(rows__gt=1, date__isnull=False)
+    for duplicate in duplicates:
+        analytics = UserAnalytic.objects.filter(user=duplicate['user'], date=duplicate['date'])
+        kept = analytics.order_by('id').first()
+        analytics.exclude(id=kept.id).delete()
+        UserAnalytic.objects.filter(id=kept.id).update(count=duplicate['total'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_profile', '0003_useranalytic_useranalytic_user_date_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_analytics, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='useranalytic',
+            name='useranalytic_user_date_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='useranalytic',
+            constraint=models.UniqueConstraint(fields=('user', 'date'), name='useranalytic_user_date_uniq'),
+        ),
+    ]
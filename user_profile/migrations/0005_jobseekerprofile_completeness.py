@@ -0,0 +1,57 @@
+# Generated by Django 4.1.5 on 2026-10-19 01:15
+
+from django.db import migrations, models
+
+REQUIRED_FIELDS = ('gender', 'experience', 'dob', 'employment_status', 'country', 'city', 'highest_education')
+
+
+def store_profile_completeness(apps, schema_editor):
+    """
+    Compute `is_complete` and `missing_fields` of the existing job seeker profiles, like
+    `JobSeekerProfile.get_missing_fields`.
+    """
+    JobSeekerProfile = apps.get_model('user_profile', 'JobSeekerProfile')
+    JobSeekerSkill = apps.get_model('job_seekers', 'JobSeekerSkill')
+    profiles = JobSeekerProfile.objects.annotate(
+        user_name=models.F('user__name'),
+        has_skills=models.Exists(
+            JobSeekerSkill.objects.filter(user=models.OuterRef('user'), is_removed=False)
+        )
+    ).order_by('id')
+    batch = []
+    for profile in profiles.iterator(chunk_size=1000):
+        missing_fields = [] if profile.user_name else ['name']
+        missing_fields += [
+            name for name in REQUIRED_FIELDS if not getattr(profile, profile._meta.get_field(name).attname)
+        ]
+        if not profile.has_skills:
+            missing_fields.append('skills')
+        profile.missing_fields = missing_fields
+        profile.is_complete = not missing_fields
+        batch.append(profile)
+        if len(batch) == 1000:
+            JobSeekerProfile.objects.bulk_update(batch, ['is_complete', 'missing_fields'])
+            batch = []
+    JobSeekerProfile.objects.bulk_update(batch, ['is_complete', 'missing_fields'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_profile', '0004_useranalytic_unique_user_date'),
+        ('job_seekers', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobseekerprofile',
+            name='is_complete',
+            field=models.BooleanField(db_column='is_complete', default=False, verbose_name='Is Complete'),
+        ),
+        migrations.AddField(
+            model_name='jobseekerprofile',
+            name='missing_fields',
+            field=models.JSONField(blank=True, db_column='missing_fields', default=list, verbose_name='Missing Fields'),
+        ),
+        migrations.RunPython(store_profile_completeness, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 4.1.5 on 2026-10-19 01:36
+
+from django.db import migrations, models
+import django.db.models.deletion
+import model_utils.fields
+import uuid
+
+ALERT_ROLES = ('job_seeker', 'vendor')
+JOB_TYPES = ('is_full_time', 'is_part_time', 'has_contract')
+
+
+def get_term_groups(user_filter):
+    """
+    Return the term groups of a filter, like `UserFilters.get_term_groups`.
+    """
+    groups = []
+    if user_filter.country:
+        groups.append({'country:' + str(user_filter.country.title).lower()})
+    if user_filter.city:
+        groups.append({'city:' + str(user_filter.city.title).lower()})
+    categories = {'category:' + str(category.title).lower() for category in user_filter.sub_category.all()} or {
+        'job_category:' + str(category.title).lower() for category in user_filter.category.all()
+    }
+    for terms in (
+        categories,
+        {'organization_type:' + str(choice.title).lower() for choice in user_filter.organization_type.all()},
+        {'sector:' + str(choice.title).lower() for choice in user_filter.sector.all()},
+        {'tag:' + str(tag.title).lower() for tag in user_filter.tag.all()},
+        {'job_type:' + name for name in JOB_TYPES if getattr(user_filter, name)},
+    ):
+        if terms:
+            groups.append(terms)
+    if user_filter.availability is not None:
+        groups.append({'available:' + str(user_filter.availability).lower()})
+    if not groups:
+        groups.append({'any'})
+    return [{user_filter.role + ':' + term for term in terms} for terms in groups]
+
+
+def index_talent_alerts(apps, schema_editor):
+    """
+    Index the existing talent filters with notifications turned on, like `UserFilters.index_alerts`.
+    """
+    UserFilters = apps.get_model('user_profile', 'UserFilters')
+    UserFilterTerm = apps.get_model('user_profile', 'UserFilterTerm')
+    filters = UserFilters.objects.filter(
+        is_removed=False, is_notification=True, role__in=ALERT_ROLES
+    ).select_related('country', 'city').prefetch_related(
+        'category', 'sub_category', 'organization_type', 'sector', 'tag'
+    ).order_by('id')
+    batch = []
+    for user_filter in filters.iterator(chunk_size=500):
+        groups = get_term_groups(user_filter)
+        user_filter.match_groups = len(groups)
+        UserFilterTerm.objects.bulk_create([
+            UserFilterTerm(user_filter=user_filter, term=term, group=group)
+            for group, group_terms in enumerate(groups) for term in group_terms
+        ])
+        batch.append(user_filter)
+        if len(batch) == 500:
+            UserFilters.objects.bulk_update(batch, ['match_groups'])
+            batch = []
+    UserFilters.objects.bulk_update(batch, ['match_groups'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_profile', '0005_jobseekerprofile_completeness'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userfilters',
+            name='match_groups',
+            field=models.PositiveSmallIntegerField(db_column='match_groups', default=0, verbose_name='Match Groups'),
+        ),
+        migrations.CreateModel(
+            name='UserFilterTerm',
+            fields=[
+                ('id', model_utils.fields.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('term', models.TextField(db_column='term', verbose_name='Term')),
+                ('group', models.PositiveSmallIntegerField(db_column='group', verbose_name='Group')),
+                ('user_filter', models.ForeignKey(db_column='user_filter', on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)s_user_filters', to='user_profile.userfilters', verbose_name='User Filter')),
+            ],
+            options={
+                'verbose_name': 'User Filter Term',
+                'verbose_name_plural': 'User Filter Terms',
+                'db_table': 'UserFilterTerm',
+                'ordering': ['term'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='userfilterterm',
+            index=models.Index(fields=['term'], name='userfilterterm_term_idx'),
+        ),
+        migrations.RunPython(index_talent_alerts, migrations.RunPython.noop),
+    ]
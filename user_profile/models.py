@@ -1,7 +1,17 @@
-from django.db import models
+import operator
+from collections import defaultdict
+from decimal import Decimal, InvalidOperation
+
+from django.apps import apps
+from django.db import models, transaction, IntegrityError
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_save, post_delete
+from django.dispatch import receiver
 from django.utils.translation import gettext as _
 from django.core.validators import RegexValidator
 
+from core.counters import CounterBuffer
+from core.emails import queue_email_batch
 from core.models import (
     BaseModel, SoftDeleteModel
 )
@@ -33,7 +43,11 @@ class JobSeekerProfile(BaseModel, SoftDeleteModel, TimeStampedModel, models.Mode
     - `job_notification`: A boolean value indicating whether the user has opted to receive job notifications.
     - `country (ForeignKey)`: A foreign key to the country associated with the job seeker profile.
     - `city (ForeignKey)`: A foreign key to the city associated with the job seeker profile.
+    - `is_complete`: Whether the job seeker filled in everything needed to apply for jobs.
+    - `missing_fields`: The names of the fields still missing to apply for jobs, see `get_missing_fields`.
     """
+    # Profile fields a job seeker must fill in to apply for jobs.
+    REQUIRED_FIELDS = ('gender', 'experience', 'dob', 'employment_status', 'country', 'city', 'highest_education')
     GENDER_CHOICE = (
         ('male', "Male"),
         ('female', "Female"),
@@ -143,11 +157,54 @@ class JobSeekerProfile(BaseModel, SoftDeleteModel, TimeStampedModel, models.Mode
         blank=True,
         db_column="personal_website",
     )
-    
+    is_complete = models.BooleanField(
+        verbose_name=_('Is Complete'),
+        default=False,
+        db_column="is_complete",
+    )
+    missing_fields = models.JSONField(
+        verbose_name=_('Missing Fields'),
+        default=list,
+        blank=True,
+        db_column="missing_fields",
+    )
 
     def __str__(self):
         return str(self.user)
 
+    def get_missing_fields(self):
+        """
+        Return the names of the fields the job seeker still has to fill in to apply for jobs: `name` of the user,
+        the empty `REQUIRED_FIELDS` of the profile and `skills` when the job seeker has none.
+        """
+        missing_fields = [] if self.user.name else ['name']
+        missing_fields += [
+            name for name in self.REQUIRED_FIELDS if not getattr(self, self._meta.get_field(name).attname)
+        ]
+        if not self.user.job_seekers_jobseekerskill_user.exists():
+            missing_fields.append('skills')
+        return missing_fields
+
+    def save(self, *args, **kwargs):
+        self.missing_fields = self.get_missing_fields()
+        self.is_complete = not self.missing_fields
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = set(kwargs['update_fields']) | {'is_complete', 'missing_fields'}
+        return super().save(*args, **kwargs)
+
+    @classmethod
+    def refresh_completeness(cls, user_id):
+        """
+        Store the completeness of the profile of `user_id` again after a change outside of the profile, with an
+        `update()` so the profile signals don't run for it.
+        """
+        for profile in cls.objects.filter(user=user_id).select_related('user'):
+            missing_fields = profile.get_missing_fields()
+            if missing_fields != profile.missing_fields:
+                cls.objects.filter(id=profile.id).update(
+                    is_complete=not missing_fields, missing_fields=missing_fields
+                )
+
     class Meta:
         verbose_name = "Job Seeker Profile"
         verbose_name_plural = "Job Seeker Profiles"
@@ -484,9 +541,16 @@ class UserFilters(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         - `has_contract (BooleanField)`: A boolean field indicating if the user filter is for users with contracts.
         - `salary_min (CharField)`: A character field indicating the minimum salary for the user filter.
         - `salary_max (CharField)`: A character field indicating the maximum salary for the user filter.
+        - `match_groups (PositiveSmallIntegerField)`: The number of term groups a candidate must match, see
+            `UserFilterTerm`.
 
    Methods:
        __str__(self): Returns a string representation of the user filter.
+       get_term_groups(self): Returns the criteria of the filter as groups of index terms.
+       matches_ranges(self, document): Returns whether a search document is within the ranges of the filter.
+       index_alerts(cls, filter_ids): Rebuilds the index terms of the filters.
+       match_documents(cls, documents): Returns the filters matched by search documents.
+       send_talent_alerts(cls, previous, documents): Notifies the owners of the filters newly matched by candidates.
 
    Meta:
         - `verbose_name (str)`: The singular name for the model.
@@ -631,16 +695,267 @@ class UserFilters(BaseModel, SoftDeleteModel, TimeStampedModel, models.Model):
         verbose_name=_('Years in Market'),
         db_column="years_in_market",
     )
+    match_groups = models.PositiveSmallIntegerField(
+        verbose_name=_('Match Groups'),
+        default=0,
+        db_column="match_groups",
+    )
+
+    # Roles of the candidates the talent alerts are sent for, the roles of `users.models.CandidateSearchDocument`.
+    ALERT_ROLES = ('job_seeker', 'vendor')
+    # Search document flag per job type criterion of the filter.
+    JOB_TYPES = ('is_full_time', 'is_part_time', 'has_contract')
 
     def __str__(self):
         return str(self.title)
 
+    def get_term_groups(self):
+        """
+        Return the criteria of the filter as a list of term sets: a candidate matches when it has a term of every
+        set, like the talent search matches any of the given categories, tags or job types. The ranges (experience,
+        salary, years in market) are checked by `matches_ranges`. A filter without any other criterion gets the
+        `any` term every candidate of its role has. Terms are prefixed with the role, see `get_document_terms`.
+        """
+        groups = []
+        if self.country:
+            groups.append({'country:' + str(self.country.title).lower()})
+        if self.city:
+            groups.append({'city:' + str(self.city.title).lower()})
+        # Like the talent search, the sub categories take precedence over the categories.
+        categories = {'category:' + str(category.title).lower() for category in self.sub_category.all()} or {
+            'job_category:' + str(category.title).lower() for category in self.category.all()
+        }
+        for terms in (
+            categories,
+            {'organization_type:' + str(choice.title).lower() for choice in self.organization_type.all()},
+            {'sector:' + str(choice.title).lower() for choice in self.sector.all()},
+            {'tag:' + str(tag.title).lower() for tag in self.tag.all()},
+            {'job_type:' + name for name in self.JOB_TYPES if getattr(self, name)},
+        ):
+            if terms:
+                groups.append(terms)
+        if self.availability is not None:
+            groups.append({'available:' + str(self.availability).lower()})
+        if not groups:
+            groups.append({'any'})
+        return [{self.role + ':' + term for term in terms} for terms in groups]
+
+    @classmethod
+    def get_document_terms(cls, document):
+        """
+        Return the index terms of a `CandidateSearchDocument`, the counterpart of `get_term_groups`.
+        """
+        terms = {'any'}
+        if document.country:
+            terms.add('country:' + document.country.lower())
+        if document.city:
+            terms.add('city:' + document.city.lower())
+        for name, titles in (
+            ('category', document.categories),
+            ('job_category', document.job_categories),
+            ('organization_type', document.organization_types),
+            ('sector', document.sectors),
+            ('tag', document.tags),
+        ):
+            terms.update(name + ':' + title.lower() for title in titles)
+        terms.update('job_type:' + name for name in cls.JOB_TYPES if getattr(document, name))
+        if document.is_available is not None:
+            terms.add('available:' + str(document.is_available).lower())
+        return {document.role + ':' + term for term in terms}
+
+    @staticmethod
+    def parse_salary(value):
+        try:
+            return Decimal(str(value).strip()) if value not in (None, '') else None
+        except InvalidOperation:
+            return None
+
+    def matches_ranges(self, document):
+        """
+        Return whether the `CandidateSearchDocument` is within the experience, salary and years in market ranges of
+        the filter. A salary bound that is not a number is ignored.
+        """
+        for minimum, value in (
+                (self.experience, document.experience), (self.years_in_market, document.operating_years)
+        ):
+            if minimum is not None and (value is None or value < minimum):
+                return False
+        for bound, compare in ((self.parse_salary(self.salary_min), operator.ge),
+                               (self.parse_salary(self.salary_max), operator.le)):
+            if bound is not None and (document.expected_salary is None or not compare(document.expected_salary, bound)):
+                return False
+        return True
+
+    @classmethod
+    def index_alerts(cls, filter_ids):
+        """
+        Rebuild the `UserFilterTerm` rows of `filter_ids`. Only the filters of a candidate role with notifications
+        turned on are indexed; the terms of the others, including removed filters, are deleted.
+        """
+        filter_ids = list(filter_ids)
+        filters = list(cls.objects.filter(
+            id__in=filter_ids, is_notification=True, role__in=cls.ALERT_ROLES
+        ).select_related('country', 'city').prefetch_related(
+            'category', 'sub_category', 'organization_type', 'sector', 'tag'
+        ))
+        terms = []
+        for user_filter in filters:
+            groups = user_filter.get_term_groups()
+            user_filter.match_groups = len(groups)
+            terms += [
+                UserFilterTerm(user_filter=user_filter, term=term, group=group)
+                for group, group_terms in enumerate(groups) for term in group_terms
+            ]
+        with transaction.atomic():
+            UserFilterTerm.objects.filter(user_filter__in=filter_ids).delete()
+            UserFilterTerm.objects.bulk_create(terms)
+            cls.objects.bulk_update(filters, ['match_groups'])
+
+    @classmethod
+    def index_pending(cls, pending, batch_size=500):
+        """
+        Index the buffered `{filter id: changes}` of `alert_index_queue`, `batch_size` filters at a time.
+        """
+        filter_ids = list(pending)
+        for start in range(0, len(filter_ids), batch_size):
+            cls.index_alerts(filter_ids[start:start + batch_size])
+
+    @classmethod
+    def match_documents(cls, documents):
+        """
+        Return the set of filters matched by every `CandidateSearchDocument` of `documents`, in the same order.
+
+        Only the postings of the terms of the documents are read, so the cost follows the number of filters sharing
+        a term with the candidates rather than the number of saved filters. A filter is a candidate when it has a
+        posting in each of its `match_groups`; only the candidates are loaded to check their ranges.
+        """
+        if not documents:
+            return []
+        document_terms = [cls.get_document_terms(document) for document in documents]
+        postings = defaultdict(list)
+        for filter_id, term, group, match_groups in UserFilterTerm.objects.filter(
+                term__in=set().union(*document_terms)
+        ).order_by().values_list('user_filter', 'term', 'group', 'user_filter__match_groups'):
+            postings[term].append((filter_id, group, match_groups))
+        candidates = []
+        for terms in document_terms:
+            groups = defaultdict(set)
+            required = {}
+            for term in terms:
+                for filter_id, group, match_groups in postings[term]:
+                    groups[filter_id].add(group)
+                    required[filter_id] = match_groups
+            candidates.append(
+                {filter_id for filter_id, matched in groups.items() if len(matched) == required[filter_id]}
+            )
+        filters = cls.objects.select_related('user').in_bulk(set().union(*candidates))
+        return [
+            {
+                filters[filter_id] for filter_id in filter_ids
+                if filter_id in filters and filters[filter_id].matches_ranges(document)
+            }
+            for document, filter_ids in zip(documents, candidates)
+        ]
+
+    @classmethod
+    def send_talent_alerts(cls, previous, documents):
+        """
+        Notify the owners of the filters that the candidates of `documents`, the refreshed search documents, match
+        now but did not match with their `previous` documents (by user id). An unchanged or immaterially changed
+        profile matches the same filters again and sends nothing. The notifications of all candidates are inserted
+        with one `bulk_create`, and each owner with emails turned on gets a single email listing the new matches.
+        """
+        Notification = apps.get_model('notification', 'Notification')
+        documents = [document for document in documents if document.is_visible]
+        if not documents:
+            return
+        previous = [
+            previous[document.user_id] for document in documents
+            if document.user_id in previous and previous[document.user_id].is_visible
+        ]
+        before = {document.user_id: matched for document, matched in zip(previous, cls.match_documents(previous))}
+        alerts = defaultdict(list)
+        for document, matched in zip(documents, cls.match_documents(documents)):
+            for user_filter in matched - before.get(document.user_id, set()):
+                if user_filter.user_id != document.user_id and user_filter.user.is_active:
+                    alerts[user_filter.user].append((user_filter, document))
+        notifications = []
+        messages = []
+        for owner, matches in alerts.items():
+            if owner.get_notification:
+                notifications += [
+                    Notification(
+                        user=owner, notification_type='talent_alert', user_filter=user_filter, candidate=document.user
+                    )
+                    for user_filter, document in matches
+                ]
+            if owner.get_email and owner.email:
+                messages.append({
+                    'subject': 'New talent alert',
+                    'email_template_name': 'email-templates/send-talent-alert.html',
+                    'context': {
+                        'yourname': owner.name or owner.email,
+                        'matches': [
+                            {'filter': user_filter.title, 'name': document.user.name or document.user.email,
+                             'role': document.user.get_role_display()}
+                            for user_filter, document in matches
+                        ],
+                    },
+                    'to_email': [owner.email],
+                })
+        if notifications:
+            Notification.bulk_notify(notifications)
+        queue_email_batch(messages)
+
     class Meta:
         verbose_name = "User Filter"
         verbose_name_plural = "User Filters"
         db_table = "UserFilters"
         ordering = ['-created']
 
+
+class UserFilterTerm(BaseModel, models.Model):
+    """
+    The inverted index of the talent alerts: one row per term of every `UserFilters` with notifications on.
+
+    The criteria of a filter are split into groups of terms (see `UserFilters.get_term_groups`); a candidate matches
+    the filter when its search document has a term of each group. Looking up the terms of a candidate therefore
+    only reads the postings of the filters that can match it.
+
+    Attributes:
+        - `user_filter (ForeignKey)`: The indexed filter.
+        - `term (TextField)`: The role prefixed term, e.g. `vendor:tag:solar`.
+        - `group (PositiveSmallIntegerField)`: The number of the group of the term within the filter.
+    """
+    user_filter = models.ForeignKey(
+        UserFilters,
+        verbose_name=_('User Filter'),
+        on_delete=models.CASCADE,
+        db_column="user_filter",
+        related_name='%(app_label)s_%(class)s_user_filters'
+    )
+    term = models.TextField(
+        verbose_name=_('Term'),
+        db_column="term",
+    )
+    group = models.PositiveSmallIntegerField(
+        verbose_name=_('Group'),
+        db_column="group",
+    )
+
+    def __str__(self):
+        return str(self.term)
+
+    class Meta:
+        verbose_name = "User Filter Term"
+        verbose_name_plural = "User Filter Terms"
+        db_table = "UserFilterTerm"
+        ordering = ['term']
+        indexes = [
+            models.Index(fields=['term'], name='userfilterterm_term_idx'),
+        ]
+
+
 class UserAnalytic(BaseModel, models.Model):
     """
     Model representing user analytics.
@@ -683,3 +998,83 @@ class UserAnalytic(BaseModel, models.Model):
         verbose_name = "User Analytic"
         verbose_name_plural = "User Analytics"
         db_table = "UserAnalytic"
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date'], name='useranalytic_user_date_uniq'),
+        ]
+
+    @classmethod
+    def add_counts(cls, counts):
+        """
+        Add the buffered `{(user id, date): increment}` counts to the daily rows, creating the missing ones.
+
+        The counts are added with `F()` expressions, and a row created by another process between the update and
+        the insert is caught by the unique constraint and updated instead, so no increment is lost.
+        """
+        with transaction.atomic():
+            for (user_id, day), increment in counts.items():
+                count = Coalesce(models.F('count'), 0) + increment
+                if cls.objects.filter(user=user_id, date=day).update(count=count):
+                    continue
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(user_id=user_id, date=day, count=increment)
+                except IntegrityError:
+                    cls.objects.filter(user=user_id, date=day).update(count=count)
+
+
+# Buffers the profile view hits of `users.views.AnalyticView`, keyed by `(user id, date)`.
+user_analytic_counter = CounterBuffer(UserAnalytic.add_counts)
+
+
+@receiver(post_save, sender=User)
+def refresh_profile_completeness_user(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Signal handler to store the completeness of a job seeker profile again when the name of the user may have
+    changed. Saves limited to other fields, such as `last_login`, are skipped.
+    """
+    if not created and instance.role == "job_seeker" and (update_fields is None or 'name' in update_fields):
+        JobSeekerProfile.refresh_completeness(instance.id)
+
+
+@receiver(post_save, sender='job_seekers.JobSeekerSkill')
+@receiver(post_delete, sender='job_seekers.JobSeekerSkill')
+def refresh_profile_completeness_skills(sender, instance, **kwargs):
+    """
+    Signal handler to store the completeness of a job seeker profile again when a skill is added or removed.
+    """
+    JobSeekerProfile.refresh_completeness(instance.user_id)
+
+
+# Buffers the saved talent filters whose `UserFilterTerm` rows are out of date, keyed by filter id.
+alert_index_queue = CounterBuffer(UserFilters.index_pending)
+
+
+def schedule_alert_index(filter_id):
+    transaction.on_commit(lambda: alert_index_queue.add(filter_id))
+
+
+@receiver(post_save, sender=UserFilters)
+def index_user_filter(sender, instance, **kwargs):
+    """
+    Signal handler to index a talent filter again when it is saved, including when it is soft deleted.
+    """
+    schedule_alert_index(instance.id)
+
+
+@receiver(m2m_changed, sender=UserFilters.category.through)
+@receiver(m2m_changed, sender=UserFilters.sub_category.through)
+@receiver(m2m_changed, sender=UserFilters.organization_type.through)
+@receiver(m2m_changed, sender=UserFilters.sector.through)
+@receiver(m2m_changed, sender=UserFilters.tag.through)
+def index_user_filter_relations(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Signal handler to index talent filters again when their categories, sub categories, organization types, sectors
+    or tags change.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        for filter_id in pk_set or ():
+            schedule_alert_index(filter_id)
+    else:
+        schedule_alert_index(instance.id)
@@ -1,6 +1,6 @@
 import django_filters as filters
 
-from .models import User
+from .models import User, CandidateSearchDocument
 
 class UsersFilter(filters.FilterSet):
     """A filter set for querying job details based on various criteria.
@@ -33,4 +33,27 @@ class UsersFilter(filters.FilterSet):
         fields = [
             'country', 'city', 'experience', 'availability', 'salary', 
             'vendor_country', 'vendor_city', 'years_in_market'
-        ]
\ No newline at end of file
+        ]
+
+
+class CandidateSearchDocumentFilter(filters.FilterSet):
+    """A filter set for the talent search on `CandidateSearchDocument`, with the parameters of `UsersFilter`.
+
+    The job seeker and vendor locations are both read from the `country` and `city` of the document, which holds the
+    location of the profile matching the role of the user.
+    """
+
+    country = filters.CharFilter(field_name='country', lookup_expr='iexact')
+    city = filters.CharFilter(field_name='city', lookup_expr='iexact')
+    experience = filters.NumberFilter(field_name='experience', lookup_expr='gte')
+    availability = filters.BooleanFilter(field_name='is_available')
+    salary = filters.RangeFilter(field_name='expected_salary')
+    vendor_country = filters.CharFilter(field_name='country', lookup_expr='iexact')
+    vendor_city = filters.CharFilter(field_name='city', lookup_expr='iexact')
+    years_in_market = filters.NumberFilter(field_name='operating_years', lookup_expr='gte')
+    class Meta:
+        model = CandidateSearchDocument
+        fields = [
+            'country', 'city', 'experience', 'availability', 'salary',
+            'vendor_country', 'vendor_city', 'years_in_market'
+        ]
@@ -0,0 +1,119 @@
+from core.loaders import BatchLoader, Relation
+
+from employers.models import BlackList
+from job_seekers.models import (
+    AppliedJob, EducationRecord, EmploymentRecord,
+    JobPreferences, JobSeekerLanguageProficiency,
+    JobSeekerSkill, Resume
+)
+from notification.models import Notification
+from user_profile.models import JobSeekerProfile, Reference, VendorProfile
+from vendors.models import AppliedTender, VendorSector, VendorTag
+
+
+def load_job_applicants(user_ids, context):
+    """
+    Return `{user id: True}` for the users who applied to a job of the requesting user (the `user` context).
+    """
+    viewer = context.get('user')
+    if not viewer or not viewer.is_authenticated:
+        return {}
+    return dict.fromkeys(
+        AppliedJob.objects.filter(job__user=viewer, user__in=user_ids).values_list('user', flat=True), True
+    )
+
+
+def load_tender_applicants(user_ids, context):
+    """
+    Return `{user id: True}` for the users who applied to a tender of the requesting user (the `user` context).
+    """
+    viewer = context.get('user')
+    if not viewer or not viewer.is_authenticated:
+        return {}
+    return dict.fromkeys(
+        AppliedTender.objects.filter(tender__user=viewer, user__in=user_ids).values_list('user', flat=True), True
+    )
+
+
+# Relations of a user, keyed by the user id.
+JOB_SEEKER_PROFILE = Relation.rows(
+    'job_seeker_profile',
+    JobSeekerProfile.objects.select_related('user', 'highest_education', 'country', 'city'),
+    many=False
+)
+VENDOR_PROFILE = Relation.rows(
+    'vendor_profile',
+    VendorProfile.objects.select_related(
+        'user', 'license_id_file', 'registration_certificate', 'country', 'city'
+    ).prefetch_related('organization_type'),
+    many=False
+)
+JOB_PREFERENCES = Relation.rows('job_preferences', JobPreferences.objects.all(), many=False)
+EDUCATION_RECORDS = Relation.rows('education_records', EducationRecord.objects.select_related('education_level'))
+EMPLOYMENT_RECORDS = Relation.rows('employment_records', EmploymentRecord.objects.all())
+RESUMES = Relation.rows('resumes', Resume.objects.select_related('file_path'))
+LANGUAGES = Relation.rows('languages', JobSeekerLanguageProficiency.objects.select_related('language'))
+SKILLS = Relation.rows('skills', JobSeekerSkill.objects.select_related('skill'))
+REFERENCES = Relation.rows('references', Reference.objects.all())
+SECTORS = Relation.rows('sectors', VendorSector.objects.select_related('sector'))
+TAGS = Relation.rows('tags', VendorTag.objects.select_related('tag'))
+BLACKLISTED = Relation(
+    'blacklisted',
+    lambda user_ids, context: dict.fromkeys(
+        BlackList.objects.filter(blacklisted_user__in=user_ids).values_list('blacklisted_user', flat=True), True
+    ),
+    default=False
+)
+UNSEEN_NOTIFICATIONS = Relation.count('unseen_notifications', Notification.objects.filter(seen=False))
+JOB_APPLICANTS = Relation('job_applicants', load_job_applicants, default=False)
+TENDER_APPLICANTS = Relation('tender_applicants', load_tender_applicants, default=False)
+
+
+class ApplicantBundle:
+    """
+    The profile related rows of one job seeker, loaded for a whole page by `load_applicant_bundles`.
+
+    Attributes:
+        - `profile (JobSeekerProfile)`: The profile with its country and city, or None.
+        - `education_records (list)`: The `EducationRecord` rows with their education level.
+        - `employment_records (list)`: The `EmploymentRecord` rows.
+        - `languages (list)`: The `JobSeekerLanguageProficiency` rows with their language.
+        - `skills (list)`: The `JobSeekerSkill` rows with their skill.
+        - `references (list)`: The `Reference` rows.
+        - `is_blacklisted (bool)`: Whether any employer blacklisted the job seeker.
+    """
+    RELATIONS = ('profile', 'education_records', 'employment_records', 'languages', 'skills', 'references', 'blacklist')
+    # Bundle attribute and relation loading it, per name of `RELATIONS`.
+    LOADERS = {
+        'profile': ('profile', JOB_SEEKER_PROFILE),
+        'education_records': ('education_records', EDUCATION_RECORDS),
+        'employment_records': ('employment_records', EMPLOYMENT_RECORDS),
+        'languages': ('languages', LANGUAGES),
+        'skills': ('skills', SKILLS),
+        'references': ('references', REFERENCES),
+        'blacklist': ('is_blacklisted', BLACKLISTED),
+    }
+
+    def __init__(self):
+        self.profile = None
+        self.education_records = []
+        self.employment_records = []
+        self.languages = []
+        self.skills = []
+        self.references = []
+        self.is_blacklisted = False
+
+
+def load_applicant_bundles(users, relations=ApplicantBundle.RELATIONS):
+    """
+    Return `{user id: ApplicantBundle}` for `users`, with one query per relation in `relations` whatever the number
+    of users. Relations left out stay empty in the bundles.
+    """
+    bundles = {user.id: ApplicantBundle() for user in users}
+    loader = BatchLoader()
+    for name in relations:
+        attribute, relation = ApplicantBundle.LOADERS[name]
+        loader.prime(relation, bundles)
+        for user_id, bundle in bundles.items():
+            setattr(bundle, attribute, loader.load(relation, user_id))
+    return bundles
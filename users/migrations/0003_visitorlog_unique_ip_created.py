@@ -0,0 +1,35 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:47
+
+from django.db import migrations, models
+
+
+def remove_duplicate_visits(apps, schema_editor):
+    """
+    Keep one VisitorLog row per IP address and date, concurrent requests could log a visitor twice.
+    """
+    VisitorLog = apps.get_model('users', 'VisitorLog')
+    duplicates = VisitorLog.objects.order_by().values('ip_address', 'created_at').annotate(
+        rows=models.Count('id')
+    ).filter(rows__gt=1, ip_address__isnull=False, created_at__isnull=False)
+    for duplicate in duplicates:
+        visits = VisitorLog.objects.filter(ip_address=duplicate['ip_address'], created_at=duplicate['created_at'])
+        visits.exclude(id=visits.order_by('id').values('id')[:1]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_visitorlog_visitorlog_ip_created_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_visits, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='visitorlog',
+            name='visitorlog_ip_created_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='visitorlog',
+            constraint=models.UniqueConstraint(fields=('ip_address', 'created_at'), name='visitorlog_ip_created_uniq'),
+        ),
+    ]
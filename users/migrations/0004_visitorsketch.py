@@ -0,0 +1,29 @@
+# Generated by Django 4.1.5 on 2026-10-19 00:49
+
+from django.db import migrations, models
+import model_utils.fields
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_visitorlog_unique_ip_created'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VisitorSketch',
+            fields=[
+                ('id', model_utils.fields.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('date', models.DateField(db_column='date', unique=True, verbose_name='Date')),
+                ('registers', models.BinaryField(blank=True, db_column='registers', null=True, verbose_name='Registers')),
+            ],
+            options={
+                'verbose_name': 'Visitor Sketch',
+                'verbose_name_plural': 'Visitor Sketches',
+                'db_table': 'VisitorSketch',
+                'ordering': ['date'],
+            },
+        ),
+    ]
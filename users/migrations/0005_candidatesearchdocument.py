@@ -0,0 +1,84 @@
+# Generated by Django 4.1.5 on 2026-10-19 01:21
+
+from django.conf import settings
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_visitorsketch'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CandidateSearchDocument',
+            fields=[
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, editable=False, verbose_name='created')),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, editable=False, verbose_name='modified')),
+                ('id', model_utils.fields.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('role', models.CharField(db_column='role', max_length=255, verbose_name='Role')),
+                ('is_visible', models.BooleanField(db_column='is_visible', default=False, verbose_name='Is Visible')),
+                ('country', models.CharField(blank=True, db_column='country', max_length=255, null=True, verbose_name='Country')),
+                ('city', models.CharField(blank=True, db_column='city', max_length=255, null=True, verbose_name='City')),
+                ('experience', models.BigIntegerField(blank=True, db_column='experience', null=True, verbose_name='Experience')),
+                ('operating_years', models.BigIntegerField(blank=True, db_column='operating_years', null=True, verbose_name='Operating Years')),
+                ('is_available', models.BooleanField(blank=True, db_column='is_available', null=True, verbose_name='Is Available')),
+                ('expected_salary', models.DecimalField(blank=True, db_column='expected_salary', decimal_places=2, max_digits=19, null=True, verbose_name='Expected Salary')),
+                ('is_full_time', models.BooleanField(db_column='is_full_time', default=False, verbose_name='Is Full Time')),
+                ('is_part_time', models.BooleanField(db_column='is_part_time', default=False, verbose_name='Is Part Time')),
+                ('has_contract', models.BooleanField(db_column='has_contract', default=False, verbose_name='Has Contract')),
+                ('categories', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, db_column='categories', default=list, size=None, verbose_name='Categories')),
+                ('job_categories', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, db_column='job_categories', default=list, size=None, verbose_name='Job Categories')),
+                ('tags', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, db_column='tags', default=list, size=None, verbose_name='Tags')),
+                ('sectors', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, db_column='sectors', default=list, size=None, verbose_name='Sectors')),
+                ('organization_types', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, db_column='organization_types', default=list, size=None, verbose_name='Organization Types')),
+                ('search_text', models.TextField(blank=True, db_column='search_text', default='', verbose_name='Search Text')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, db_column='search_vector', null=True, verbose_name='Search Vector')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(app_label)s_%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+                ('user', models.OneToOneField(db_column='user', on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)s_user', to=settings.AUTH_USER_MODEL, verbose_name='User')),
+            ],
+            options={
+                'verbose_name': 'Candidate Search Document',
+                'verbose_name_plural': 'Candidate Search Documents',
+                'db_table': 'CandidateSearchDocument',
+                'ordering': ['created'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='candidatesearchdocument',
+            index=models.Index(condition=models.Q(('is_visible', True)), fields=['role'], name='searchdocument_role_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatesearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['categories'], name='searchdocument_categories_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatesearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['job_categories'], name='searchdocument_job_cat_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatesearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tags'], name='searchdocument_tags_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatesearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['sectors'], name='searchdocument_sectors_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatesearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['organization_types'], name='searchdocument_org_types_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='candidatesearchdocument',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='searchdocument_vector_gin'),
+        ),
+    ]
@@ -1,15 +1,28 @@
-from django.db import models
+import re
+from collections import defaultdict
+
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchVector, SearchVectorField
 from django.utils.translation import gettext as _
 from django.core.validators import RegexValidator
 
 from model_utils import models as misc_models
 
+from core.counters import CounterBuffer
+from core.hyperloglog import HyperLogLog
 from core.models import (
     BaseModel, SoftDeleteModel
 )
 from project_meta.models import Media
 
+from koor.config.common import Common
+
 from .managers import UserManager
 
 
@@ -286,3 +299,435 @@ class VisitorLog(BaseModel, models.Model):
         verbose_name_plural = "Visitor Logs"
         db_table = "VisitorLog"
         ordering = ['created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['ip_address', 'created_at'], name='visitorlog_ip_created_uniq'),
+        ]
+
+    @classmethod
+    def log_visits(cls, visits):
+        """
+        Add the buffered `(ip address, date, user agent)` visits to the daily `VisitorSketch` rows and, when
+        `STORE_VISITOR_LOGS` is enabled, insert one row per visitor and date, skipping the visitors already logged
+        for that date. A user agent of None stores no agent information.
+        """
+        agents = {}
+        for ip_address, day, user_agent in visits:
+            if (ip_address, day) not in agents or user_agent is not None:
+                agents[(ip_address, day)] = user_agent
+        visitors = defaultdict(set)
+        for ip_address, day in agents:
+            if ip_address:
+                visitors[day].add(ip_address)
+        for day, ip_addresses in visitors.items():
+            VisitorSketch.add_visitors(day, ip_addresses)
+        if Common.STORE_VISITOR_LOGS:
+            cls.objects.bulk_create(
+                [
+                    cls(
+                        ip_address=ip_address, created_at=day,
+                        agent=None if user_agent is None else {'User-Agent': user_agent or None}
+                    ) for (ip_address, day), user_agent in agents.items()
+                ],
+                ignore_conflicts=True
+            )
+
+
+class VisitorSketch(BaseModel, models.Model):
+    """
+    Daily HyperLogLog sketch of the visitor IP addresses, used to estimate the unique visitors of any date range.
+
+    A sketch has a fixed size whatever the traffic, so a range query reads one small row per day instead of every
+    visit, and the union of the daily sketches counts a visitor seen on several days once.
+
+    Attributes:
+        - `date (date)`: The date of the visits.
+        - `registers (bytes)`: The compressed sketch, see `core.hyperloglog.HyperLogLog`.
+    """
+
+    date = models.DateField(
+        verbose_name=_('Date'),
+        unique=True,
+        db_column='date',
+    )
+    registers = models.BinaryField(
+        verbose_name=_('Registers'),
+        null=True,
+        blank=True,
+        db_column='registers',
+    )
+
+    def __str__(self):
+        return str(self.date)
+
+    class Meta:
+        verbose_name = "Visitor Sketch"
+        verbose_name_plural = "Visitor Sketches"
+        db_table = "VisitorSketch"
+        ordering = ['date']
+
+    @classmethod
+    def add_visitors(cls, day, ip_addresses):
+        """
+        Add `ip_addresses` to the sketch of `day`. The row is locked while it is merged, so concurrent flushes of
+        several processes don't overwrite each other.
+        """
+        with transaction.atomic():
+            cls.objects.get_or_create(date=day)
+            visitor_sketch = cls.objects.select_for_update().get(date=day)
+            sketch = HyperLogLog.from_bytes(visitor_sketch.registers)
+            for ip_address in ip_addresses:
+                sketch.add(ip_address)
+            visitor_sketch.registers = sketch.to_bytes()
+            visitor_sketch.save(update_fields=['registers'])
+
+    @classmethod
+    def count_visitors(cls, start_date, end_date):
+        """
+        Return the estimated number of unique visitors between `start_date` and `end_date`, both included.
+        """
+        sketch = HyperLogLog()
+        for registers in cls.objects.filter(date__gte=start_date, date__lte=end_date).values_list(
+                'registers', flat=True
+        ):
+            sketch.update(HyperLogLog.from_bytes(registers))
+        return sketch.count()
+
+
+# Buffers the visits of `users.views.VisitorLogView` and `VisitorsView`, keyed by `(ip address, date, user agent)`.
+visitor_log_buffer = CounterBuffer(VisitorLog.log_visits)
+
+
+class CandidateSearchDocument(BaseModel, TimeStampedModel, models.Model):
+    """
+    The searchable attributes of a job seeker or vendor, denormalized from the profile tables for
+    `users.views.SearchView`.
+
+    Documents are refreshed in the background by `search_document_queue` when the user, the profile, the job
+    preferences, the categories, skills, tags, sectors or organization types of a candidate change. The
+    `rebuild_search_documents` management command creates the missing documents every hour and fully rebuilds them
+    every night, which catches up with the changes the in-memory queue lost on a restart. The array columns and `search_vector` have GIN
+    indexes, so the filters of a talent search are answered from this table alone.
+
+    Columns:
+    - `user`: the job seeker or vendor
+    - `role`: the role of the user
+    - `is_visible`: whether the candidate is listed, active and, for a job seeker, displayed in search
+    - `country`, `city`: the titles of the location of the profile
+    - `experience`: the years of experience of a job seeker
+    - `operating_years`: the years in market of a vendor
+    - `is_available`, `expected_salary`, `is_full_time`, `is_part_time`, `has_contract`: the job preferences
+    - `categories`, `job_categories`: the titles of the job sub categories of a job seeker and of their categories
+    - `tags`, `sectors`, `organization_types`: the titles of the tags, sectors and organization types of a vendor
+    - `search_text`: the words matched by the search box, see `get_search_query`
+    - `search_vector`: the `simple` text search vector of `search_text`
+    """
+    ROLES = ('job_seeker', 'vendor')
+
+    user = models.OneToOneField(
+        User,
+        verbose_name=_('User'),
+        on_delete=models.CASCADE,
+        db_column="user",
+        related_name='%(app_label)s_%(class)s_user'
+    )
+    role = models.CharField(
+        verbose_name=_('Role'),
+        max_length=255,
+        db_column="role",
+    )
+    is_visible = models.BooleanField(
+        verbose_name=_('Is Visible'),
+        default=False,
+        db_column="is_visible",
+    )
+    country = models.CharField(
+        verbose_name=_('Country'),
+        max_length=255,
+        null=True,
+        blank=True,
+        db_column="country",
+    )
+    city = models.CharField(
+        verbose_name=_('City'),
+        max_length=255,
+        null=True,
+        blank=True,
+        db_column="city",
+    )
+    experience = models.BigIntegerField(
+        verbose_name=_('Experience'),
+        null=True,
+        blank=True,
+        db_column="experience",
+    )
+    operating_years = models.BigIntegerField(
+        verbose_name=_('Operating Years'),
+        null=True,
+        blank=True,
+        db_column="operating_years",
+    )
+    is_available = models.BooleanField(
+        verbose_name=_('Is Available'),
+        null=True,
+        blank=True,
+        db_column="is_available",
+    )
+    expected_salary = models.DecimalField(
+        verbose_name=_('Expected Salary'),
+        max_digits=19,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        db_column="expected_salary",
+    )
+    is_full_time = models.BooleanField(
+        verbose_name=_('Is Full Time'),
+        default=False,
+        db_column="is_full_time",
+    )
+    is_part_time = models.BooleanField(
+        verbose_name=_('Is Part Time'),
+        default=False,
+        db_column="is_part_time",
+    )
+    has_contract = models.BooleanField(
+        verbose_name=_('Has Contract'),
+        default=False,
+        db_column="has_contract",
+    )
+    categories = ArrayField(
+        models.CharField(max_length=255),
+        verbose_name=_('Categories'),
+        default=list,
+        blank=True,
+        db_column="categories",
+    )
+    job_categories = ArrayField(
+        models.CharField(max_length=255),
+        verbose_name=_('Job Categories'),
+        default=list,
+        blank=True,
+        db_column="job_categories",
+    )
+    tags = ArrayField(
+        models.CharField(max_length=255),
+        verbose_name=_('Tags'),
+        default=list,
+        blank=True,
+        db_column="tags",
+    )
+    sectors = ArrayField(
+        models.CharField(max_length=255),
+        verbose_name=_('Sectors'),
+        default=list,
+        blank=True,
+        db_column="sectors",
+    )
+    organization_types = ArrayField(
+        models.CharField(max_length=255),
+        verbose_name=_('Organization Types'),
+        default=list,
+        blank=True,
+        db_column="organization_types",
+    )
+    search_text = models.TextField(
+        verbose_name=_('Search Text'),
+        blank=True,
+        default='',
+        db_column="search_text",
+    )
+    search_vector = SearchVectorField(
+        verbose_name=_('Search Vector'),
+        null=True,
+        blank=True,
+        db_column="search_vector",
+    )
+
+    def __str__(self):
+        return str(self.user)
+
+    class Meta:
+        verbose_name = "Candidate Search Document"
+        verbose_name_plural = "Candidate Search Documents"
+        db_table = "CandidateSearchDocument"
+        ordering = ['created']
+        indexes = [
+            models.Index(
+                fields=['role'], name='searchdocument_role_idx',
+                condition=models.Q(is_visible=True)
+            ),
+            GinIndex(fields=['categories'], name='searchdocument_categories_gin'),
+            GinIndex(fields=['job_categories'], name='searchdocument_job_cat_gin'),
+            GinIndex(fields=['tags'], name='searchdocument_tags_gin'),
+            GinIndex(fields=['sectors'], name='searchdocument_sectors_gin'),
+            GinIndex(fields=['organization_types'], name='searchdocument_org_types_gin'),
+            GinIndex(fields=['search_vector'], name='searchdocument_vector_gin'),
+        ]
+
+    @staticmethod
+    def get_search_query(search):
+        """
+        Return the prefix `SearchQuery` matching every word of `search`, or None when it holds no word. Only word
+        characters reach the raw query, so user input can't inject tsquery operators.
+        """
+        words = re.findall(r'\w+', search or '')
+        if not words:
+            return None
+        return SearchQuery(' & '.join(word + ':*' for word in words), search_type='raw', config='simple')
+
+    @classmethod
+    def refresh(cls, user_ids, alert=True):
+        """
+        Rebuild the documents of `user_ids` with one query per related table, one upsert and one update of the
+        search vectors. Documents of users that are no longer job seekers or vendors are deleted.
+
+        With `alert`, the owners of the saved talent filters the refreshed candidates newly match are notified, see
+        `user_profile.models.UserFilters.send_talent_alerts`.
+        """
+        # The profile tables belong to apps importing this module, so they are looked up in the app registry.
+        JobSeekerProfile = apps.get_model('user_profile', 'JobSeekerProfile')
+        VendorProfile = apps.get_model('user_profile', 'VendorProfile')
+        JobPreferences = apps.get_model('job_seekers', 'JobPreferences')
+        Categories = apps.get_model('job_seekers', 'Categories')
+        JobSeekerSkill = apps.get_model('job_seekers', 'JobSeekerSkill')
+        VendorTag = apps.get_model('vendors', 'VendorTag')
+        VendorSector = apps.get_model('vendors', 'VendorSector')
+
+        user_ids = list(user_ids)
+        users = list(User.objects.filter(id__in=user_ids, role__in=cls.ROLES))
+        cls.objects.filter(user__in=user_ids).exclude(user__in=[user.id for user in users]).delete()
+        if not users:
+            return
+        user_ids = [user.id for user in users]
+        profiles = {
+            profile.user_id: profile
+            for profile in JobSeekerProfile.objects.filter(user__in=user_ids).select_related('country', 'city')
+        }
+        vendor_profiles = {
+            profile.user_id: profile
+            for profile in VendorProfile.objects.filter(user__in=user_ids).select_related('country', 'city')
+        }
+        preferences = {
+            preference.user_id: preference for preference in JobPreferences.objects.filter(user__in=user_ids)
+        }
+        related = defaultdict(lambda: defaultdict(set))
+        for user_id, category, job_category in Categories.objects.filter(user__in=user_ids).values_list(
+                'user', 'category__title', 'category__category__title'
+        ):
+            related[user_id]['categories'].add(category)
+            related[user_id]['job_categories'].add(job_category)
+        for user_id, skill in JobSeekerSkill.objects.filter(user__in=user_ids).values_list('user', 'skill__title'):
+            related[user_id]['skills'].add(skill)
+        for user_id, tag in VendorTag.objects.filter(user__in=user_ids).values_list('user', 'tag__title'):
+            related[user_id]['tags'].add(tag)
+        for user_id, sector in VendorSector.objects.filter(
+                user__in=user_ids, sector__is_removed=False
+        ).values_list('user', 'sector__title'):
+            related[user_id]['sectors'].add(sector)
+        for user_id, organization_type in VendorProfile.organization_type.through.objects.filter(
+                vendorprofile__user__in=user_ids, vendorprofile__is_removed=False
+        ).values_list('vendorprofile__user', 'choice__title'):
+            related[user_id]['organization_types'].add(organization_type)
+
+        documents = []
+        for user in users:
+            values = related[user.id]
+            preference = preferences.get(user.id)
+            profile = profiles.get(user.id) if user.role == 'job_seeker' else vendor_profiles.get(user.id)
+            document = cls(
+                user=user,
+                role=user.role,
+                is_visible=bool(user.is_active) and (
+                    user.role != 'job_seeker' or bool(preference and preference.display_in_search)
+                ),
+                country=profile.country.title if profile and profile.country else None,
+                city=profile.city.title if profile and profile.city else None,
+                experience=profiles[user.id].experience if user.id in profiles else None,
+                operating_years=vendor_profiles[user.id].operating_years if user.id in vendor_profiles else None,
+                is_available=preference.is_available if preference else None,
+                expected_salary=preference.expected_salary if preference else None,
+                is_full_time=bool(preference and preference.is_full_time),
+                is_part_time=bool(preference and preference.is_part_time),
+                has_contract=bool(preference and preference.has_contract),
+                **{
+                    name: sorted(filter(None, values[name]))
+                    for name in ('categories', 'job_categories', 'tags', 'sectors', 'organization_types')
+                }
+            )
+            words = [user.name, user.email]
+            if user.id in profiles:
+                words.append(profiles[user.id].profile_title)
+            words += values['skills'] | values['categories'] | values['tags']
+            # Punctuation is dropped so an email or a title matches word by word, like the query does.
+            document.search_text = re.sub(r'\W+', ' ', ' '.join(filter(None, words))).strip()
+            documents.append(document)
+        fields = [
+            'role', 'is_visible', 'country', 'city', 'experience', 'operating_years', 'is_available',
+            'expected_salary', 'is_full_time', 'is_part_time', 'has_contract', 'categories', 'job_categories',
+            'tags', 'sectors', 'organization_types', 'search_text', 'modified'
+        ]
+        previous = {}
+        if alert:
+            previous = {document.user_id: document for document in cls.objects.filter(user__in=user_ids)}
+        with transaction.atomic():
+            cls.objects.bulk_create(documents, update_conflicts=True, unique_fields=['user'], update_fields=fields)
+            cls.objects.filter(user__in=user_ids).update(search_vector=SearchVector('search_text', config='simple'))
+        if alert:
+            apps.get_model('user_profile', 'UserFilters').send_talent_alerts(previous, documents)
+
+    @classmethod
+    def refresh_pending(cls, pending, batch_size=500):
+        """
+        Refresh the documents of the buffered `{user id: changes}` of `search_document_queue`, `batch_size` users
+        at a time.
+        """
+        user_ids = list(pending)
+        for start in range(0, len(user_ids), batch_size):
+            cls.refresh(user_ids[start:start + batch_size])
+
+
+# Buffers the candidates whose search document is out of date, keyed by user id, see `CandidateSearchDocument`.
+search_document_queue = CounterBuffer(CandidateSearchDocument.refresh_pending)
+
+
+def schedule_search_document(user_id):
+    transaction.on_commit(lambda: search_document_queue.add(user_id))
+
+
+@receiver(post_save, sender=User)
+def refresh_search_document_user(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Signal handler to refresh the search document of a candidate when the user is saved. Other roles are refreshed
+    as well, which deletes the document of a candidate whose role changed. Saves limited to fields the document
+    doesn't hold, such as `last_login`, are skipped.
+    """
+    if update_fields is not None and not {'name', 'email', 'role', 'is_active'} & set(update_fields):
+        return
+    schedule_search_document(instance.id)
+
+
+@receiver(post_save, sender='user_profile.JobSeekerProfile')
+@receiver(post_save, sender='user_profile.VendorProfile')
+@receiver(post_save, sender='job_seekers.JobPreferences')
+@receiver(post_save, sender='job_seekers.Categories')
+@receiver(post_delete, sender='job_seekers.Categories')
+@receiver(post_save, sender='job_seekers.JobSeekerSkill')
+@receiver(post_delete, sender='job_seekers.JobSeekerSkill')
+@receiver(post_save, sender='vendors.VendorTag')
+@receiver(post_delete, sender='vendors.VendorTag')
+@receiver(post_save, sender='vendors.VendorSector')
+@receiver(post_delete, sender='vendors.VendorSector')
+def refresh_search_document_related(sender, instance, **kwargs):
+    """
+    Signal handler to refresh the search document of a candidate when one of the rows it is built from changes.
+    """
+    schedule_search_document(instance.user_id)
+
+
+@receiver(m2m_changed, sender='user_profile.VendorProfile_organization_type')
+def refresh_search_document_organization_types(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Signal handler to refresh the search document of a vendor when the organization types of the profile change.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear') and not reverse:
+        schedule_search_document(instance.user_id)
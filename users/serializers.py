@@ -3,8 +3,7 @@ from rest_framework import serializers
 from job_seekers.models import (
     EducationRecord, EmploymentRecord, 
     Resume, JobSeekerLanguageProficiency, 
-    JobSeekerSkill, AppliedJob,
-    JobPreferences
+    JobSeekerSkill, JobPreferences
 )
 
 from jobs.models import JobSubCategory, JobCategory
@@ -21,12 +20,18 @@ from project_meta.serializers import (
     TagSerializer
 )
 
-from employers.models import BlackList
+from core.loaders import BatchLoadingListSerializer, BatchLoadingMixin
 
 from .backends import MobileOrEmailBackend as cb
+from .loaders import (
+    ApplicantBundle, load_applicant_bundles,
+    EDUCATION_RECORDS, EMPLOYMENT_RECORDS, JOB_APPLICANTS, JOB_PREFERENCES,
+    JOB_SEEKER_PROFILE, LANGUAGES, REFERENCES, RESUMES, SECTORS, SKILLS,
+    TAGS, TENDER_APPLICANTS, UNSEEN_NOTIFICATIONS, VENDOR_PROFILE
+)
 from .models import User
 from notification.models import Notification
-from vendors.models import VendorSector, VendorTag, AppliedTender
+from vendors.models import VendorSector, VendorTag
 
 
 class CreateUserSerializers(serializers.ModelSerializer):
@@ -178,7 +183,7 @@ class ReferenceSerializer(serializers.ModelSerializer):
         )
 
 
-class JobSeekerProfileSerializer(serializers.ModelSerializer):
+class JobSeekerProfileSerializer(BatchLoadingMixin, serializers.ModelSerializer):
     """
     JobSeekerProfileSerializer is a serializer class that serializes and deserializes the JobSeekerProfile model into
      JSON format.
@@ -195,6 +200,9 @@ class JobSeekerProfileSerializer(serializers.ModelSerializer):
     city = serializers.SerializerMethodField()
     is_verified = serializers.SerializerMethodField()
     references = serializers.SerializerMethodField()
+    batch_relations = (REFERENCES,)
+    batch_key = 'user_id'
+
     class Meta:
         model = JobSeekerProfile
         fields = (
@@ -211,12 +219,14 @@ class JobSeekerProfileSerializer(serializers.ModelSerializer):
             'experience',
             'is_verified',
             'short_summary', 'home_address', 'personal_website', 'references',
+            'is_complete', 'missing_fields',
         )
+        read_only_fields = ('is_complete', 'missing_fields')
     
     
     def get_references(self, obj):
         context = []
-        user_data = Reference.objects.filter(user=obj.user)
+        user_data = self.load(REFERENCES, obj)
         get_data = ReferenceSerializer(user_data, many=True)
         if get_data.data:
             context = get_data.data
@@ -452,7 +462,7 @@ class JobSeekerSkillSerializer(serializers.ModelSerializer):
         return context
 
 
-class JobSeekerDetailSerializers(serializers.ModelSerializer):
+class JobSeekerDetailSerializers(BatchLoadingMixin, serializers.ModelSerializer):
     """
     JobSeekerDetailSerializers
 
@@ -484,6 +494,8 @@ class JobSeekerDetailSerializers(serializers.ModelSerializer):
         - get_resume(self, obj): returns the resume of the job seeker
         - get_languages(self, obj): returns the languages spoken by the job seeker
         - get_skills(self, obj): returns the skills of the job seeker
+
+    The related rows are declared in `batch_relations`, so a page of job seekers costs one query per relation.
     """
 
     profile = serializers.SerializerMethodField()
@@ -497,6 +509,10 @@ class JobSeekerDetailSerializers(serializers.ModelSerializer):
     profile_completed = serializers.SerializerMethodField()
     ready_for_chat = serializers.SerializerMethodField()
     notification_count = serializers.SerializerMethodField()
+    batch_relations = (
+        JOB_SEEKER_PROFILE, REFERENCES, EDUCATION_RECORDS, EMPLOYMENT_RECORDS, JOB_PREFERENCES, RESUMES, LANGUAGES,
+        SKILLS, JOB_APPLICANTS, UNSEEN_NOTIFICATIONS
+    )
 
     class Meta:
         model = User
@@ -505,26 +521,17 @@ class JobSeekerDetailSerializers(serializers.ModelSerializer):
             'education_record', 'work_experience', 'resume', 'languages', 'skills', 'job_preferences',
             'is_online', 'profile_completed', 'ready_for_chat', 'notification_count'
         ]
+        list_serializer_class = BatchLoadingListSerializer
         
     
     def get_ready_for_chat(self, obj):
-    
-        ready_for_chat_record = False
-        if 'user' in self.context:
-            user = self.context['user']
-            if self.context['user'].is_authenticated:
-                ready_for_chat_record = AppliedJob.objects.filter(
-                    job__user=user,
-                    user=obj
-                ).exists()
-        return ready_for_chat_record
+        # Whether the job seeker applied to a job of the requesting user.
+        return self.load(JOB_APPLICANTS, obj)
 
     def get_profile_completed(self, obj):
-        context = False
-        if obj.name and obj.user_profile_jobseekerprofile_user.gender and obj.user_profile_jobseekerprofile_user.experience and obj.user_profile_jobseekerprofile_user.dob and obj.user_profile_jobseekerprofile_user.employment_status and obj.user_profile_jobseekerprofile_user.country and obj.user_profile_jobseekerprofile_user.city and obj.user_profile_jobseekerprofile_user.highest_education:
-            if JobSeekerSkill.objects.filter(user=obj).exists():
-                context = True
-        return context
+        # Stored by `JobSeekerProfile.save` and its signal handlers, the missing fields are part of `profile`.
+        user_data = self.load(JOB_SEEKER_PROFILE, obj)
+        return bool(user_data and user_data.is_complete)
     
     def get_image(self, obj):
         context = dict()
@@ -539,19 +546,16 @@ class JobSeekerDetailSerializers(serializers.ModelSerializer):
     
     def get_profile(self, obj):
         context = dict()
-        try:
-            user_data = JobSeekerProfile.objects.get(user=obj)
-            get_data = JobSeekerProfileSerializer(user_data)
+        user_data = self.load(JOB_SEEKER_PROFILE, obj)
+        if user_data:
+            get_data = JobSeekerProfileSerializer(user_data, context=self.context)
             if get_data.data:
                 context = get_data.data
-        except JobSeekerProfile.DoesNotExist:
-            pass
-        finally:
-            return context
+        return context
 
     def get_education_record(self, obj):
         context = []
-        education_data = EducationRecord.objects.filter(user=obj)
+        education_data = self.load(EDUCATION_RECORDS, obj)
         get_data = EducationRecordSerializer(education_data, many=True)
         if get_data.data:
             context = get_data.data
@@ -559,19 +563,16 @@ class JobSeekerDetailSerializers(serializers.ModelSerializer):
     
     def get_job_preferences(self, obj):
         context = []
-        try:
-            job_preferences_data = JobPreferences.objects.get(user=obj)
+        job_preferences_data = self.load(JOB_PREFERENCES, obj)
+        if job_preferences_data:
             get_data = JobPreferencesSerializer(job_preferences_data)
             if get_data.data:
                 context = get_data.data
-        except JobPreferences.DoesNotExist:
-            pass
-        finally:
-            return context
+        return context
 
     def get_work_experience(self, obj):
         context = []
-        employment_data = EmploymentRecord.objects.filter(user=obj)
+        employment_data = self.load(EMPLOYMENT_RECORDS, obj)
         get_data = EmploymentRecordSerializer(employment_data, many=True)
         if get_data.data:
             context = get_data.data
@@ -579,7 +580,7 @@ class JobSeekerDetailSerializers(serializers.ModelSerializer):
 
     def get_resume(self, obj):
         context = []
-        resume_data = Resume.objects.filter(user=obj)
+        resume_data = self.load(RESUMES, obj)
         get_data = ResumeSerializer(resume_data, many=True)
         if get_data.data:
             context = get_data.data
@@ -587,7 +588,7 @@ class JobSeekerDetailSerializers(serializers.ModelSerializer):
 
     def get_languages(self, obj):
         context = []
-        languages_data = JobSeekerLanguageProficiency.objects.filter(user=obj)
+        languages_data = self.load(LANGUAGES, obj)
         get_data = JobSeekerLanguageProficiencySerializer(languages_data, many=True)
         if get_data.data:
             context = get_data.data
@@ -595,7 +596,7 @@ class JobSeekerDetailSerializers(serializers.ModelSerializer):
 
     def get_skills(self, obj):
         context = []
-        skills_data = JobSeekerSkill.objects.filter(user=obj)
+        skills_data = self.load(SKILLS, obj)
         get_data = JobSeekerSkillSerializer(skills_data, many=True)
         if get_data.data:
             context = get_data.data
@@ -604,7 +605,7 @@ class JobSeekerDetailSerializers(serializers.ModelSerializer):
 
     def get_notification_count(self, obj):
 
-        return Notification.objects.filter(user=obj, seen=False).count()
+        return self.load(UNSEEN_NOTIFICATIONS, obj)
 
 
 class EmployerProfileSerializer(serializers.ModelSerializer):
@@ -1009,7 +1010,7 @@ class VendorProfileSerializer(serializers.ModelSerializer):
         return context
 
 
-class VendorDetailSerializers(serializers.ModelSerializer):
+class VendorDetailSerializers(BatchLoadingMixin, serializers.ModelSerializer):
     """
     Serializer class for Vendor Detail
 
@@ -1024,6 +1025,7 @@ class VendorDetailSerializers(serializers.ModelSerializer):
         get_profile(self, obj):
             Returns vendor profile data serialized into JSON format
 
+    The related rows are declared in `batch_relations`, so a page of vendors costs one query per relation.
     """
 
     profile = serializers.SerializerMethodField()
@@ -1033,6 +1035,7 @@ class VendorDetailSerializers(serializers.ModelSerializer):
     ready_for_chat = serializers.SerializerMethodField()
     profile_completed = serializers.SerializerMethodField()
     notification_count = serializers.SerializerMethodField()
+    batch_relations = (VENDOR_PROFILE, SECTORS, TAGS, TENDER_APPLICANTS, UNSEEN_NOTIFICATIONS)
 
     class Meta:
         model = User
@@ -1042,30 +1045,24 @@ class VendorDetailSerializers(serializers.ModelSerializer):
             'profile', 'sector', 'tag', 'is_online', 'ready_for_chat',
             'profile_completed', 'notification_count'
         ]
+        list_serializer_class = BatchLoadingListSerializer
         
     
     def get_notification_count(self, obj):
 
-        return Notification.objects.filter(user=obj, seen=False).count()
+        return self.load(UNSEEN_NOTIFICATIONS, obj)
 
     def get_profile_completed(self, obj):
         context = False
-        if VendorProfile.objects.filter(user=obj).exists():
-            if obj.name and obj.user_profile_vendorprofile_users.organization_type and obj.user_profile_vendorprofile_users.description and obj.user_profile_vendorprofile_users.website  and obj.user_profile_vendorprofile_users.address  and obj.user_profile_vendorprofile_users.license_id  and obj.user_profile_vendorprofile_users.license_id_file  and obj.user_profile_vendorprofile_users.country  and obj.user_profile_vendorprofile_users.city:
+        vendor_data = self.load(VENDOR_PROFILE, obj)
+        if vendor_data:
+            if obj.name and vendor_data.organization_type and vendor_data.description and vendor_data.website  and vendor_data.address  and vendor_data.license_id  and vendor_data.license_id_file  and vendor_data.country  and vendor_data.city:
                 context = True
         return context
     
     def get_ready_for_chat(self, obj):
-    
-        ready_for_chat_record = False
-        if 'user' in self.context:
-            user = self.context['user']
-            if self.context['user'].is_authenticated:
-                ready_for_chat_record = AppliedTender.objects.filter(
-                    tender__user=user,
-                    user=obj
-                ).exists()
-        return ready_for_chat_record
+        # Whether the vendor applied to a tender of the requesting user.
+        return self.load(TENDER_APPLICANTS, obj)
         
     def get_image(self, obj):
         context = dict()
@@ -1080,15 +1077,12 @@ class VendorDetailSerializers(serializers.ModelSerializer):
 
     def get_profile(self, obj):
         context = dict()
-        try:
-            user_data = VendorProfile.objects.get(user=obj)
+        user_data = self.load(VENDOR_PROFILE, obj)
+        if user_data:
             get_data = VendorProfileSerializer(user_data)
             if get_data.data:
                 context = get_data.data
-        except VendorProfile.DoesNotExist:
-            pass
-        finally:
-            return context
+        return context
 
     def get_sector(self, obj):
         """
@@ -1102,7 +1096,7 @@ class VendorDetailSerializers(serializers.ModelSerializer):
         """
         
         context = []
-        sector_data = VendorSector.objects.filter(user=obj)
+        sector_data = self.load(SECTORS, obj)
         get_data = VendorSectorSerializer(sector_data, many=True)
         if get_data.data:
             context = get_data.data
@@ -1120,7 +1114,7 @@ class VendorDetailSerializers(serializers.ModelSerializer):
         """
         
         context = []
-        tag_data = VendorTag.objects.filter(user=obj)
+        tag_data = self.load(TAGS, obj)
         get_data = VendorTagSerializer(tag_data, many=True)
         if get_data.data:
             context = get_data.data
@@ -1194,7 +1188,27 @@ class UpdateImageSerializers(serializers.ModelSerializer):
         return instance
 
 
-class UserSerializer(serializers.ModelSerializer):
+class ApplicantBundleMixin:
+    """
+    Serializer mixin reading the profile related rows of a user from an `ApplicantBundle`.
+
+    List views pass the bundles of the whole page as the `applicants` context (see `users.loaders`), so every
+    relation costs one query per page. Without them the bundle of each user is loaded on its first use, limited to
+    `bundle_relations`.
+    """
+    bundle_relations = ApplicantBundle.RELATIONS
+
+    def get_applicant_bundle(self, obj):
+        bundles = self.context.get('applicants') or {}
+        if obj.id in bundles:
+            return bundles[obj.id]
+        loaded = self.__dict__.setdefault('_applicant_bundles', {})
+        if obj.id not in loaded:
+            loaded.update(load_applicant_bundles([obj], self.bundle_relations))
+        return loaded[obj.id]
+
+
+class UserSerializer(ApplicantBundleMixin, serializers.ModelSerializer):
     """
     A serializer class for User model that includes `'id'`, `'name'`, `'email'`, `'country_code'`, `'mobile_number'`,
     and `'image'` fields.
@@ -1217,6 +1231,7 @@ class UserSerializer(serializers.ModelSerializer):
     country = serializers.SerializerMethodField()
     city = serializers.SerializerMethodField()
     skills = serializers.SerializerMethodField()
+    bundle_relations = ('profile', 'skills', 'blacklist')
 
     class Meta:
         model = User
@@ -1237,12 +1252,7 @@ class UserSerializer(serializers.ModelSerializer):
         )
     
     def get_skills(self, obj):
-        context = []
-        skills_data = JobSeekerSkill.objects.filter(user=obj)
-        get_data = JobSeekerSkillSerializer(skills_data, many=True)
-        if get_data.data:
-            context = get_data.data
-        return context
+        return JobSeekerSkillSerializer(self.get_applicant_bundle(obj).skills, many=True).data
 
     def get_image(self, obj):
         context = {}
@@ -1258,26 +1268,24 @@ class UserSerializer(serializers.ModelSerializer):
         return None
     
     def get_description(self, obj):
-        context = {}
         if obj.role == 'job_seeker':
-            if JobSeekerProfile.objects.filter(user=obj).exists():
-                jobseeker_data = JobSeekerProfile.objects.get(user=obj)
+            jobseeker_data = self.get_applicant_bundle(obj).profile
+            if jobseeker_data:
                 return jobseeker_data.description
         return None
     
     def get_profile_title(self, obj):
-        context = {}
         if obj.role == 'job_seeker':
-            if JobSeekerProfile.objects.filter(user=obj).exists():
-                jobseeker_data = JobSeekerProfile.objects.get(user=obj)
+            jobseeker_data = self.get_applicant_bundle(obj).profile
+            if jobseeker_data:
                 return jobseeker_data.profile_title
         return None
         
     def get_country(self, obj):
         context = {}
         if obj.role == 'job_seeker':
-            if JobSeekerProfile.objects.filter(user=obj).exists():
-                jobseeker_data = JobSeekerProfile.objects.get(user=obj)
+            jobseeker_data = self.get_applicant_bundle(obj).profile
+            if jobseeker_data:
                 if jobseeker_data.country:
                     get_data = CountrySerializer(jobseeker_data.country)
                     if get_data.data:
@@ -1288,8 +1296,8 @@ class UserSerializer(serializers.ModelSerializer):
     def get_city(self, obj):
         context = {}
         if obj.role == 'job_seeker':
-            if JobSeekerProfile.objects.filter(user=obj).exists():
-                jobseeker_data = JobSeekerProfile.objects.get(user=obj)
+            jobseeker_data = self.get_applicant_bundle(obj).profile
+            if jobseeker_data:
                 if jobseeker_data.city:
                     get_data = CitySerializer(jobseeker_data.city)
                     if get_data.data:
@@ -1298,13 +1306,9 @@ class UserSerializer(serializers.ModelSerializer):
         return None
         
     def get_is_blacklisted(self, obj):
-        is_blacklisted_record = False
-        is_blacklisted_record = BlackList.objects.filter(
-            blacklisted_user=obj
-        ).exists()
-        return is_blacklisted_record
+        return self.get_applicant_bundle(obj).is_blacklisted
 
-class ApplicantDetailSerializers(serializers.ModelSerializer):
+class ApplicantDetailSerializers(ApplicantBundleMixin, serializers.ModelSerializer):
     """
     ApplicantDetailSerializers
 
@@ -1356,15 +1360,7 @@ class ApplicantDetailSerializers(serializers.ModelSerializer):
             
     def get_references(self, obj):
         if obj.role == 'job_seeker':
-            try:
-                context = []
-                user_data = Reference.objects.filter(user=obj)
-                get_data = ReferenceSerializer(user_data, many=True)
-                if get_data.data:
-                    context = get_data.data
-                return context
-            except Reference.DoesNotExist:
-                pass
+            return ReferenceSerializer(self.get_applicant_bundle(obj).references, many=True).data
         return None        
     
     def get_image(self, obj):
@@ -1381,84 +1377,46 @@ class ApplicantDetailSerializers(serializers.ModelSerializer):
         return None
     
     def get_is_blacklisted(self, obj):
-        is_blacklisted_record = False
-        is_blacklisted_record = BlackList.objects.filter(
-            blacklisted_user=obj
-        ).exists()
-        return is_blacklisted_record
+        return self.get_applicant_bundle(obj).is_blacklisted
     
     def get_description(self, obj):
-        context = {}
         if obj.role == 'job_seeker':
-            try:
-                jobseeker_data = JobSeekerProfile.objects.get(user=obj)
+            jobseeker_data = self.get_applicant_bundle(obj).profile
+            if jobseeker_data:
                 return jobseeker_data.description
-            except JobSeekerProfile.DoesNotExist:
-                pass  
         return None
     
     def get_profile_title(self, obj):
-        context = {}
         if obj.role == 'job_seeker':
-            try:
-                jobseeker_data = JobSeekerProfile.objects.get(user=obj)
+            jobseeker_data = self.get_applicant_bundle(obj).profile
+            if jobseeker_data:
                 return jobseeker_data.profile_title
-            except JobSeekerProfile.DoesNotExist:
-                pass  
         return None
 
     def get_education_record(self, obj):
-        context = []
-        education_data = EducationRecord.objects.filter(user=obj)
-        get_data = EducationRecordSerializer(education_data, many=True)
-        if get_data.data:
-            context = get_data.data
-        return context
+        return EducationRecordSerializer(self.get_applicant_bundle(obj).education_records, many=True).data
 
     def get_work_experience(self, obj):
-        context = []
-        employment_data = EmploymentRecord.objects.filter(user=obj)
-        get_data = EmploymentRecordSerializer(employment_data, many=True)
-        if get_data.data:
-            context = get_data.data
-        return context
+        return EmploymentRecordSerializer(self.get_applicant_bundle(obj).employment_records, many=True).data
 
     def get_languages(self, obj):
-        context = []
-        languages_data = JobSeekerLanguageProficiency.objects.filter(user=obj)
-        get_data = JobSeekerLanguageProficiencySerializer(languages_data, many=True)
-        if get_data.data:
-            context = get_data.data
-        return context
+        return JobSeekerLanguageProficiencySerializer(self.get_applicant_bundle(obj).languages, many=True).data
 
     def get_skills(self, obj):
-        context = []
-        skills_data = JobSeekerSkill.objects.filter(user=obj)
-        get_data = JobSeekerSkillSerializer(skills_data, many=True)
-        if get_data.data:
-            context = get_data.data
-        return context
+        return JobSeekerSkillSerializer(self.get_applicant_bundle(obj).skills, many=True).data
     
     def get_country(self, obj):
-        context = {}
         if obj.role == 'job_seeker':
-            try:
-                jobseeker_data = JobSeekerProfile.objects.get(user=obj)
-                if jobseeker_data.country:
-                    return jobseeker_data.country.title
-            except JobSeekerProfile.DoesNotExist:
-                pass 
+            jobseeker_data = self.get_applicant_bundle(obj).profile
+            if jobseeker_data and jobseeker_data.country:
+                return jobseeker_data.country.title
         return None
     
     def get_city(self, obj):
-        context = {}
         if obj.role == 'job_seeker':
-            try:
-                jobseeker_data = JobSeekerProfile.objects.get(user=obj)
-                if jobseeker_data.city:
-                    return jobseeker_data.city.title
-            except JobSeekerProfile.DoesNotExist:
-                pass 
+            jobseeker_data = self.get_applicant_bundle(obj).profile
+            if jobseeker_data and jobseeker_data.city:
+                return jobseeker_data.city.title
         return None
 
 
@@ -1,3 +1,54 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import CandidateSearchDocument, User
+
+
+class RebuildSearchDocumentsTests(TestCase):
+    """
+    Tests of the `rebuild_search_documents` command filling `CandidateSearchDocument`.
+    """
+
+    def setUp(self):
+        self.seeker = User.objects.create(email='seeker@example.com', name='Seeker', role='job_seeker')
+        self.vendor = User.objects.create(email='vendor@example.com', name='Vendor', role='vendor')
+        User.objects.create(email='employer@example.com', name='Employer', role='employer')
+
+    def test_missing_documents_are_created(self):
+        call_command('rebuild_search_documents', missing=True, stdout=StringIO())
+        self.assertEqual(
+            set(CandidateSearchDocument.objects.values_list('user', flat=True)), {self.seeker.id, self.vendor.id}
+        )
+
+    def test_missing_skips_existing_documents(self):
+        call_command('rebuild_search_documents', missing=True, stdout=StringIO())
+        User.objects.filter(id=self.seeker.id).update(name='Renamed')
+        call_command('rebuild_search_documents', missing=True, stdout=StringIO())
+        self.assertNotIn('Renamed', CandidateSearchDocument.objects.get(user=self.seeker).search_text)
+        call_command('rebuild_search_documents', stdout=StringIO())
+        self.assertIn('Renamed', CandidateSearchDocument.objects.get(user=self.seeker).search_text)
+
+
+class SearchViewTests(TestCase):
+    """
+    Tests of the search box of the talent search, matched against the search documents.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(
+            email='john@example.com', name='John Doe', role='vendor', is_active=True
+        )
+        call_command('rebuild_search_documents', stdout=StringIO())
+
+    def search(self, text):
+        response = APIClient().get('/api/v1/users/search/vendor', {'search': text})
+        self.assertEqual(response.status_code, 200)
+        return [result['id'] for result in response.data['results']]
 
-# Create your tests here.
+    def test_search_matches_word_prefixes(self):
+        self.assertEqual(self.search('jo do'), [str(self.user.id)])
+        self.assertEqual(self.search('john@example.com'), [str(self.user.id)])
+        self.assertEqual(self.search('ohn'), [])
@@ -12,7 +12,7 @@ from django.db.models import Sum
 
 from rest_framework import (
     status, generics, serializers,
-    response, permissions, filters
+    response, permissions
 )
 
 from random import randint
@@ -31,19 +31,19 @@ from core.pagination import CustomPagination
 
 from user_profile.models import (
     JobSeekerProfile, EmployerProfile,
-    VendorProfile, UserFilters, UserAnalytic
+    VendorProfile, UserFilters, UserAnalytic,
+    user_analytic_counter
 )
 
-from jobs.models import JobSubCategory
 
 from notification.models import Notification
 
 from superadmin.models import GooglePlaceApi
 
 from .models import (
-    UserSession, User, VisitorLog
+    UserSession, User, CandidateSearchDocument, visitor_log_buffer
 )
-from .filters import UsersFilter
+from .filters import CandidateSearchDocumentFilter
 from .serializers import (
     CreateUserSerializers,
     CreateSessionSerializers,
@@ -818,9 +818,12 @@ class SearchView(generics.ListAPIView):
 
     - `Serializer class`: SearchUserSerializers
     - `Permission classes`: AllowAny
-    - `Queryset`: all User objects
-    - `Filter backends`: SearchFilter
-    - `Search fields`: 'title'
+    - `Queryset`: the visible `CandidateSearchDocument` objects
+    - `Filter backends`: DjangoFilterBackend
+    - `Search`: the `search_vector` of the documents, see `CandidateSearchDocument.get_search_query`. Every word
+      of `search` must start a word of the name, the email, the profile title, the skills, the categories or the
+      tags of the candidate. Unlike the former `icontains` search on name and email, a part from the middle of a
+      word (`ohn` for `john@example.com`) does not match, while a skill or a tag does.
 
     HTTP methods:
         - `GET`: returns a paginated list of candidates filtered by role and optionally searched by title.
@@ -832,24 +835,24 @@ class SearchView(generics.ListAPIView):
 
     serializer_class = SearchUserSerializers
     permission_classes = [permissions.AllowAny]
-    queryset = User.objects.filter(is_active=True)
-    filter_backends = [filters.SearchFilter, django_filters.DjangoFilterBackend]
-    filterset_class = UsersFilter
-    search_fields = [
-        'name', 'email'
-    ]
+    queryset = CandidateSearchDocument.objects.filter(is_visible=True)
+    filter_backends = [django_filters.DjangoFilterBackend]
+    filterset_class = CandidateSearchDocumentFilter
     pagination_class = CustomPagination
 
     def list(self, request, role):
         """
         Returns a paginated list of candidates filtered by role and optionally searched by title.
 
+        The filters are applied to the `CandidateSearchDocument` of the candidates, with the GIN indexes of its array
+        columns and search vector, so the candidates are selected without joining the profile tables.
+
         Parameters:
             - `role`: str, the role of the candidates to retrieve (e.g., 'developers', 'managers')
 
         Query parameters:
             - `limit`: int, the maximum number of results to return per page (default: 100)
-            - `search`: str, the keyword(s) to search in the 'title' field of the candidates
+            - `search`: str, the word prefixes to search in the `search_text` of the candidates
 
         Returns:
         A JSON response with the following keys:
@@ -862,10 +865,10 @@ class SearchView(generics.ListAPIView):
         emp_context = dict()
         if self.request.user:
             emp_context = {"user": self.request.user}
-        if role == 'job_seeker':
-            queryset = self.filter_queryset(self.get_queryset().filter(role=role).filter(job_seekers_jobpreferences_user__display_in_search=True))
-        else:
-            queryset = self.filter_queryset(self.get_queryset().filter(role=role))
+        documents = self.filter_queryset(self.get_queryset().filter(role=role))
+        search_query = CandidateSearchDocument.get_search_query(request.GET.get('search'))
+        if search_query:
+            documents = documents.filter(search_vector=search_query)
         job_category = request.GET.getlist('jobCategory')
         job_sub_category = request.GET.getlist('jobSubCategory')
         organization_type = request.GET.getlist('organizationType')
@@ -877,36 +880,32 @@ class SearchView(generics.ListAPIView):
         job_type = None
         if fullTime:
             if job_type:
-                job_type = job_type | Q(job_seekers_jobpreferences_user__is_full_time=True)
+                job_type = job_type | Q(is_full_time=True)
             else:
-                job_type = Q(job_seekers_jobpreferences_user__is_full_time=True)
+                job_type = Q(is_full_time=True)
         if partTime:
             if job_type:
-                job_type = job_type | Q(job_seekers_jobpreferences_user__is_part_time=True)
+                job_type = job_type | Q(is_part_time=True)
             else:
-                job_type = Q(job_seekers_jobpreferences_user__is_part_time=True)
+                job_type = Q(is_part_time=True)
         if contract:
             if job_type:
-                job_type = job_type | Q(job_seekers_jobpreferences_user__has_contract=True)
+                job_type = job_type | Q(has_contract=True)
             else:
-                job_type = Q(job_seekers_jobpreferences_user__has_contract=True)
+                job_type = Q(has_contract=True)
         if job_type:
-            queryset = queryset.filter(job_type)
+            documents = documents.filter(job_type)
         if tag:
-            queryset = queryset.filter(vendors_vendortag_user__tag__title__in=tag, vendors_vendortag_user__is_removed=False).distinct()
+            documents = documents.filter(tags__overlap=tag)
         if sector:
-            queryset = queryset.filter(vendors_vendorsector_user__sector__title__in=sector, vendors_vendorsector_user__sector__is_removed=False).distinct()
+            documents = documents.filter(sectors__overlap=sector)
         if organization_type:
-            queryset = queryset.filter(user_profile_vendorprofile_users__organization_type__title__in=organization_type, user_profile_vendorprofile_users__is_removed=False).distinct()
+            documents = documents.filter(organization_types__overlap=organization_type)
         if job_sub_category:
-            queryset = queryset.filter(job_seekers_categories_user__category__title__in=job_sub_category, job_seekers_categories_user__is_removed=False).distinct()
-        else:
-            if job_category:
-                job_sub_category_data = JobSubCategory.objects.filter(category_id__title__in=job_category)
-                job_sub_category = []
-                for sub_category in job_sub_category_data:
-                    job_sub_category.append(sub_category.title)
-                queryset = queryset.filter(job_seekers_categories_user__category__title__in=job_sub_category, job_seekers_categories_user__is_removed=False).distinct()
+            documents = documents.filter(categories__overlap=job_sub_category)
+        elif job_category:
+            documents = documents.filter(job_categories__overlap=job_category)
+        queryset = User.objects.filter(id__in=documents.values('user')).select_related('image').order_by('date_joined')
         page = self.paginate_queryset(queryset)
         if role == "job_seeker":
             get_serializer = JobSeekerDetailSerializers
@@ -1099,8 +1098,9 @@ class VisitorLogView(generics.GenericAPIView):
         """
         Log visitor information.
 
-        This method creates a new log entry with the IP address and user agent information of the visitor. If a log
-        entry with the same IP address and current date already exists, no new log entry is created.
+        This method buffers a log entry with the IP address and user agent information of the visitor, which is
+        written in the background. If a log entry with the same IP address and current date already exists, no new
+        log entry is created.
 
         Args:
             - `request (HttpRequest)`: The HTTP request object.
@@ -1114,16 +1114,8 @@ class VisitorLogView(generics.GenericAPIView):
             IPAddr = x_forwarded_for.split(',')[0]
         else:
             IPAddr = request.META.get('REMOTE_ADDR')
-        agent = {'User-Agent': request.headers.get('User-Agent')}
-        if VisitorLog.objects.filter(ip_address=IPAddr, created_at=date.today()).exists():
-            pass
-        else:
-            log_data = VisitorLog.objects.create(
-                ip_address=IPAddr,
-                agent=agent,
-                created_at=date.today()
-            )
-            log_data.save()
+        # Written by the visitor log buffer within `COUNTER_FLUSH_INTERVAL` seconds.
+        visitor_log_buffer.add((IPAddr, date.today(), request.headers.get('User-Agent', '')))
         return response.Response(
             status=status.HTTP_201_CREATED
         )
@@ -1159,16 +1151,11 @@ class AnalyticView(generics.GenericAPIView):
                 )
                 
             # Get the user instance
-            user_instance = User.objects.get(id=request.data['user_id'])
+            user_instance = User.objects.only('id').get(id=request.data['user_id'])
             
-            # Check if UserAnalytic record exists for the user and today's date
-            if UserAnalytic.objects.filter(user=user_instance, date=date.today()).exists():
-                # Update the count if record exists
-                analytic_instance = UserAnalytic.objects.get(user=user_instance, date=date.today())
-                UserAnalytic.objects.filter(user=user_instance, date=date.today()).update(count=int(analytic_instance.count) + 1)
-            else:
-                # Create a new UserAnalytic record if it doesn't exist
-                UserAnalytic.objects.create(user=user_instance, date=date.today(), count=1)
+            # Count the hit, the counter buffer adds it to today's UserAnalytic record within
+            # `COUNTER_FLUSH_INTERVAL` seconds.
+            user_analytic_counter.add((user_instance.id, date.today()))
                 
             return response.Response(
                 data={"message": "Count updated successfully."},
@@ -1242,14 +1229,7 @@ class VisitorsView(generics.GenericAPIView):
     def post(self, request):
         context = dict()
         IPAddr = request.data['ip']
-        if VisitorLog.objects.filter(ip_address=IPAddr, created_at=date.today()).exists():
-            pass
-        else:
-            log_data = VisitorLog.objects.create(
-                ip_address=IPAddr,
-                created_at=date.today()
-            )
-            log_data.save()
+        visitor_log_buffer.add((IPAddr, date.today(), None))
         return response.Response(
             status=status.HTTP_201_CREATED
         )
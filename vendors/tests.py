@@ -1,3 +1,39 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from project_meta.models import Choice, Tag
+from users.models import CandidateSearchDocument, User, search_document_queue
+
+from .models import VendorSector, VendorTag
+
+
+class VendorSearchDocumentTests(TestCase):
+    """
+    Tests of the vendor sector and tag endpoints, whose removals are a queryset `delete()` sending no signals.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(email='vendor@example.com', name='Vendor', role='vendor', is_active=True)
+        self.sector = VendorSector.objects.create(user=self.user, sector=Choice.objects.create(title='Energy'))
+        self.tag = VendorTag.objects.create(user=self.user, tag=Tag.objects.create(title='Solar'))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        search_document_queue.add(self.user.id)
+        search_document_queue.flush()
+
+    def post(self, path, data):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(path, data, format='json')
+        self.assertEqual(response.status_code, 201)
+        search_document_queue.flush()
+        return CandidateSearchDocument.objects.get(user=self.user)
+
+    def test_removed_sector_leaves_search_document(self):
+        self.assertEqual(CandidateSearchDocument.objects.get(user=self.user).sectors, ['Energy'])
+        document = self.post('/api/v1/users/vendor/sector', {'sector_remove': [str(self.sector.id)], 'sector_add': []})
+        self.assertEqual(document.sectors, [])
+
+    def test_removed_tag_leaves_search_document(self):
+        self.assertEqual(CandidateSearchDocument.objects.get(user=self.user).tags, ['Solar'])
+        document = self.post('/api/v1/users/vendor/tag', {'tag_remove': [str(self.tag.id)], 'tag_add': []})
+        self.assertEqual(document.tags, [])
@@ -9,7 +9,7 @@ from rest_framework import (
 from core.pagination import CustomPagination
 
 from user_profile.models import VendorProfile
-from users.models import User
+from users.models import User, schedule_search_document
 from tenders.models import TenderDetails
 
 from .models import (
@@ -636,6 +636,10 @@ class SectorView(generics.GenericAPIView):
                             pass
                     except VendorSector.DoesNotExist:
                         VendorSector.objects.create(sector_id=data, user=request.user)
+                if request.data.get('sector_remove'):
+                    # The sectors are removed with a queryset `delete()`, an UPDATE of the soft deleted rows that
+                    # sends no signals, see `refresh_search_document_related`.
+                    schedule_search_document(request.user.id)
                 context["message"] = "Sector added."
                 return response.Response(
                     data=context,
@@ -709,6 +713,10 @@ class TagView(generics.GenericAPIView):
                             pass
                     except VendorTag.DoesNotExist:
                         VendorTag.objects.create(tag_id=data, user=request.user)
+                if request.data.get('tag_remove'):
+                    # The tags are removed with a queryset `delete()`, an UPDATE of the soft deleted rows that
+                    # sends no signals, see `refresh_search_document_related`.
+                    schedule_search_document(request.user.id)
                 context["message"] = "Tag added."
                 return response.Response(
                     data=context,